@@ -6,16 +6,269 @@ GANG CLI - Single binary for all build operations
 
 import click
 import yaml
+import functools
 import os
+import re
+import sys
 import hashlib
+import operator
 import json
 import shutil
-import markdown
 import time
 import threading
+from concurrent.futures import ThreadPoolExecutor, ProcessPoolExecutor, as_completed
 from pathlib import Path
 from typing import Dict, List, Optional
-from datetime import datetime
+from datetime import datetime, timezone
+
+# Make the bundled core package importable when run as a script (done once)
+_CLI_DIR = str(Path(__file__).parent)
+if _CLI_DIR not in sys.path:
+    sys.path.insert(0, _CLI_DIR)
+
+# Lightweight core modules shared by many commands. Modules that pull in
+# heavy third-party packages (PIL, bs4, anthropic) stay imported inside the
+# commands that use them.
+from core.r2_storage import R2Storage
+from core.redirects import RedirectManager
+from core.scheduler import ContentScheduler
+from core.versioning import ContentVersioning
+from core.image_pipeline import ImagePipeline, FocalPointDetector
+from core.email_templates import EmailOrchestrator, ESPIntegration, DeliverabilityChecker
+from core.klaviyo_integration import KlaviyoOrchestrator, KlaviyoClient
+from core.products import ProductAggregator
+from core.search import SearchIndexer
+from core.agentmap import AgentMapGenerator, ContentAPIGenerator
+
+# orjson is optional; the stdlib json module is the fallback
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# libyaml's loader when PyYAML was built with it, else the pure-Python one
+try:
+    from yaml import CSafeLoader as _YamlLoader
+except ImportError:
+    from yaml import SafeLoader as _YamlLoader
+
+# Horizontal rule used to frame previews
+_HR = "─" * 60
+
+# Closing instructions for import-content and rename-slug
+_NEXT_STEPS_IMPORT = (
+    "\n💡 Next steps:\n"
+    "   1. Review and edit: vim {file_path}\n"
+    "   2. Analyze quality: gang analyze {file_path}\n"
+    "   3. Change status to 'published' when ready\n"
+    "   4. Build: gang build"
+)
+_NEXT_STEPS_RENAME = (
+    "\n💡 Next steps:\n"
+    "   1. gang build  # Rebuild with new slug\n"
+    "   2. Check redirects: cat .redirects.json\n"
+    "   3. Deploy (redirects go live)"
+)
+
+# Shared option types, built once at import
+_CATEGORY_CHOICE = click.Choice(('posts', 'pages', 'projects'))
+_REDIRECT_FORMATS = click.Choice(('text', 'json', 'cloudflare', 'nginx', 'netlify'))
+_ESP_CHOICE = click.Choice(tuple(ESPIntegration.PROVIDERS))
+
+
+def _json_default(obj):
+    """Dates from frontmatter serialize as ISO strings, as orjson does natively"""
+    if hasattr(obj, 'isoformat'):
+        return obj.isoformat()
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+def _json_bytes(obj, indent: bool = False) -> bytes:
+    """Serialize to UTF-8 JSON bytes, using orjson when it is installed"""
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2 if indent else 0)
+    return json.dumps(obj, indent=2 if indent else None, ensure_ascii=False,
+                      default=_json_default).encode('utf-8')
+
+def _write_json(path: Path, obj, indent: bool = True):
+    """Write obj as JSON bytes straight to path (no intermediate str)"""
+    path.write_bytes(_json_bytes(obj, indent=indent))
+
+def _write_json_stream(path: Path, obj: Dict, stream_key: str):
+    """Write obj as compact JSON, encoding the obj[stream_key] list item by item
+    
+    Only one item's encoded bytes exist at a time instead of the whole
+    document; the large buffer coalesces the many small writes.
+    """
+    with open(path, 'wb', buffering=1 << 20) as f:
+        f.write(b'{')
+        for i, (key, value) in enumerate(obj.items()):
+            if i:
+                f.write(b',')
+            f.write(_json_bytes(key) + b':')
+            if key != stream_key:
+                f.write(_json_bytes(value))
+                continue
+            f.write(b'[')
+            for j, item in enumerate(value):
+                if j:
+                    f.write(b',')
+                f.write(_json_bytes(item))
+            f.write(b']')
+        f.write(b'}')
+
+def _json_loads(data):
+    """Parse JSON from bytes or str, using orjson when it is installed"""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+def _fast_read_text(path) -> str:
+    """Read a whole UTF-8 file with one fstat and a size-hinted read"""
+    fd = os.open(path, os.O_RDONLY | getattr(os, 'O_CLOEXEC', 0))
+    try:
+        size = os.fstat(fd).st_size
+        data = os.read(fd, size + 1)
+        if len(data) > size:
+            # File grew after fstat; read the remainder
+            data += b''.join(iter(lambda: os.read(fd, 65536), b''))
+    finally:
+        os.close(fd)
+    
+    text = data.decode('utf-8')
+    if '\r' in text:
+        # Match read_text()'s universal newline handling
+        text = text.replace('\r\n', '\n').replace('\r', '\n')
+    return text
+
+
+_WRITE_FLAGS = os.O_WRONLY | os.O_CREAT | os.O_TRUNC | getattr(os, 'O_CLOEXEC', 0) | getattr(os, 'O_BINARY', 0)
+
+
+def _write(path: Path, data) -> None:
+    """Write str (as UTF-8) or bytes to path with os.write on a raw descriptor
+    
+    This skips both the TextIOWrapper that write_text() goes through and the
+    buffered file object behind write_bytes(); the payload is handed to the
+    kernel as is, normally in a single write call.
+    """
+    view = memoryview(data if isinstance(data, bytes) else data.encode('utf-8'))
+    fd = os.open(path, _WRITE_FLAGS, 0o666)
+    try:
+        while view:
+            view = view[os.write(fd, view):]
+    finally:
+        os.close(fd)
+
+
+def _display_title(frontmatter: Dict, slug: str) -> str:
+    """Frontmatter title, else the slug as words; the fallback is only built when needed"""
+    if 'title' in frontmatter:
+        return frontmatter['title']
+    return slug.replace('-', ' ').title()
+
+
+def _scan_files(root, match, recursive: bool = False) -> List[Path]:
+    """Files in root whose name satisfies match, via os.scandir, in the same
+    order glob/rglob yield them; DirEntry type checks avoid a stat per entry
+    """
+    found = []
+    subdirs = []
+    try:
+        with os.scandir(root) as entries:
+            for entry in entries:
+                if match(entry.name) and entry.is_file():
+                    found.append(Path(entry.path))
+                elif recursive and entry.is_dir() and not entry.is_symlink():
+                    subdirs.append(entry.path)
+    except (FileNotFoundError, NotADirectoryError):
+        return found
+    for subdir in subdirs:
+        found.extend(_scan_files(subdir, match, recursive=True))
+    return found
+
+
+def _list_md(root, recursive: bool = False) -> List[Path]:
+    """Markdown files in root, in the same order glob/rglob yield them"""
+    return _scan_files(root, lambda name: name.endswith('.md'), recursive)
+
+
+def _dir_signature(root) -> tuple:
+    """(path, st_mtime_ns) for root and every directory below it
+    
+    A directory's mtime moves whenever an entry is added, removed or renamed
+    in it, so an unchanged signature means an unchanged file listing.
+    """
+    signature = []
+    pending = [os.fspath(root)]
+    while pending:
+        path = pending.pop()
+        try:
+            signature.append((path, os.stat(path).st_mtime_ns))
+            with os.scandir(path) as entries:
+                pending.extend(e.path for e in entries if e.is_dir() and not e.is_symlink())
+        except (FileNotFoundError, NotADirectoryError):
+            continue
+    return tuple(signature)
+
+@functools.lru_cache(maxsize=8)
+def _cached_publishable(content_path: Path, file_stats: tuple) -> Dict:
+    return ContentScheduler(content_path).get_publishable_content([p for p, _ in file_stats])
+
+
+def _publishable_content(content_path: Path, md_files) -> Dict:
+    """ContentScheduler.get_publishable_content, memoized on the files' mtimes
+    
+    The result is shared between callers and must not be mutated.
+    """
+    file_stats = tuple((p, p.stat().st_mtime_ns) for p in md_files)
+    return _cached_publishable(content_path, file_stats)
+
+# Bytecode for the plain Jinja environments below; kept apart from the
+# TemplateEngine cache because these compile with different options
+_JINJA_BYTECODE_DIR = Path('.gang/cache/jinja-pages')
+
+# Templates that ship with GANG rather than with the site: the product pages,
+# cart, sitemap and the create_index_simple/create_list_page_simple shells
+_BUNDLED_TEMPLATES_DIR = str(Path(__file__).parent.parent.parent / 'templates')
+
+# Output of `gang precompile`: the bundled templates as Python modules
+_PRECOMPILED_TEMPLATES = Path('.gang/cache/templates.zip')
+
+
+def _precompiled_templates_fresh() -> bool:
+    """True when the precompiled archive is newer than every bundled template"""
+    try:
+        built = _PRECOMPILED_TEMPLATES.stat().st_mtime_ns
+    except FileNotFoundError:
+        return False
+    for root, _, files in os.walk(_BUNDLED_TEMPLATES_DIR):
+        for name in files:
+            if os.stat(os.path.join(root, name)).st_mtime_ns > built:
+                return False
+    return True
+
+
+@functools.lru_cache(maxsize=None)
+def _jinja_env(template_dir: str, precompiled: bool = True, auto_reload: bool = False):
+    """Shared Jinja environment for template_dir; templates compile once per process
+    
+    For the bundled templates, an up-to-date `gang precompile` archive is
+    loaded first so nothing needs compiling at all. The dev server passes
+    auto_reload=True so edited templates are recompiled on their next use.
+    """
+    from jinja2 import Environment, FileSystemLoader, FileSystemBytecodeCache, ChoiceLoader, ModuleLoader
+    
+    loader = FileSystemLoader(template_dir)
+    if precompiled and template_dir == _BUNDLED_TEMPLATES_DIR and _precompiled_templates_fresh():
+        loader = ChoiceLoader([ModuleLoader(str(_PRECOMPILED_TEMPLATES)), loader])
+    
+    _JINJA_BYTECODE_DIR.mkdir(parents=True, exist_ok=True)
+    return Environment(
+        loader=loader,
+        auto_reload=auto_reload,
+        cache_size=-1,
+        bytecode_cache=FileSystemBytecodeCache(str(_JINJA_BYTECODE_DIR))
+    )
 
 @click.group()
 @click.pass_context
@@ -32,7 +285,7 @@ def cli(ctx):
                     if line and not line.startswith('#') and '=' in line:
                         key, value = line.split('=', 1)
                         os.environ[key.strip()] = value.strip()
-        except:
+        except (OSError, ValueError):
             pass  # Continue if .env parsing fails
     
     config_path = Path('gang.config.yml')
@@ -42,6 +295,12 @@ def cli(ctx):
     
     with open(config_path) as f:
         ctx.obj = yaml.safe_load(f)
+    
+    # Build the content/output paths once; commands read them from ctx.obj
+    build_config = ctx.obj.get('build')
+    if build_config:
+        ctx.obj['_content_path'] = Path(build_config['content'])
+        ctx.obj['_dist_path'] = Path(build_config['output'])
 
 @cli.command()
 @click.option('--answerability', is_flag=True, help='Generate answerability report')
@@ -51,15 +310,10 @@ def report(ctx, answerability, format):
     """Generate reports on content quality and structure"""
     
     if answerability:
-        try:
-            from core.answerability import AnswerabilityAnalyzer
-        except ImportError:
-            import sys
-            sys.path.insert(0, str(Path(__file__).parent))
-            from core.answerability import AnswerabilityAnalyzer
+        from core.answerability import AnswerabilityAnalyzer
         
         config = ctx.obj
-        dist_path = Path(config['build']['output'])
+        dist_path = config['_dist_path']
         reports_dir = Path('reports')
         reports_dir.mkdir(exist_ok=True)
         
@@ -96,15 +350,10 @@ def report(ctx, answerability, format):
 @click.pass_context
 def check(ctx, verbose):
     """Validate site against contracts and standards"""
-    try:
-        from core.contract_validator import ContractValidator
-    except ImportError:
-        import sys
-        sys.path.insert(0, str(Path(__file__).parent))
-        from core.contract_validator import ContractValidator
+    from core.contract_validator import ContractValidator
     
     config = ctx.obj
-    dist_path = Path(config['build']['output'])
+    dist_path = config['_dist_path']
     contracts_dir = Path('contracts')
     
     if not contracts_dir.exists():
@@ -156,12 +405,8 @@ def check(ctx, verbose):
 @click.pass_context
 def optimize(ctx, force):
     """Fill missing SEO/alt/JSON-LD fields using AI"""
-    try:
-        from core.optimizer import AIOptimizer
-    except ImportError:
-        import sys
-        sys.path.insert(0, str(Path(__file__).parent))
-        from core.optimizer import AIOptimizer
+    from core.optimizer import AIOptimizer
+    from core.analyzer import read_markdown
     
     click.echo("🤖 Running AI optimization...")
     config = ctx.obj
@@ -172,7 +417,7 @@ def optimize(ctx, force):
         click.echo("Set ANTHROPIC_API_KEY to enable AI optimization")
         return
     
-    content_path = Path(config['build']['content'])
+    content_path = config['_content_path']
     md_files = list(content_path.rglob('*.md'))
     
     click.echo(f"Found {len(md_files)} content files")
@@ -183,16 +428,9 @@ def optimize(ctx, force):
     
     optimized_count = 0
     for md_file in md_files:
-        content = md_file.read_text()
-        
         # Parse frontmatter
-        if content.startswith('---'):
-            parts = content.split('---', 2)
-            frontmatter = yaml.safe_load(parts[1]) if len(parts) > 1 else {}
-            body = parts[2] if len(parts) > 2 else ''
-        else:
-            frontmatter = {}
-            body = content
+        frontmatter_text, body = read_markdown(md_file)
+        frontmatter = yaml.safe_load(frontmatter_text) if frontmatter_text is not None else {}
         
         content_type = md_file.parent.name
         
@@ -216,19 +454,14 @@ def optimize(ctx, force):
 @click.pass_context
 def analyze(ctx, file_path, analyze_all, format, min_score):
     """Analyze content quality (readability, SEO, accessibility)"""
-    try:
-        from core.analyzer import ContentAnalyzer
-    except ImportError:
-        import sys
-        sys.path.insert(0, str(Path(__file__).parent))
-        from core.analyzer import ContentAnalyzer
+    from core.analyzer import ContentAnalyzer
     
     config = ctx.obj
     analyzer = ContentAnalyzer(config)
     
     # Batch analysis mode
     if analyze_all:
-        content_path = Path(config['build']['content'])
+        content_path = config['_content_path']
         md_files = list(content_path.rglob('*.md'))
         
         if not md_files:
@@ -354,16 +587,11 @@ def validate(ctx, links, internal_only, suggest_fixes, format):
         click.echo("  gang validate --links --suggest-fixes")
         return
     
-    try:
-        from core.link_validator import LinkValidator
-    except ImportError:
-        import sys
-        sys.path.insert(0, str(Path(__file__).parent))
-        from core.link_validator import LinkValidator
+    from core.link_validator import LinkValidator
     
     config = ctx.obj
-    content_path = Path(config['build']['content'])
-    dist_path = Path(config['build']['output'])
+    content_path = config['_content_path']
+    dist_path = config['_dist_path']
     
     if format != 'json':
         click.echo("🔗 Validating links...")
@@ -379,7 +607,6 @@ def validate(ctx, links, internal_only, suggest_fixes, format):
         results['redirects'] = []
     
     if format == 'json':
-        import json
         output_data = results
         
         # Add AI suggestions if requested
@@ -410,9 +637,10 @@ def validate(ctx, links, internal_only, suggest_fixes, format):
                 click.echo(suggestions_report)
     
     # Exit with error if broken links found
-    if results['broken_internal'] or results['broken_external']:
+    broken_count = len(results['broken_internal']) + len(results['broken_external'])
+    if broken_count:
         if format != 'json':
-            click.echo(f"\n❌ Validation failed with {len(results['broken_internal']) + len(results['broken_external'])} broken links")
+            click.echo(f"\n❌ Validation failed with {broken_count} broken links")
         ctx.exit(1)
 
 @cli.command()
@@ -420,12 +648,7 @@ def validate(ctx, links, internal_only, suggest_fixes, format):
 @click.pass_context
 def performance(ctx, limit):
     """Show build performance history and trends"""
-    try:
-        from core.build_profiler import BuildProfiler
-    except ImportError:
-        import sys
-        sys.path.insert(0, str(Path(__file__).parent))
-        from core.build_profiler import BuildProfiler
+    from core.build_profiler import BuildProfiler
     
     profiler = BuildProfiler()
     
@@ -434,9 +657,8 @@ def performance(ctx, limit):
         return
     
     try:
-        with open(profiler.runs_file) as f:
-            data = json.load(f)
-            runs = data.get('runs', [])
+        data = _json_loads(profiler.runs_file.read_bytes())
+        runs = data.get('runs', [])
         
         if not runs:
             click.echo("No performance data yet.")
@@ -513,18 +735,12 @@ def fix(ctx, links, apply, commit, min_confidence, rebuild):
         click.echo("    Use --apply to actually modify files")
         return
     
-    try:
-        from core.link_validator import LinkValidator
-        from core.link_fixer import LinkFixer
-    except ImportError:
-        import sys
-        sys.path.insert(0, str(Path(__file__).parent))
-        from core.link_validator import LinkValidator
-        from core.link_fixer import LinkFixer
+    from core.link_validator import LinkValidator
+    from core.link_fixer import LinkFixer
     
     config = ctx.obj
-    content_path = Path(config['build']['content'])
-    dist_path = Path(config['build']['output'])
+    content_path = config['_content_path']
+    dist_path = config['_dist_path']
     
     # Step 1: Validate links
     click.echo("🔗 Validating links...")
@@ -615,13 +831,6 @@ def media():
 @click.pass_context
 def upload(ctx, source, path):
     """Upload file(s) to Cloudflare R2"""
-    try:
-        from core.r2_storage import R2Storage
-    except ImportError:
-        import sys
-        sys.path.insert(0, str(Path(__file__).parent))
-        from core.r2_storage import R2Storage
-    
     config = ctx.obj
     storage = R2Storage(config)
     
@@ -672,19 +881,12 @@ def upload(ctx, source, path):
             click.echo(f"\n💡 Use in markdown:")
             click.echo(f"   ![Alt text]({result['public_url']})")
 
-@media.command()
+@media.command('list')
 @click.option('--prefix', default='', help='Filter by prefix (e.g., images/)')
 @click.option('--limit', default=100, type=int, help='Max files to show')
 @click.pass_context
-def list(ctx, prefix, limit):
+def list_media(ctx, prefix, limit):
     """List files in R2 bucket"""
-    try:
-        from core.r2_storage import R2Storage
-    except ImportError:
-        import sys
-        sys.path.insert(0, str(Path(__file__).parent))
-        from core.r2_storage import R2Storage
-    
     config = ctx.obj
     storage = R2Storage(config)
     
@@ -722,13 +924,6 @@ def list(ctx, prefix, limit):
 @click.pass_context
 def sync(ctx, source_dir, prefix, delete):
     """Sync local directory to R2"""
-    try:
-        from core.r2_storage import R2Storage
-    except ImportError:
-        import sys
-        sys.path.insert(0, str(Path(__file__).parent))
-        from core.r2_storage import R2Storage
-    
     config = ctx.obj
     storage = R2Storage(config)
     
@@ -763,13 +958,6 @@ def sync(ctx, source_dir, prefix, delete):
 @click.pass_context
 def delete(ctx, remote_path):
     """Delete file from R2"""
-    try:
-        from core.r2_storage import R2Storage
-    except ImportError:
-        import sys
-        sys.path.insert(0, str(Path(__file__).parent))
-        from core.r2_storage import R2Storage
-    
     config = ctx.obj
     storage = R2Storage(config)
     
@@ -792,25 +980,17 @@ def delete(ctx, remote_path):
 @cli.command()
 @click.argument('source', type=click.Path(exists=True), required=False)
 @click.option('--title', help='Article title (auto-detected if not provided)')
-@click.option('--category', type=click.Choice(['posts', 'pages', 'projects']), help='Content category (AI suggests if not provided)')
+@click.option('--category', type=_CATEGORY_CHOICE, help='Content category (AI suggests if not provided)')
 @click.option('--compress-images', is_flag=True, default=True, help='Compress images before upload')
 @click.option('--commit', is_flag=True, help='Create git commit after import')
 @click.pass_context
 def import_content(ctx, source, title, category, compress_images, commit):
     """Import content from file or clipboard (extracts & uploads images)"""
+    from core.content_importer import ContentImporter
     try:
-        from core.content_importer import ContentImporter
-        from core.r2_storage import R2Storage
         from anthropic import Anthropic
     except ImportError:
-        import sys
-        sys.path.insert(0, str(Path(__file__).parent))
-        from core.content_importer import ContentImporter
-        from core.r2_storage import R2Storage
-        try:
-            from anthropic import Anthropic
-        except:
-            Anthropic = None
+        Anthropic = None
     
     config = ctx.obj
     
@@ -827,35 +1007,43 @@ def import_content(ctx, source, title, category, compress_images, commit):
     
     # Read content
     if source:
-        content = Path(source).read_text()
+        content = _fast_read_text(source)
         click.echo(f"📄 Importing from {source}...")
     else:
-        # Try to read from clipboard
+        # Try to read from clipboard (in-process via pyperclip, pbpaste as fallback)
         try:
-            import subprocess
-            result = subprocess.run(['pbpaste'], capture_output=True, text=True)
-            content = result.stdout
-            if not content.strip():
-                click.echo("❌ No content in clipboard. Provide a file or copy content first.")
-                ctx.exit(1)
-            click.echo("📋 Importing from clipboard...")
-        except:
+            try:
+                import pyperclip
+                content = pyperclip.paste()
+            except ImportError:
+                import subprocess
+                content = subprocess.run(['pbpaste'], capture_output=True, text=True).stdout
+        except (OSError, RuntimeError):
+            # pbpaste missing (FileNotFoundError) or no clipboard backend (PyperclipException)
             click.echo("❌ Cannot read clipboard. Provide a file path instead.")
             ctx.exit(1)
+        
+        if not content.strip():
+            click.echo("❌ No content in clipboard. Provide a file or copy content first.")
+            ctx.exit(1)
+        click.echo("📋 Importing from clipboard...")
     
     # Import and process
     click.echo("Score Analyzing content...")
     result = importer.import_from_text(content, title)
     
     # Show what was found
-    click.echo(f"\n📊 Import Analysis:")
-    click.echo(f"├─ Title: {result['title']}")
-    click.echo(f"├─ Suggested slug: {result['suggested_slug']}")
+    analysis = [
+        "\n📊 Import Analysis:",
+        f"├─ Title: {result['title']}",
+        f"├─ Suggested slug: {result['suggested_slug']}"
+    ]
     if result['suggested_category']:
         cat = result['suggested_category']
-        click.echo(f"├─ AI category: {cat['category']} ({cat['confidence']} confidence)")
-        click.echo(f"│  └─ {cat['reasoning']}")
-    click.echo(f"└─ Images found: {len(result['images'])}")
+        analysis.append(f"├─ AI category: {cat['category']} ({cat['confidence']} confidence)")
+        analysis.append(f"│  └─ {cat['reasoning']}")
+    analysis.append(f"└─ Images found: {len(result['images'])}")
+    click.echo('\n'.join(analysis))
     
     # Check slug conflicts
     if result['slug_conflicts']:
@@ -863,11 +1051,9 @@ def import_content(ctx, source, title, category, compress_images, commit):
         for conflict in result['slug_conflicts']:
             click.echo(f"  - {conflict}")
         
-        # Suggest unique slug
-        from core.content_importer import SlugChecker
-        checker = SlugChecker(importer.content_path)
+        # Suggest unique slug (reuses the slug index built during import)
         suggested_cat = category or result.get('suggested_category', {}).get('category', 'pages')
-        unique_slug = checker.suggest_unique_slug(result['suggested_slug'], suggested_cat)
+        unique_slug = importer.slug_checker.suggest_unique_slug(result['suggested_slug'], suggested_cat)
         click.echo(f"\n💡 Suggested unique slug: {unique_slug}")
         
         if not click.confirm(f"Use '{unique_slug}' instead?"):
@@ -906,13 +1092,18 @@ def import_content(ctx, source, title, category, compress_images, commit):
     )
     
     # Show preview
-    click.echo(f"\n📝 Will create: {file_path}")
-    click.echo("\nPreview (first 10 lines):")
-    click.echo("─" * 60)
-    for i, line in enumerate(markdown_content.split('\n')[:10], 1):
-        click.echo(line)
-    click.echo("...")
-    click.echo("─" * 60)
+    # Slice at the 10th newline rather than splitting the whole document
+    end = -1
+    for _ in range(10):
+        end = markdown_content.find('\n', end + 1)
+        if end == -1:
+            end = len(markdown_content)
+            break
+    click.echo(
+        f"\n📝 Will create: {file_path}\n"
+        f"\nPreview (first 10 lines):\n"
+        f"{_HR}\n{markdown_content[:end]}\n...\n{_HR}"
+    )
     
     # Confirm
     if not click.confirm("\nCreate this file?"):
@@ -930,44 +1121,36 @@ def import_content(ctx, source, title, category, compress_images, commit):
             click.echo(f"✅ Git commit created")
             click.echo(f"   Review: git show")
         
-        click.echo(f"\n💡 Next steps:")
-        click.echo(f"   1. Review and edit: vim {file_path}")
-        click.echo(f"   2. Analyze quality: gang analyze {file_path}")
-        click.echo(f"   3. Change status to 'published' when ready")
-        click.echo(f"   4. Build: gang build")
+        click.echo(_NEXT_STEPS_IMPORT.format(file_path=file_path))
 
 @cli.command()
 @click.argument('old_slug')
 @click.argument('new_slug')
-@click.option('--category', type=click.Choice(['posts', 'pages', 'projects']), required=True, help='Content category')
+@click.option('--category', type=_CATEGORY_CHOICE, required=True, help='Content category')
 @click.option('--redirect', is_flag=True, default=True, help='Create 301 redirect (default: yes)')
 @click.option('--no-redirect', is_flag=True, help='Skip creating redirect')
 @click.pass_context
 def rename_slug(ctx, old_slug, new_slug, category, redirect, no_redirect):
     """Rename a content slug with optional 301 redirect"""
-    try:
-        from core.content_importer import SlugChecker
-        from core.redirects import RedirectManager
-    except ImportError:
-        import sys
-        sys.path.insert(0, str(Path(__file__).parent))
-        from core.content_importer import SlugChecker
-        from core.redirects import RedirectManager
+    from core.content_importer import SlugChecker
     
     config = ctx.obj
-    content_path = Path(config['build']['content'])
-    dist_path = Path(config['build']['output'])
+    content_path = config['_content_path']
+    dist_path = config['_dist_path']
+    
+    # One directory scan answers both existence checks
+    checker = SlugChecker(content_path)
+    slugs = checker.slugs_in(category)
     
     # Check old file exists
     old_file = content_path / category / f"{old_slug}.md"
-    if not old_file.exists():
+    if old_slug not in slugs:
         click.echo(f"❌ File not found: {old_file}")
         ctx.exit(1)
     
     # Check new slug is unique
-    checker = SlugChecker(content_path)
     new_file = content_path / category / f"{new_slug}.md"
-    if new_file.exists():
+    if new_slug in slugs:
         click.echo(f"❌ Slug '{new_slug}' already exists: {new_file}")
         click.echo(f"💡 Choose a different slug")
         ctx.exit(1)
@@ -999,6 +1182,8 @@ def rename_slug(ctx, old_slug, new_slug, category, redirect, no_redirect):
     # Rename file
     try:
         old_file.rename(new_file)
+        slugs.discard(old_slug)
+        slugs.add(new_slug)
         click.echo(f"✅ File renamed: {old_file.name} → {new_file.name}")
     except Exception as e:
         click.echo(f"❌ Rename failed: {e}")
@@ -1021,12 +1206,11 @@ def rename_slug(ctx, old_slug, new_slug, category, redirect, no_redirect):
         try:
             import subprocess
             
-            # Stage renamed file
-            subprocess.run(['git', 'add', str(new_file)], check=True)
-            subprocess.run(['git', 'rm', str(old_file)], check=True)
-            
+            # Stage the rename (old path removal + new path) and redirects in one call
+            paths = [str(old_file), str(new_file)]
             if create_redirect:
-                subprocess.run(['git', 'add', str(redirect_manager.redirects_file)], check=True)
+                paths.append(str(redirect_manager.redirects_file))
+            subprocess.run(['git', 'add', '-A', '--'] + paths, check=True)
             
             commit_msg = f"Rename slug: {old_slug} → {new_slug}"
             if create_redirect:
@@ -1037,10 +1221,7 @@ def rename_slug(ctx, old_slug, new_slug, category, redirect, no_redirect):
         except Exception as e:
             click.echo(f"⚠️  Git commit failed: {e}")
     
-    click.echo(f"\n💡 Next steps:")
-    click.echo(f"   1. gang build  # Rebuild with new slug")
-    click.echo(f"   2. Check redirects: cat .redirects.json")
-    click.echo(f"   3. Deploy (redirects go live)")
+    click.echo(_NEXT_STEPS_RENAME)
 
 @cli.group()
 def redirects():
@@ -1048,27 +1229,19 @@ def redirects():
     pass
 
 @redirects.command('list')
-@click.option('--format', type=click.Choice(['text', 'json', 'cloudflare', 'nginx', 'netlify']), default='text')
+@click.option('--format', type=_REDIRECT_FORMATS, default='text')
 @click.pass_context
 def list_redirects(ctx, format):
     """List all redirects"""
-    try:
-        from core.redirects import RedirectManager
-    except ImportError:
-        import sys
-        sys.path.insert(0, str(Path(__file__).parent))
-        from core.redirects import RedirectManager
-    
     config = ctx.obj
-    content_path = Path(config['build']['content'])
-    dist_path = Path(config['build']['output'])
+    content_path = config['_content_path']
+    dist_path = config['_dist_path']
     
     manager = RedirectManager(content_path, dist_path)
     redirects_list = manager.list_all_redirects()
     
     if format == 'json':
-        import json
-        click.echo(json.dumps(redirects_list, indent=2))
+        click.echo(_json_bytes(redirects_list, indent=True).decode('utf-8'))
     elif format == 'cloudflare':
         click.echo(manager.generate_cloudflare_redirects())
     elif format == 'nginx':
@@ -1080,15 +1253,17 @@ def list_redirects(ctx, format):
             click.echo("No redirects configured")
             return
         
-        click.echo(f"📋 {len(redirects_list)} redirect(s):\n")
+        # Collect the report and write it with a single echo
+        lines = [f"📋 {len(redirects_list)} redirect(s):\n"]
         for r in redirects_list:
             status = r.get('status', 301)
-            click.echo(f"  {r['from']} → {r['to']} ({status})")
+            lines.append(f"  {r['from']} → {r['to']} ({status})")
             if 'reason' in r:
-                click.echo(f"    Reason: {r['reason']}")
+                lines.append(f"    Reason: {r['reason']}")
             if 'created' in r:
-                click.echo(f"    Created: {r['created']}")
-            click.echo()
+                lines.append(f"    Created: {r['created']}")
+            lines.append("")
+        click.echo('\n'.join(lines))
 
 @redirects.command('add')
 @click.argument('from_path')
@@ -1097,16 +1272,9 @@ def list_redirects(ctx, format):
 @click.pass_context
 def add_redirect(ctx, from_path, to_path, temporary):
     """Add a manual redirect"""
-    try:
-        from core.redirects import RedirectManager
-    except ImportError:
-        import sys
-        sys.path.insert(0, str(Path(__file__).parent))
-        from core.redirects import RedirectManager
-    
     config = ctx.obj
-    content_path = Path(config['build']['content'])
-    dist_path = Path(config['build']['output'])
+    content_path = config['_content_path']
+    dist_path = config['_dist_path']
     
     manager = RedirectManager(content_path, dist_path)
     result = manager.add_redirect(
@@ -1127,16 +1295,9 @@ def add_redirect(ctx, from_path, to_path, temporary):
 @click.pass_context
 def remove_redirect(ctx, from_path):
     """Remove a redirect"""
-    try:
-        from core.redirects import RedirectManager
-    except ImportError:
-        import sys
-        sys.path.insert(0, str(Path(__file__).parent))
-        from core.redirects import RedirectManager
-    
     config = ctx.obj
-    content_path = Path(config['build']['content'])
-    dist_path = Path(config['build']['output'])
+    content_path = config['_content_path']
+    dist_path = config['_dist_path']
     
     manager = RedirectManager(content_path, dist_path)
     
@@ -1150,16 +1311,9 @@ def remove_redirect(ctx, from_path):
 @click.pass_context
 def validate_redirects(ctx):
     """Check for redirect chains and loops"""
-    try:
-        from core.redirects import RedirectManager
-    except ImportError:
-        import sys
-        sys.path.insert(0, str(Path(__file__).parent))
-        from core.redirects import RedirectManager
-    
     config = ctx.obj
-    content_path = Path(config['build']['content'])
-    dist_path = Path(config['build']['output'])
+    content_path = config['_content_path']
+    dist_path = config['_dist_path']
     
     manager = RedirectManager(content_path, dist_path)
     issues = manager.validate_redirect_chain()
@@ -1176,15 +1330,8 @@ def validate_redirects(ctx):
 @click.pass_context
 def schedule(ctx):
     """View content publishing schedule"""
-    try:
-        from core.scheduler import ContentScheduler
-    except ImportError:
-        import sys
-        sys.path.insert(0, str(Path(__file__).parent))
-        from core.scheduler import ContentScheduler
-    
     config = ctx.obj
-    content_path = Path(config['build']['content'])
+    content_path = config['_content_path']
     
     scheduler = ContentScheduler(content_path)
     summary = scheduler.get_scheduled_summary()
@@ -1196,6 +1343,10 @@ def schedule(ctx):
     if summary['scheduled'] > 0:
         ctx.exit(0)
 
+# Non-zero-padded dates that datetime.fromisoformat() rejects,
+# e.g. "2025-1-5" or "2025-1-5 9:00"
+_LOOSE_DATE_RE = re.compile(r'^(\d{4})-(\d{1,2})-(\d{1,2})(?: (\d{1,2}):(\d{1,2})(?::(\d{1,2}))?)?$')
+
 @cli.command()
 @click.argument('file_path', type=click.STRING)
 @click.argument('publish_date', required=False)
@@ -1204,17 +1355,8 @@ def schedule(ctx):
 @click.pass_context
 def set_schedule(ctx, file_path, publish_date, now, status):
     """Set or update publish date for content"""
-    try:
-        from core.scheduler import ContentScheduler
-    except ImportError:
-        import sys
-        sys.path.insert(0, str(Path(__file__).parent))
-        from core.scheduler import ContentScheduler
-    
-    from datetime import datetime
-    
     config = ctx.obj
-    content_path = Path(config['build']['content'])
+    content_path = config['_content_path']
     scheduler = ContentScheduler(content_path)
     
     file_path = Path(file_path)
@@ -1230,25 +1372,26 @@ def set_schedule(ctx, file_path, publish_date, now, status):
             ctx.exit(1)
     elif publish_date:
         # Parse and set publish date
+        # ISO format covers YYYY-MM-DD, YYYY-MM-DD HH:MM[:SS] and offsets;
+        # only unpadded dates fall through to the regex
+        pub_date = None
         try:
-            # Try ISO format first
             pub_date = datetime.fromisoformat(publish_date.replace('Z', '+00:00'))
-        except:
-            # Try common formats
-            for fmt in ['%Y-%m-%d', '%Y-%m-%d %H:%M', '%Y-%m-%d %H:%M:%S']:
+        except ValueError:
+            match = _LOOSE_DATE_RE.match(publish_date)
+            if match:
                 try:
-                    pub_date = datetime.strptime(publish_date, fmt)
-                    break
-                except:
-                    continue
-            else:
-                click.echo(f"❌ Invalid date format: {publish_date}")
-                click.echo("   Use: YYYY-MM-DD or YYYY-MM-DD HH:MM or ISO format")
-                ctx.exit(1)
+                    pub_date = datetime(*(int(g) for g in match.groups() if g is not None))
+                except ValueError:
+                    pass
+        
+        if pub_date is None:
+            click.echo(f"❌ Invalid date format: {publish_date}")
+            click.echo("   Use: YYYY-MM-DD or YYYY-MM-DD HH:MM or ISO format")
+            ctx.exit(1)
         
         # Ensure timezone aware
         if pub_date.tzinfo is None:
-            from datetime import timezone
             pub_date = pub_date.replace(tzinfo=timezone.utc)
         
         success = scheduler.set_publish_date(file_path, pub_date, status)
@@ -1259,7 +1402,6 @@ def set_schedule(ctx, file_path, publish_date, now, status):
             click.echo(f"   Status: {status}")
             
             # Show relative time
-            from datetime import datetime, timezone
             now = datetime.now(timezone.utc)
             delta = pub_date - now
             
@@ -1291,15 +1433,8 @@ def set_schedule(ctx, file_path, publish_date, now, status):
 @click.pass_context
 def history(ctx, file_path, limit):
     """Show version history for a content file"""
-    try:
-        from core.versioning import ContentVersioning
-    except ImportError:
-        import sys
-        sys.path.insert(0, str(Path(__file__).parent))
-        from core.versioning import ContentVersioning
-    
     config = ctx.obj
-    content_path = Path(config['build']['content'])
+    content_path = config['_content_path']
     
     versioning = ContentVersioning(content_path)
     file_path = Path(file_path)
@@ -1320,15 +1455,8 @@ def history(ctx, file_path, limit):
 @click.pass_context
 def restore(ctx, file_path, commit):
     """Restore a file to a specific commit version"""
-    try:
-        from core.versioning import ContentVersioning
-    except ImportError:
-        import sys
-        sys.path.insert(0, str(Path(__file__).parent))
-        from core.versioning import ContentVersioning
-    
     config = ctx.obj
-    content_path = Path(config['build']['content'])
+    content_path = config['_content_path']
     
     versioning = ContentVersioning(content_path)
     file_path = Path(file_path)
@@ -1367,22 +1495,21 @@ def restore(ctx, file_path, commit):
         click.echo(f"❌ Failed to restore {file_path.name}")
         ctx.exit(1)
 
+# git --name-status code -> icon for `gang changes`
+_STATUS_ICON = {
+    'M': '📝',
+    'A': '✨',
+    'D': '🗑️',
+    'R': '🔄'
+}
+
 @cli.command()
 @click.option('--days', default=7, help='Number of days to look back')
 @click.pass_context
 def changes(ctx, days):
     """Show recent content changes"""
-    try:
-        from core.versioning import ContentVersioning
-    except ImportError:
-        import sys
-        sys.path.insert(0, str(Path(__file__).parent))
-        from core.versioning import ContentVersioning
-    
-    from datetime import datetime
-    
     config = ctx.obj
-    content_path = Path(config['build']['content'])
+    content_path = config['_content_path']
     
     versioning = ContentVersioning(content_path)
     recent = versioning.get_recent_changes(days)
@@ -1391,71 +1518,83 @@ def changes(ctx, days):
         click.echo(f"No content changes in the last {days} days")
         return
     
-    click.echo(f"📝 Content Changes (Last {days} days)")
-    click.echo("=" * 60)
-    click.echo(f"Total commits: {len(recent)}\n")
+    # Collect the report and write it with a single echo
+    lines = [
+        f"📝 Content Changes (Last {days} days)",
+        "=" * 60,
+        f"Total commits: {len(recent)}\n"
+    ]
     
     for commit in recent:
-        date = datetime.fromisoformat(commit['date'])
-        date_str = date.strftime('%Y-%m-%d %H:%M')
+        # 'date' is a naive isoformat() string: YYYY-MM-DDTHH:MM:SS
+        date_str = commit['date'][:16].replace('T', ' ')
         
-        click.echo(f"[{commit['short_commit']}] {date_str} - {commit['author']}")
-        click.echo(f"  {commit['message']}")
+        lines.append(f"[{commit['short_commit']}] {date_str} - {commit['author']}")
+        lines.append(f"  {commit['message']}")
         
         if commit['files']:
             for file in commit['files']:
-                status_icon = {
-                    'M': '📝',
-                    'A': '✨',
-                    'D': '🗑️',
-                    'R': '🔄'
-                }.get(file['status'], '•')
-                click.echo(f"    {status_icon} {file['path']}")
+                status_icon = _STATUS_ICON.get(file['status'], '•')
+                lines.append(f"    {status_icon} {file['path']}")
         
-        click.echo("")
+        lines.append("")
+    
+    click.echo('\n'.join(lines))
 
 @cli.command()
-@click.argument('image_path', type=click.Path(exists=True))
+@click.argument('image_paths', nargs=-1, required=True, type=click.Path(exists=True))
 @click.option('--focal-x', type=float, default=0.5, help='Focal point X (0-1)')
 @click.option('--focal-y', type=float, default=0.5, help='Focal point Y (0-1)')
 @click.option('--auto-detect', is_flag=True, help='Auto-detect focal point using AI')
 @click.option('--is-lcp', is_flag=True, help='Mark as LCP image (no lazy loading)')
+@click.option('--jobs', '-j', type=int, default=os.cpu_count() or 4, show_default=True, help='Images to process in parallel')
 @click.pass_context
-def process_image(ctx, image_path, focal_x, focal_y, auto_detect, is_lcp):
-    """Process image with focal point and generate responsive crops"""
-    try:
-        from core.image_pipeline import ImagePipeline, FocalPointDetector
-    except ImportError:
-        import sys
-        sys.path.insert(0, str(Path(__file__).parent))
-        from core.image_pipeline import ImagePipeline, FocalPointDetector
-    
+def process_image(ctx, image_paths, focal_x, focal_y, auto_detect, is_lcp, jobs):
+    """Process images with focal point and generate responsive crops"""
     config = ctx.obj
     public_path = Path(config['build']['public'])
-    dist_path = Path(config['build']['output'])
+    dist_path = config['_dist_path']
     
     pipeline = ImagePipeline(public_path, dist_path)
-    
-    image = Path(image_path)
-    
-    if auto_detect:
-        click.echo("Score Detecting focal point...")
-        focal_point = FocalPointDetector.detect_focal_point(image)
-        click.echo(f"   Detected: ({focal_point[0]:.2f}, {focal_point[1]:.2f})")
-    else:
-        focal_point = (focal_x, focal_y)
-    
-    click.echo(f"🖼️  Processing: {image.name}")
-    result = pipeline.process_image(image, focal_point, is_lcp)
-    
-    click.echo(f"✅ Generated {len(result['crops'])} crops")
-    click.echo(f"✅ Generated {len(result['formats'])} formats")
-    
-    if result['thumbhash']:
-        click.echo(f"✅ ThumbHash: {result['thumbhash']}")
-    
-    click.echo(f"\n<picture> HTML:")
-    click.echo(result['html'])
+    images = [Path(image_path) for image_path in image_paths]
+    
+    # Outputs are named by stem, so images sharing one (a/hero.jpg and
+    # b/hero.jpg) are processed in order within one task, never at once
+    by_stem = {}
+    for image in images:
+        by_stem.setdefault(image.stem, []).append(image)
+    for stem, group in by_stem.items():
+        if len(group) > 1:
+            click.echo(f"⚠️  {len(group)} images share the name '{stem}'; the last one's outputs are kept")
+    
+    def process_group(group):
+        processed = []
+        for image in group:
+            if auto_detect:
+                focal_point = FocalPointDetector.detect_focal_point(image)
+            else:
+                focal_point = (focal_x, focal_y)
+            processed.append((image, focal_point, pipeline.process_image(image, focal_point, is_lcp)))
+        return processed
+    
+    # Batches share one interpreter; Pillow releases the GIL while
+    # decoding/resizing, so stem groups run on a thread pool
+    with ThreadPoolExecutor(max_workers=max(1, min(jobs, len(by_stem)))) as executor:
+        processed = (item for group in executor.map(process_group, by_stem.values()) for item in group)
+        for image, focal_point, result in processed:
+            if auto_detect:
+                click.echo("Score Detecting focal point...")
+                click.echo(f"   Detected: ({focal_point[0]:.2f}, {focal_point[1]:.2f})")
+            
+            click.echo(f"🖼️  Processing: {image.name}")
+            click.echo(f"✅ Generated {len(result['crops'])} crops")
+            click.echo(f"✅ Generated {len(result['formats'])} formats")
+            
+            if result['thumbhash']:
+                click.echo(f"✅ ThumbHash: {result['thumbhash']}")
+            
+            click.echo(f"\n<picture> HTML:")
+            click.echo(result['html'])
 
 @cli.command()
 @click.option('--from', 'bundle_path', type=click.Path(exists=True), help='Bundle JSON file')
@@ -1463,12 +1602,7 @@ def process_image(ctx, image_path, focal_x, focal_y, auto_detect, is_lcp):
 @click.pass_context
 def syndicate(ctx, bundle_path, platform):
     """Render syndication bundle for a platform"""
-    try:
-        from core.syndication_bundle import render_syndication_bundle
-    except ImportError:
-        import sys
-        sys.path.insert(0, str(Path(__file__).parent))
-        from core.syndication_bundle import render_syndication_bundle
+    from core.syndication_bundle import render_syndication_bundle
     
     if bundle_path:
         output = render_syndication_bundle(Path(bundle_path), platform)
@@ -1484,17 +1618,10 @@ def email():
 @email.command('create-from-post')
 @click.argument('post_path', type=click.STRING)
 @click.option('--output', default='./emails', help='Output directory for email files')
-@click.option('--esp', default='buttondown', help='ESP provider (buttondown, convertkit, mailerlite, postmark, sendgrid)')
+@click.option('--esp', type=_ESP_CHOICE, default='buttondown', help='ESP provider')
 @click.pass_context
 def email_create_from_post(ctx, post_path, output, esp):
     """Create email template from a post"""
-    try:
-        from core.email_templates import EmailOrchestrator
-    except ImportError:
-        import sys
-        sys.path.insert(0, str(Path(__file__).parent))
-        from core.email_templates import EmailOrchestrator
-    
     config = ctx.obj
     post_file = Path(post_path)
     
@@ -1510,7 +1637,7 @@ def email_create_from_post(ctx, post_path, output, esp):
     metadata = orchestrator.create_email_from_post(post_file, output_dir)
     
     # Save newsletter to content for public listing
-    content_path = Path(config['build']['content'])
+    content_path = config['_content_path']
     newsletter_file = orchestrator.save_newsletter_to_content(post_file, metadata, content_path)
     
     click.echo(f"\n✅ Email created:")
@@ -1533,15 +1660,6 @@ def email_create_from_post(ctx, post_path, output, esp):
 @click.pass_context
 def email_send_draft(ctx, email_slug, emails_dir, api_key, from_email):
     """Send email draft to ESP"""
-    try:
-        from core.email_templates import ESPIntegration
-    except ImportError:
-        import sys
-        sys.path.insert(0, str(Path(__file__).parent))
-        from core.email_templates import ESPIntegration
-    
-    import json
-    
     emails_path = Path(emails_dir)
     meta_file = emails_path / f"{email_slug}.json"
     
@@ -1555,11 +1673,11 @@ def email_send_draft(ctx, email_slug, emails_dir, api_key, from_email):
         return
     
     # Load metadata
-    metadata = json.loads(meta_file.read_text())
+    metadata = _json_loads(meta_file.read_bytes())
     
     # Load email content
-    html_content = Path(metadata['html_path']).read_text()
-    text_content = Path(metadata['text_path']).read_text()
+    html_content = _fast_read_text(metadata['html_path'])
+    text_content = _fast_read_text(metadata['text_path'])
     
     # Send to ESP
     esp = ESPIntegration(metadata['esp_provider'], api_key)
@@ -1581,7 +1699,7 @@ def email_send_draft(ctx, email_slug, emails_dir, api_key, from_email):
         # Update metadata
         metadata['esp_draft_id'] = result.get('id')
         metadata['sent_to_esp'] = datetime.now().isoformat()
-        meta_file.write_text(json.dumps(metadata, indent=2))
+        meta_file.write_bytes(_json_bytes(metadata, indent=True))
         
     except Exception as e:
         click.echo(f"❌ Failed to send to ESP: {e}", err=True)
@@ -1595,13 +1713,6 @@ def email_send_draft(ctx, email_slug, emails_dir, api_key, from_email):
 @click.pass_context
 def email_klaviyo_create(ctx, post_path, list_id, from_email, from_name, api_key):
     """Create Klaviyo campaign from post"""
-    try:
-        from core.klaviyo_integration import KlaviyoOrchestrator
-    except ImportError:
-        import sys
-        sys.path.insert(0, str(Path(__file__).parent))
-        from core.klaviyo_integration import KlaviyoOrchestrator
-    
     if not api_key:
         click.echo("❌ KLAVIYO_API_KEY environment variable not set", err=True)
         click.echo("   Set it with: export KLAVIYO_API_KEY=your_private_key")
@@ -1633,9 +1744,8 @@ def email_klaviyo_create(ctx, post_path, list_id, from_email, from_name, api_key
         )
         
         # Save newsletter to content for public listing
-        from core.email_templates import EmailOrchestrator as EmailOrch
-        email_orch = EmailOrch(config, 'klaviyo')
-        content_path = Path(config['build']['content'])
+        email_orch = EmailOrchestrator(config, 'klaviyo')
+        content_path = config['_content_path']
         newsletter_file = email_orch.save_newsletter_to_content(
             post_file, 
             {
@@ -1669,13 +1779,6 @@ def email_klaviyo_create(ctx, post_path, list_id, from_email, from_name, api_key
 @click.option('--api-key', envvar='KLAVIYO_API_KEY', help='Klaviyo API key')
 def email_klaviyo_lists(api_key):
     """List all Klaviyo lists"""
-    try:
-        from core.klaviyo_integration import KlaviyoClient
-    except ImportError:
-        import sys
-        sys.path.insert(0, str(Path(__file__).parent))
-        from core.klaviyo_integration import KlaviyoClient
-    
     if not api_key:
         click.echo("❌ KLAVIYO_API_KEY not set", err=True)
         return
@@ -1685,15 +1788,15 @@ def email_klaviyo_lists(api_key):
     try:
         lists = client.get_lists()
         
-        click.echo(f"\n📋 Klaviyo Lists ({len(lists)}):\n")
-        
+        lines = [f"\n📋 Klaviyo Lists ({len(lists)}):\n"]
         for lst in lists:
             attrs = lst['attributes']
-            click.echo(f"  {attrs['name']}")
-            click.echo(f"    ID: {lst['id']}")
+            lines.append(f"  {attrs['name']}")
+            lines.append(f"    ID: {lst['id']}")
             if attrs.get('profile_count'):
-                click.echo(f"    Subscribers: {attrs['profile_count']}")
-            click.echo("")
+                lines.append(f"    Subscribers: {attrs['profile_count']}")
+            lines.append("")
+        click.echo('\n'.join(lines))
         
     except Exception as e:
         click.echo(f"❌ Failed to fetch lists: {e}", err=True)
@@ -1703,13 +1806,6 @@ def email_klaviyo_lists(api_key):
 @click.option('--api-key', envvar='KLAVIYO_API_KEY', help='Klaviyo API key')
 def email_klaviyo_campaigns(status, api_key):
     """List Klaviyo campaigns"""
-    try:
-        from core.klaviyo_integration import KlaviyoClient
-    except ImportError:
-        import sys
-        sys.path.insert(0, str(Path(__file__).parent))
-        from core.klaviyo_integration import KlaviyoClient
-    
     if not api_key:
         click.echo("❌ KLAVIYO_API_KEY not set", err=True)
         return
@@ -1719,35 +1815,38 @@ def email_klaviyo_campaigns(status, api_key):
     try:
         campaigns = client.get_campaigns(status)
         
-        click.echo(f"\n📧 Klaviyo Campaigns ({status}):\n")
-        
+        lines = [f"\n📧 Klaviyo Campaigns ({status}):\n"]
         for campaign in campaigns:
             attrs = campaign['attributes']
-            click.echo(f"  {attrs['name']}")
-            click.echo(f"    ID: {campaign['id']}")
-            click.echo(f"    Status: {attrs.get('status', 'unknown')}")
+            lines.append(f"  {attrs['name']}")
+            lines.append(f"    ID: {campaign['id']}")
+            lines.append(f"    Status: {attrs.get('status', 'unknown')}")
             if attrs.get('send_time'):
-                click.echo(f"    Scheduled: {attrs['send_time']}")
-            click.echo("")
+                lines.append(f"    Scheduled: {attrs['send_time']}")
+            lines.append("")
+        click.echo('\n'.join(lines))
         
     except Exception as e:
         click.echo(f"❌ Failed to fetch campaigns: {e}", err=True)
 
 @email.command('check-deliverability')
-@click.argument('domain')
-def email_check_deliverability(domain):
+@click.argument('domains', nargs=-1, required=True)
+@click.option('--concurrent', '-c', type=int, default=4, show_default=True, help='Domains to check in parallel')
+def email_check_deliverability(domains, concurrent):
     """Check DNS records for email deliverability"""
     try:
-        from core.email_templates import DeliverabilityChecker
+        with ThreadPoolExecutor(max_workers=max(1, concurrent)) as executor:
+            all_results = list(executor.map(DeliverabilityChecker.check_dns_records, domains))
     except ImportError:
-        import sys
-        sys.path.insert(0, str(Path(__file__).parent))
-        from core.email_templates import DeliverabilityChecker
-    
-    click.echo(f"Score Checking deliverability for: {domain}\n")
+        for domain in domains:
+            click.echo(f"Score Checking deliverability for: {domain}\n")
+            click.echo("⚠️  dnspython not installed. Install with: pip install dnspython")
+            click.echo("\n📖 Setup Guide:")
+            click.echo(DeliverabilityChecker.generate_setup_guide(domain))
+        return
     
-    try:
-        results = DeliverabilityChecker.check_dns_records(domain)
+    for domain, results in zip(domains, all_results):
+        click.echo(f"Score Checking deliverability for: {domain}\n")
         
         click.echo("SPF Record:")
         if results['spf']:
@@ -1772,11 +1871,6 @@ def email_check_deliverability(domain):
         click.echo("\n" + "="*50)
         click.echo("\n📖 Setup Guide:")
         click.echo(DeliverabilityChecker.generate_setup_guide(domain))
-        
-    except ImportError:
-        click.echo("⚠️  dnspython not installed. Install with: pip install dnspython")
-        click.echo("\n📖 Setup Guide:")
-        click.echo(DeliverabilityChecker.generate_setup_guide(domain))
 
 @cli.group()
 def taxonomy():
@@ -1787,65 +1881,54 @@ def taxonomy():
 @click.pass_context
 def taxonomy_list(ctx):
     """List all categories and tags"""
-    try:
-        from core.taxonomy import TaxonomyManager
-    except ImportError:
-        import sys
-        sys.path.insert(0, str(Path(__file__).parent))
-        from core.taxonomy import TaxonomyManager
+    from core.taxonomy import TaxonomyManager
     
     config = ctx.obj
-    content_path = Path(config['build']['content'])
+    content_path = config['_content_path']
     
     manager = TaxonomyManager(content_path)
+    categories = manager.get_all_categories()
     
-    click.echo("\n📚 Categories:")
-    for cat_name, cat_data in manager.get_all_categories().items():
-        click.echo(f"\n  {cat_name}")
+    lines = ["\n📚 Categories:"]
+    for cat_name, cat_data in categories.items():
+        lines.append(f"\n  {cat_name}")
         if cat_data.get('description'):
-            click.echo(f"    {cat_data['description']}")
+            lines.append(f"    {cat_data['description']}")
         if cat_data.get('children'):
-            click.echo(f"    Subcategories: {', '.join(cat_data['children'])}")
+            lines.append(f"    Subcategories: {', '.join(cat_data['children'])}")
     
-    click.echo("\n🏷️  Tags:")
+    lines.append("\n🏷️  Tags:")
     tags = manager.get_all_tags()
-    for tag in tags:
-        click.echo(f"  • {tag}")
+    lines.extend(f"  • {tag}" for tag in tags)
     
-    click.echo(f"\n✅ {len(manager.get_all_categories())} categories, {len(tags)} tags")
+    lines.append(f"\n✅ {len(categories)} categories, {len(tags)} tags")
+    click.echo('\n'.join(lines))
 
 @taxonomy.command('analyze')
 @click.pass_context
 def taxonomy_analyze(ctx):
     """Analyze taxonomy usage across content"""
-    try:
-        from core.taxonomy import TaxonomyManager
-    except ImportError:
-        import sys
-        sys.path.insert(0, str(Path(__file__).parent))
-        from core.taxonomy import TaxonomyManager
+    from core.taxonomy import TaxonomyManager
     
     config = ctx.obj
-    content_path = Path(config['build']['content'])
+    content_path = config['_content_path']
     
     manager = TaxonomyManager(content_path)
     analysis = manager.analyze_content_taxonomy()
     
-    click.echo("\n📊 Taxonomy Usage Analysis:\n")
-    
-    click.echo("By Category:")
-    for category, items in sorted(analysis['by_category'].items()):
-        click.echo(f"  {category}: {len(items)} items")
+    lines = ["\n📊 Taxonomy Usage Analysis:\n", "By Category:"]
+    lines.extend(f"  {category}: {len(items)} items" for category, items in sorted(analysis['by_category'].items()))
     
-    click.echo("\nBy Tag:")
-    for tag, items in sorted(analysis['by_tag'].items()):
-        click.echo(f"  {tag}: {len(items)} items")
+    lines.append("\nBy Tag:")
+    lines.extend(f"  {tag}: {len(items)} items" for tag, items in sorted(analysis['by_tag'].items()))
     
     if analysis['uncategorized']:
-        click.echo(f"\n⚠️  {len(analysis['uncategorized'])} uncategorized items")
+        lines.append(f"\n⚠️  {len(analysis['uncategorized'])} uncategorized items")
     
     if analysis['untagged']:
-        click.echo(f"⚠️  {len(analysis['untagged'])} untagged items")
+        lines.append(f"⚠️  {len(analysis['untagged'])} untagged items")
+    
+    click.echo('\n'.join(lines))
 
 @taxonomy.command('add-category')
 @click.argument('name')
@@ -1854,15 +1937,10 @@ def taxonomy_analyze(ctx):
 @click.pass_context
 def taxonomy_add_category(ctx, name, description, parent):
     """Add a new category or subcategory"""
-    try:
-        from core.taxonomy import TaxonomyManager
-    except ImportError:
-        import sys
-        sys.path.insert(0, str(Path(__file__).parent))
-        from core.taxonomy import TaxonomyManager
+    from core.taxonomy import TaxonomyManager
     
     config = ctx.obj
-    content_path = Path(config['build']['content'])
+    content_path = config['_content_path']
     
     manager = TaxonomyManager(content_path)
     manager.add_category(name, description or '', parent)
@@ -1877,15 +1955,10 @@ def taxonomy_add_category(ctx, name, description, parent):
 @click.pass_context
 def taxonomy_add_tag(ctx, tag):
     """Add a new tag"""
-    try:
-        from core.taxonomy import TaxonomyManager
-    except ImportError:
-        import sys
-        sys.path.insert(0, str(Path(__file__).parent))
-        from core.taxonomy import TaxonomyManager
+    from core.taxonomy import TaxonomyManager
     
     config = ctx.obj
-    content_path = Path(config['build']['content'])
+    content_path = config['_content_path']
     
     manager = TaxonomyManager(content_path)
     manager.add_tag(tag)
@@ -1898,21 +1971,16 @@ def taxonomy_add_tag(ctx, tag):
 @click.pass_context
 def shopify_sync(ctx, product_json, auto_pr):
     """Sync Shopify product and optionally create PR"""
-    try:
-        from core.shopify_pr_bot import ShopifyPRBot
-    except ImportError:
-        import sys
-        sys.path.insert(0, str(Path(__file__).parent))
-        from core.shopify_pr_bot import ShopifyPRBot
+    from core.shopify_pr_bot import ShopifyPRBot
     
     config = ctx.obj
-    content_path = Path(config['build']['content'])
+    content_path = config['_content_path']
     mapping_path = Path('schemas/product.map.json')
     
     bot = ShopifyPRBot(content_path, mapping_path)
     
     # Load product data
-    product_data = json.loads(Path(product_json).read_text())
+    product_data = _json_loads(Path(product_json).read_bytes())
     
     if auto_pr:
         click.echo("🤖 Creating PR for product update...")
@@ -1939,13 +2007,6 @@ def products():
 @click.pass_context
 def sync_products(ctx, platforms):
     """Fetch products from platforms and normalize"""
-    try:
-        from core.products import ProductAggregator
-    except ImportError:
-        import sys
-        sys.path.insert(0, str(Path(__file__).parent))
-        from core.products import ProductAggregator
-    
     config = ctx.obj
     config['demo_mode'] = True  # Use demo mode if no API keys
     
@@ -1963,13 +2024,6 @@ def sync_products(ctx, platforms):
 @click.pass_context
 def list_products(ctx, format):
     """List all synced products"""
-    try:
-        from core.products import ProductAggregator
-    except ImportError:
-        import sys
-        sys.path.insert(0, str(Path(__file__).parent))
-        from core.products import ProductAggregator
-    
     config = ctx.obj
     config['demo_mode'] = True
     
@@ -1983,63 +2037,50 @@ def list_products(ctx, format):
     products = aggregator.get_normalized_products()
     
     if format == 'json':
-        import json
         click.echo(json.dumps(products, indent=2))
     else:
-        click.echo(f"🛒 Products ({len(products)} total)\n")
+        lines = [f"🛒 Products ({len(products)} total)\n"]
         for p in products:
             source = p.get('_meta', {}).get('source', 'unknown')
             
             # Handle both single offer and array of offers
             offers = p.get('offers', {})
-            if type(offers).__name__ == 'list':
+            if isinstance(offers, list):
                 # Multiple offers (variants)
                 first_offer = offers[0] if offers else {}
                 price = first_offer.get('price', 'N/A')
                 currency = first_offer.get('priceCurrency', 'USD')
                 variant_count = len(offers)
-                click.echo(f"• {p['name']}")
-                click.echo(f"  Price: {currency} {price} ({variant_count} variant{'s' if variant_count != 1 else ''}) | Source: {source}")
+                lines.append(f"• {p['name']}")
+                lines.append(f"  Price: {currency} {price} ({variant_count} variant{'s' if variant_count != 1 else ''}) | Source: {source}")
             else:
                 # Single offer
                 price = offers.get('price', 'N/A')
                 currency = offers.get('priceCurrency', 'USD')
-                click.echo(f"• {p['name']}")
-                click.echo(f"  Price: {currency} {price} | Source: {source}")
+                lines.append(f"• {p['name']}")
+                lines.append(f"  Price: {currency} {price} | Source: {source}")
+        click.echo('\n'.join(lines))
 
 @cli.command('agentmap')
 @click.pass_context
 def generate_agentmap(ctx):
     """Generate AgentMap.json for AI agent navigation"""
-    try:
-        from core.agentmap import AgentMapGenerator, ContentAPIGenerator
-        from core.products import ProductAggregator
-        from core.scheduler import ContentScheduler
-    except ImportError:
-        import sys
-        sys.path.insert(0, str(Path(__file__).parent))
-        from core.agentmap import AgentMapGenerator, ContentAPIGenerator
-        from core.products import ProductAggregator
-        from core.scheduler import ContentScheduler
     
     config = ctx.obj
-    content_path = Path(config['build']['content'])
-    dist_path = Path(config['build']['output'])
+    content_path = config['_content_path']
+    dist_path = config['_dist_path']
     site_url = config['site']['url']
     
     click.echo("🤖 Generating AgentMap for AI agents...")
     
-    # Get publishable content - avoid rglob recursion issue
-    scheduler = ContentScheduler(content_path)
-    
-    # Manually collect .md files to avoid Click recursion
-    all_md_files = []
-    for category_dir in ['posts', 'pages', 'projects']:
-        category_path = content_path / category_dir
-        if category_path.exists():
-            all_md_files.extend(list(category_path.glob('*.md')))
+    # Get publishable content
+    all_md_files = [
+        md_file
+        for category_dir in ('posts', 'pages', 'projects')
+        for md_file in _list_md(content_path / category_dir)
+    ]
     
-    schedule_result = scheduler.get_publishable_content(all_md_files)
+    schedule_result = _publishable_content(content_path, all_md_files)
     publishable = [item['path'] for item in schedule_result['publishable']]
     
     # Get products if available
@@ -2053,7 +2094,7 @@ def generate_agentmap(ctx):
     
     # Write AgentMap
     agentmap_file = dist_path / 'agentmap.json'
-    agentmap_file.write_text(json.dumps(agentmap, indent=2))
+    _write_json(agentmap_file, agentmap)
     
     # Generate Content API
     api_dir = dist_path / 'api'
@@ -2062,10 +2103,10 @@ def generate_agentmap(ctx):
     api_generator = ContentAPIGenerator(site_url)
     content_index = api_generator.generate_content_index(publishable, content_path)
     
-    (api_dir / 'content.json').write_text(json.dumps(content_index, indent=2))
+    _write_json(api_dir / 'content.json', content_index)
     
     if products:
-        (api_dir / 'products.json').write_text(json.dumps(products, indent=2))
+        _write_json(api_dir / 'products.json', products)
     
     click.echo(f"✅ Generated AgentMap with {len(publishable)} content items")
     if products:
@@ -2077,15 +2118,10 @@ def generate_agentmap(ctx):
 @click.pass_context
 def slugs(ctx, fix):
     """Check slug uniqueness across all content"""
-    try:
-        from core.content_importer import SlugChecker
-    except ImportError:
-        import sys
-        sys.path.insert(0, str(Path(__file__).parent))
-        from core.content_importer import SlugChecker
+    from core.content_importer import SlugChecker
     
     config = ctx.obj
-    content_path = Path(config['build']['content'])
+    content_path = config['_content_path']
     
     click.echo("Score Checking slug uniqueness...\n")
     
@@ -2098,22 +2134,33 @@ def slugs(ctx, fix):
     click.echo(f"└─ Duplicates: {results['duplicate_slugs']}")
     
     if results['duplicates']:
-        click.echo(f"\n❌ Duplicate slugs found:")
-        for slug, files in results['duplicates'].items():
-            click.echo(f"\n  Slug: '{slug}' used in:")
-            for file in files:
-                click.echo(f"    - {file}")
+        lines = [f"\n❌ Duplicate slugs found:"]
+        for slug, files in sorted(results['duplicates'].items()):
+            lines.append(f"\n  Slug: '{slug}' used in:")
+            lines.extend(f"    - {file}" for file in files)
             
             if fix:
-                click.echo(f"  💡 To fix: Rename one file to make slugs unique")
+                lines.append(f"  💡 To fix: Rename one file to make slugs unique")
         
         if not fix:
-            click.echo(f"\n💡 Run with --fix to see suggestions")
+            lines.append(f"\n💡 Run with --fix to see suggestions")
         
+        click.echo('\n'.join(lines))
         ctx.exit(1)
     else:
         click.echo(f"\n✅ All slugs are unique!")
 
+# Fallback minifier patterns for build, used when the native minifiers
+# aren't installed
+_JS_LINE_COMMENT_RE = re.compile(r'(?<!["\'/])//[^\n]*')
+_BLOCK_COMMENT_RE = re.compile(r'/\*.*?\*/', re.DOTALL)
+_JS_INDENT_RE = re.compile(r'\n\s+')
+_JS_WS_RUN_RE = re.compile(r'\s{2,}')
+_CSS_WS_RE = re.compile(r'\s+')
+_CSS_SPECIAL_RE = re.compile(r'\s*([{}:;,])\s*')
+_HTML_COMMENT_RE = re.compile(r'<!--.*?-->', re.DOTALL)
+_HTML_TAG_WS_RE = re.compile(r'>\s+<')
+
 @cli.command()
 @click.option('--check-quality', is_flag=True, help='Run content quality checks before building')
 @click.option('--min-quality-score', type=int, default=85, help='Minimum quality score (default: 85)')
@@ -2121,47 +2168,44 @@ def slugs(ctx, fix):
 @click.option('--check-slugs', is_flag=True, default=True, help='Check slug uniqueness (default: enabled)')
 @click.option('--optimize-images', is_flag=True, help='Auto-optimize images before building')
 @click.option('--profile', is_flag=True, help='Show build performance metrics')
+@click.option('--jobs', '-j', type=int, default=os.cpu_count() or 1, show_default=True, help='Worker processes for rendering content (1 = sequential)')
+@click.option('--incremental', is_flag=True, help='Only re-render content changed since the last incremental build')
 @click.pass_context
-def build(ctx, check_quality, min_quality_score, validate_links, check_slugs, optimize_images, profile):
+def build(ctx, check_quality, min_quality_score, validate_links, check_slugs, optimize_images, profile, jobs, incremental):
     """Build static site with semantic HTML"""
-    try:
-        from core.templates import TemplateEngine
-        from core.generators import OutputGenerators
-        from core.optimizer import AIOptimizer
-        from core.build_profiler import BuildProfiler
-    except ImportError:
-        import sys
-        sys.path.insert(0, str(Path(__file__).parent))
-        from core.templates import TemplateEngine
-        from core.generators import OutputGenerators
-        from core.optimizer import AIOptimizer
-        from core.build_profiler import BuildProfiler
+    from core.generators import OutputGenerators
     
-    # Initialize profiler
-    profiler = BuildProfiler() if profile else None
-    if profiler:
+    # Initialize profiler (only imported when requested)
+    profiler = None
+    if profile:
+        from core.build_profiler import BuildProfiler
+        profiler = BuildProfiler()
         profiler.start()
     
     click.echo("🔨 Building site...")
     config = ctx.obj
     
+    # Walk the content tree once; the checks, the scheduler and the search
+    # and AgentMap passes below all share this list
+    content_path = config['_content_path']
+    content_files = _list_md(content_path, recursive=True)
+    
     # Slug uniqueness check (enabled by default)
     if check_slugs:
         from core.content_importer import SlugChecker
-        content_path = Path(config['build']['content'])
-        checker = SlugChecker(content_path)
+        checker = SlugChecker(content_path, files=content_files)
         results = checker.check_all_slugs()
         
         if results['duplicate_slugs'] > 0:
-            click.echo("❌ Duplicate slugs detected!\n")
-            for slug, files in results['duplicates'].items():
-                click.echo(f"  Slug '{slug}' used in:")
-                for file in files:
-                    click.echo(f"    - {file}")
+            lines = ["❌ Duplicate slugs detected!\n"]
+            for slug, files in sorted(results['duplicates'].items()):
+                lines.append(f"  Slug '{slug}' used in:")
+                lines.extend(f"    - {file}" for file in files)
             
-            click.echo(f"\n🚫 Cannot build: {results['duplicate_slugs']} duplicate slug(s) found")
-            click.echo("   Run 'gang slugs' for details")
-            click.echo("   Fix by renaming files to have unique slugs")
+            lines.append(f"\n🚫 Cannot build: {results['duplicate_slugs']} duplicate slug(s) found")
+            lines.append("   Run 'gang slugs' for details")
+            lines.append("   Fix by renaming files to have unique slugs")
+            click.echo('\n'.join(lines))
             ctx.exit(1)
         else:
             click.echo(f"Best Practices All {results['total_slugs']} slugs are unique\n")
@@ -2171,8 +2215,7 @@ def build(ctx, check_quality, min_quality_score, validate_links, check_slugs, op
         from core.analyzer import ContentAnalyzer
         click.echo("Score Running content quality checks...")
         analyzer = ContentAnalyzer(config)
-        content_path = Path(config['build']['content'])
-        md_files = list(content_path.rglob('*.md'))
+        md_files = content_files
         
         failed_files = []
         for md_file in md_files:
@@ -2198,11 +2241,10 @@ def build(ctx, check_quality, min_quality_score, validate_links, check_slugs, op
     if validate_links:
         from core.link_validator import LinkValidator
         click.echo("🔗 Validating links...")
-        content_path = Path(config['build']['content'])
-        dist_path = Path(config['build']['output'])
+        dist_path = config['_dist_path']
         validator = LinkValidator(config, content_path, dist_path)
         
-        results = validator.scan_all_files()
+        results = validator.scan_all_files(content_files)
         
         broken_count = len(results['broken_internal']) + len(results['broken_external'])
         
@@ -2222,48 +2264,67 @@ def build(ctx, check_quality, min_quality_score, validate_links, check_slugs, op
     
     # Initialize systems
     templates_path = Path(config['build'].get('templates', './templates'))
-    template_engine = TemplateEngine(templates_path)
     generators = OutputGenerators(config)
-    optimizer = AIOptimizer(config)
+    
+    # Incremental builds keep dist and reuse unchanged pages; any change to
+    # config, templates or editor mode invalidates every cached page
+    render_cache = None
+    if incremental:
+        from core.cache import RenderCache
+        # Every template's path, mtime and size, so deletions and files
+        # restored with older mtimes are noticed too
+        templates_state = []
+        for f in templates_path.rglob('*'):
+            if f.is_file():
+                st = f.stat()
+                templates_state.append((f.relative_to(templates_path).as_posix(), st.st_mtime_ns, st.st_size))
+        fingerprint = (config, tuple(sorted(templates_state)), os.environ.get('EDITOR_MODE', '').lower())
+        render_cache = RenderCache(Path('.gang/cache'), fingerprint)
     
     # Create dist directory
-    dist_path = Path(config['build']['output'])
-    if dist_path.exists():
+    dist_path = config['_dist_path']
+    if dist_path.exists() and not (render_cache and render_cache.entries):
         shutil.rmtree(dist_path)
+        shutil.rmtree(_CONTENT_SPILL_DIR, ignore_errors=True)
     dist_path.mkdir(parents=True, exist_ok=True)
     
-    # Optimize images if requested
-    if optimize_images:
-        from core.images import ImageProcessor
-        click.echo("🖼️  Optimizing images...")
-        
+    # Image optimization and the asset copy only touch dist/assets, so they
+    # run on a background thread while content renders. They stay in their
+    # original order: the copy must not race the optimizer's output dir.
+    def prepare_assets() -> List[str]:
+        messages = []
         public_path = Path(config['build']['public'])
-        images_source = public_path / 'images' if (public_path / 'images').exists() else public_path
-        images_output = dist_path / 'assets' / 'images'
-        images_output.mkdir(parents=True, exist_ok=True)
         
-        processor = ImageProcessor(config)
-        result = processor.process_all_images(images_source, images_output)
+        # Optimize images if requested
+        if optimize_images:
+            from core.images import ImageProcessor
+            messages.append("🖼️  Optimizing images...")
+            
+            images_source = public_path / 'images' if (public_path / 'images').exists() else public_path
+            images_output = dist_path / 'assets' / 'images'
+            images_output.mkdir(parents=True, exist_ok=True)
+            
+            processor = ImageProcessor(config)
+            result = processor.process_all_images(images_source, images_output, jobs=jobs)
+            
+            stats = result['stats']
+            if stats['total_images'] > 0:
+                savings_kb = stats['savings_bytes'] / 1024
+                messages.append(f"  Best Practices Optimized {stats['total_images']} image(s) → {stats['total_variants']} variants")
+                messages.append(f"  💾 Saved {savings_kb:.1f}KB ({stats['savings_percent']:.1f}% reduction)")
         
-        stats = result['stats']
-        if stats['total_images'] > 0:
-            savings_kb = stats['savings_bytes'] / 1024
-            click.echo(f"  Best Practices Optimized {stats['total_images']} image(s) → {stats['total_variants']} variants")
-            click.echo(f"  💾 Saved {savings_kb:.1f}KB ({stats['savings_percent']:.1f}% reduction)")
-    
-    # Copy public assets
-    public_path = Path(config['build']['public'])
-    if public_path.exists():
-        if profiler:
-            with profiler.stage('copy_assets'):
-                click.echo("📦 Copying public assets...")
+        # Copy public assets
+        if public_path.exists():
+            messages.append("📦 Copying public assets...")
+            if profiler:
+                with profiler.stage('copy_assets'):
+                    shutil.copytree(public_path, dist_path / 'assets', dirs_exist_ok=True)
+            else:
                 shutil.copytree(public_path, dist_path / 'assets', dirs_exist_ok=True)
-        else:
-            click.echo("📦 Copying public assets...")
-            shutil.copytree(public_path, dist_path / 'assets', dirs_exist_ok=True)
+        
+        return messages
     
     # Build content
-    content_path = Path(config['build']['content'])
     all_pages = []
     all_posts = []
     all_projects = []
@@ -2274,24 +2335,16 @@ def build(ctx, check_quality, min_quality_score, validate_links, check_slugs, op
         profiler.stage('process_content').__enter__()
     
     # Filter content based on publish dates
-    try:
-        from core.scheduler import ContentScheduler
-    except ImportError:
-        import sys
-        sys.path.insert(0, str(Path(__file__).parent))
-        from core.scheduler import ContentScheduler
-    
-    scheduler = ContentScheduler(content_path)
     
-    # Manually collect .md files to avoid Click recursion issue
-    all_md_files = []
-    for category_dir in ['posts', 'articles', 'pages', 'projects', 'newsletters']:
-        category_path = content_path / category_dir
-        if category_path.exists():
-            for md_file in category_path.glob('*.md'):
-                all_md_files.append(md_file)
+    # Only files directly inside the rendered categories are built
+    all_md_files = [
+        md_file
+        for category_dir in ('posts', 'articles', 'pages', 'projects', 'newsletters')
+        for md_file in content_files
+        if md_file.parent == content_path / category_dir
+    ]
     
-    schedule_result = scheduler.get_publishable_content(all_md_files)
+    schedule_result = _publishable_content(content_path, all_md_files)
     
     publishable_files = [item['path'] for item in schedule_result['publishable']]
     
@@ -2302,116 +2355,121 @@ def build(ctx, check_quality, min_quality_score, validate_links, check_slugs, op
         click.echo(f"📝 {len(schedule_result['draft'])} draft post(s) excluded")
     
     click.echo(f"📝 Processing {len(publishable_files)} publishable content file(s)...")
-    for md_file in publishable_files:
-        content_type = md_file.parent.name
-        
-        # Parse markdown with frontmatter
-        content = md_file.read_text()
-        if content.startswith('---'):
-            parts = content.split('---', 2)
-            frontmatter = yaml.safe_load(parts[1]) if len(parts) > 1 else {}
-            body = parts[2] if len(parts) > 2 else ''
-        else:
-            frontmatter = {}
-            body = content
-        
-        # Convert markdown to HTML
-        md = markdown.Markdown(extensions=['extra', 'meta'])
-        content_html = md.convert(body)
-        
-        # Process external links to open in new tabs
-        content_html = process_external_links(content_html)
-        
-        # Prepare context for template
-        build_time = datetime.now()
-        slug = md_file.stem
-        
-        # Check if editor mode is enabled (for in-place editing)
-        user_authenticated = os.environ.get('EDITOR_MODE', '').lower() == 'true'
-        
-        context = {
-            'site_title': config['site']['title'],
-            'lang': config['site']['language'],
-            'title': frontmatter.get('title', md_file.stem.replace('-', ' ').title()),
-            'description': frontmatter.get('summary', config['site']['description']),
-            'content': content_html,
-            'year': datetime.now().year,
-            'navigation': config.get('nav', {}).get('main', []),
-            'date': frontmatter.get('date'),
-            'date_formatted': str(frontmatter.get('date', '')),
-            'tags': frontmatter.get('tags', []),
-            'build_time': build_time.strftime('%B %d, %Y at %I:%M %p'),
-            'build_time_iso': build_time.isoformat(),
-            'jsonld': frontmatter.get('jsonld'),
-            # In-place editor context
-            'page_type': content_type.rstrip('s'),  # 'posts' -> 'post', 'pages' -> 'page'
-            'category': content_type,  # 'posts', 'pages', 'projects', etc.
-            'slug': slug,
-            'user_authenticated': user_authenticated,
-        }
-        
-        # Treat articles as posts
-        if content_type == 'articles':
-            content_type = 'posts'
-            # Update context to reflect the change
-            context['page_type'] = 'post'
-            context['category'] = 'posts'
-        
-        # Add canonical URL
-        if content_type == 'posts':
-            url = f"/posts/{slug}/"
-        elif content_type == 'projects':
-            url = f"/projects/{slug}/"
-        elif content_type == 'pages':
-            url = f"/pages/{slug}/"
-        else:
-            url = f"/{content_type}/{slug}/"
-        
-        context['canonical_url'] = f"{config['site']['url']}{url}"
-        
-        # Select template
-        if content_type == 'posts':
-            template_name = 'post.html'
-        elif content_type == 'projects':
-            template_name = 'article.html'  # Use article template for projects
-        elif content_type == 'newsletters':
-            template_name = 'newsletter.html'
-        else:
-            template_name = 'page.html'
-        
-        # Render HTML
-        try:
-            html = template_engine.render(template_name, context)
-        except Exception as e:
-            click.echo(f"⚠️  Template error in {md_file}: {e}")
-            html = process_markdown_fallback(md_file, content_type, config)
-        
-        # Determine output path
-        output_file = dist_path / content_type / slug / 'index.html'
-        output_file.parent.mkdir(parents=True, exist_ok=True)
-        output_file.write_text(html)
-        click.echo(f"  Best Practices {md_file.relative_to(content_path)}")
-        
-        # Collect metadata for sitemaps
-        page_data = {
-            'url': url,
-            'title': context['title'],
-            'summary': context['description'],
-            'date': context['date'],
-            'type': content_type,
-            'content_html': content_html,
-            'tags': context['tags'],
-        }
-        
-        # Add to appropriate collection (no duplicates)
-        if content_type == 'posts':
-            all_posts.append(page_data)
-        elif content_type == 'projects':
-            all_projects.append(page_data)
-        elif content_type == 'newsletters':
-            all_newsletters.append(page_data)
-        elif content_type == 'pages':
-            all_pages.append(page_data)
+    
+    # Split off pages whose source is unchanged since the last incremental build
+    cached_pages = {}
+    files_to_render = publishable_files
+    if render_cache:
+        removed = render_cache.prune(publishable_files)
+        for md_file in publishable_files:
+            entry = render_cache.lookup(md_file)
+            if entry:
+                cached_pages[md_file] = entry
+        files_to_render = [f for f in publishable_files if f not in cached_pages]
+        click.echo(f"♻️  Reusing {len(cached_pages)} unchanged page(s), rendering {len(files_to_render)}")
+        if removed:
+            click.echo(f"🗑️  Removed {removed} stale page(s)")
+    
+    # Create every output directory up front rather than once per write
+    spill_dirs = set()
+    for md_file in files_to_render:
+        category = md_file.parent.name
+        if category == 'articles':
+            category = 'posts'
+        (dist_path / category / md_file.stem).mkdir(parents=True, exist_ok=True)
+        spill_dirs.add(category)
+    for category in spill_dirs:
+        (_CONTENT_SPILL_DIR / category).mkdir(parents=True, exist_ok=True)
+    
+    # One timestamp for every page in this build
+    build_time = datetime.now()
+    
+    # Rendering is CPU-bound pure Python, so files are spread over worker
+    # processes; results come back in input order and are written here
+    render_jobs = max(1, min(jobs, len(files_to_render)))
+    executor = None
+    if render_jobs > 1:
+        executor = ProcessPoolExecutor(
+            max_workers=render_jobs,
+            initializer=_init_render_worker,
+            initargs=(config, templates_path, build_time)
+        )
+        rendered = executor.map(
+            _render_one, files_to_render,
+            chunksize=max(1, len(files_to_render) // (render_jobs * 4))
+        )
+    elif files_to_render:
+        _init_render_worker(config, templates_path, build_time)
+        rendered = map(_render_one, files_to_render)
+    else:
+        rendered = iter(())
+    
+    # The asset thread starts only now that the render workers have been
+    # forked: a child forked while another thread runs can inherit locks
+    # that thread held. Its own image pool doesn't fork this process.
+    asset_executor = ThreadPoolExecutor(max_workers=1)
+    assets_future = asset_executor.submit(prepare_assets)
+    
+    # Progress lines are flushed in batches rather than one write per file
+    progress = []
+    try:
+        for md_file in publishable_files:
+            if md_file in cached_pages:
+                page_data = cached_pages[md_file]['page_data']
+                content_type = page_data['type']
+            else:
+                page = next(rendered)
+                if page['warning']:
+                    progress.append(page['warning'])
+                
+                content_type = page['content_type']
+                page_data = page['page_data']
+                
+                # Determine output path (directory created above). A page
+                # that renders as it did last build, build time aside, keeps
+                # its file (already minified) and mtime, so rsync and CDN
+                # uploads only see pages that really changed.
+                output_file = dist_path / content_type / page['slug'] / 'index.html'
+                if not (render_cache and page['digest']
+                        and render_cache.output_digest(md_file, output_file) == page['digest']):
+                    _write(output_file, page['html'])
+                progress.append(f"  Best Practices {md_file.relative_to(content_path)}")
+                if len(progress) >= 20:
+                    click.echo('\n'.join(progress))
+                    progress.clear()
+                
+                # Pages that fell back after a template error are retried next time
+                if render_cache and not page['warning']:
+                    render_cache.store(md_file, output_file, page_data, page['digest'])
+            
+            # Add to appropriate collection (no duplicates)
+            if content_type == 'posts':
+                all_posts.append(page_data)
+            elif content_type == 'projects':
+                all_projects.append(page_data)
+            elif content_type == 'newsletters':
+                all_newsletters.append(page_data)
+            elif content_type == 'pages':
+                all_pages.append(page_data)
+    finally:
+        if progress:
+            click.echo('\n'.join(progress))
+        if executor:
+            executor.shutdown()
+    
+    if render_cache:
+        render_cache.save_cache()
+    
+    # Join the asset work before anything reads from dist/assets
+    try:
+        for message in assets_future.result():
+            click.echo(message)
+    finally:
+        asset_executor.shutdown()
+    
+    # Newest first; sorted once for the index and the posts list
+    post_date = operator.itemgetter('date') if all('date' in p for p in all_posts) else (lambda x: x.get('date', ''))
+    all_posts_sorted = sorted(all_posts, key=post_date, reverse=True)
     
     # Create index page
     click.echo("🏠 Creating index page...")
@@ -2420,41 +2478,33 @@ def build(ctx, check_quality, min_quality_score, validate_links, check_slugs, op
         'lang': config['site']['language'],
         'title': config['site']['title'],
         'description': config['site']['description'],
-        'year': datetime.now().year,
+        'year': build_time.year,
         'navigation': config.get('nav', {}).get('main', []),
-        'posts': sorted(all_posts, key=lambda x: x.get('date', ''), reverse=True)[:5],
+        'posts': all_posts_sorted[:5],
     }
     
-    index_html = create_index_simple(config, all_posts[:5], templates_path)
-    page_size_bytes = len(index_html.encode('utf-8'))
-    index_html = index_html.replace('__PAGE_SIZE__', format_bytes(page_size_bytes))
-    (dist_path / 'index.html').write_text(index_html)
+    index_html = create_index_simple(config, all_posts_sorted[:5], templates_path, build_time)
+    _write_with_size(dist_path / 'index.html', index_html)
     
     # Create newsletters list page
     if all_newsletters:
         newsletters_dir = dist_path / 'newsletters'
         newsletters_dir.mkdir(parents=True, exist_ok=True)
         
-        newsletters_html = create_list_page_simple(config, sorted(all_newsletters, key=lambda x: x.get('date', ''), reverse=True), 'Newsletters', templates_path)
-        page_size_bytes = len(newsletters_html.encode('utf-8'))
-        newsletters_html = newsletters_html.replace('__PAGE_SIZE__', format_bytes(page_size_bytes))
-        (newsletters_dir / 'index.html').write_text(newsletters_html)
+        newsletters_html = create_list_page_simple(config, sorted(all_newsletters, key=lambda x: x.get('date', ''), reverse=True), 'Newsletters', templates_path, build_time)
+        _write_with_size(newsletters_dir / 'index.html', newsletters_html)
     
     # Create list pages
     # Always create posts index page, even if empty
     click.echo("📄 Creating posts index...")
-    posts_html = create_list_page_simple(config, sorted(all_posts, key=lambda x: x.get('date', ''), reverse=True), 'Posts', templates_path)
-    page_size_bytes = len(posts_html.encode('utf-8'))
-    posts_html = posts_html.replace('__PAGE_SIZE__', format_bytes(page_size_bytes))
+    posts_html = create_list_page_simple(config, all_posts_sorted, 'Posts', templates_path, build_time)
     (dist_path / 'posts').mkdir(parents=True, exist_ok=True)
-    (dist_path / 'posts' / 'index.html').write_text(posts_html)
+    _write_with_size(dist_path / 'posts' / 'index.html', posts_html)
     
     if all_projects:
         click.echo("📄 Creating projects index...")
-        projects_html = create_list_page_simple(config, all_projects, 'Projects', templates_path)
-        page_size_bytes = len(projects_html.encode('utf-8'))
-        projects_html = projects_html.replace('__PAGE_SIZE__', format_bytes(page_size_bytes))
-        (dist_path / 'projects' / 'index.html').write_text(projects_html)
+        projects_html = create_list_page_simple(config, all_projects, 'Projects', templates_path, build_time)
+        _write_with_size(dist_path / 'projects' / 'index.html', projects_html)
     
     # Generate outputs
     click.echo("🗺️  Generating sitemap, feeds, etc...")
@@ -2475,7 +2525,6 @@ def build(ctx, check_quality, min_quality_score, validate_links, check_slugs, op
     
     # Generate redirect rules if any exist
     try:
-        from core.redirects import RedirectManager
         redirect_manager = RedirectManager(content_path, dist_path)
         redirect_list = redirect_manager.list_all_redirects()
         
@@ -2485,156 +2534,57 @@ def build(ctx, check_quality, min_quality_score, validate_links, check_slugs, op
     except Exception as e:
         click.echo(f"⚠️  Could not generate redirects: {e}")
     
+    # Active products feed both the product pages and the AgentMap
+    try:
+        products = ProductAggregator(config).get_normalized_products(status_filter='active')
+    except Exception as e:
+        click.echo(f"⚠️  Could not load products: {e}")
+        products = []
+    
     # Generate product pages (only active products)
     try:
-        from core.products import ProductAggregator
-        from jinja2 import Environment, FileSystemLoader
-        
-        aggregator = ProductAggregator(config)
-        products = aggregator.get_normalized_products(status_filter='active')
-        
         if products:
             click.echo(f"🛒 Generating {len(products)} product page(s)...")
             
             # Setup Jinja2
-            template_dir = Path(__file__).parent.parent.parent / 'templates'
-            jinja_env = Environment(loader=FileSystemLoader(str(template_dir)))
+            jinja_env = _jinja_env(_BUNDLED_TEMPLATES_DIR)
             
             products_path = dist_path / 'products'
             products_path.mkdir(parents=True, exist_ok=True)
             
-            # Generate PLP
+            # Generate PLP; streamed to disk, as the catalogue can be large
             plp_template = jinja_env.get_template('products-list.html')
-            plp_html = plp_template.render(
+            plp_template.stream(
                 products=products,
                 site_title=config['site']['title'],
-                year=datetime.now().year,
+                year=build_time.year,
                 navigation=config.get('nav', {}).get('main', []),
-                build_time=datetime.now().strftime('%Y-%m-%d %H:%M'),
-                build_time_iso=datetime.now().isoformat()
-            )
-            (products_path / 'index.html').write_text(plp_html)
+                build_time=build_time.strftime('%Y-%m-%d %H:%M'),
+                build_time_iso=build_time.isoformat()
+            ).dump(str(products_path / 'index.html'), encoding='utf-8')
             
-            # Generate PDPs
-            pdp_template = jinja_env.get_template('product.html')
-            for product in products:
-                # Use 'handle' if 'slug' not present (Shopify uses 'handle')
-                slug = product['_meta'].get('slug') or product['_meta'].get('handle')
-                if not slug:
-                    click.echo(f"⚠️  Skipping product without slug/handle: {product.get('name')}")
-                    continue
-                
-                pdp_dir = products_path / slug
-                pdp_dir.mkdir(parents=True, exist_ok=True)
-                
-                # Handle images FIRST (can be string or list)
-                raw_images = product.get('image', [])
-                
-                # Ensure we have a proper Python list (avoid isinstance for Click compatibility)
-                type_name = type(raw_images).__name__
-                if type_name in ('list', 'tuple'):
-                    images = [str(img) for img in raw_images if img]
-                elif raw_images:
-                    images = [str(raw_images)]
-                else:
-                    images = []
-                
-                # Extract offer data and variants
-                offers = product.get('offers', {})
-                variants_list = []
-                
-                if type(offers).__name__ == 'list':
-                    # Multiple variants - extract unique colors and sizes
-                    colors = set()
-                    sizes = set()
-                    color_to_image = {}  # Map colors to images
-                    
-                    # First pass: collect unique colors in order they appear
-                    color_order = []
-                    for offer in offers:
-                        variant_name = offer.get('name', '')
-                        if '/' in variant_name:
-                            parts = variant_name.split('/')
-                            color = parts[0].strip()
-                            size = parts[1].strip() if len(parts) > 1 else ''
-                            
-                            if color not in colors:
-                                color_order.append(color)
-                                colors.add(color)
-                            
-                            if size:
-                                sizes.add(size)
-                    
-                    # Map each color to an image (assume images are in same order as colors appear)
-                    for idx, color in enumerate(color_order):
-                        if idx < len(images):
-                            color_to_image[color] = idx
-                    
-                    # Second pass: prepare variant data with correct image mapping
-                    for offer in offers:
-                        variant_name = offer.get('name', '')
-                        color_part = ''
-                        size_part = ''
-                        
-                        if '/' in variant_name:
-                            parts = variant_name.split('/')
-                            color_part = parts[0].strip()
-                            size_part = parts[1].strip() if len(parts) > 1 else ''
-                        
-                        variants_list.append({
-                            'name': variant_name,
-                            'color': color_part,
-                            'size': size_part,
-                            'price': offer.get('price', '0'),
-                            'currency': offer.get('priceCurrency', 'USD'),
-                            'availability': offer.get('availability', 'InStock'),
-                            'url': offer.get('url', '#'),
-                            'sku': offer.get('sku', ''),
-                            'image_index': color_to_image.get(color_part, 0) if color_part else 0
-                        })
-                    
-                    first_offer = offers[0]
-                    # Convert sets to lists without using list() to avoid Click collision
-                    colors_list = [c for c in sorted(colors)]
-                    sizes_list = [s for s in sorted(sizes)]
-                else:
-                    first_offer = offers
-                    colors_list = []
-                    sizes_list = []
-                
-                # Prepare template variables
-                brand_data = product.get('brand', '')
-                brand_name = brand_data.get('name', '') if hasattr(brand_data, 'get') else str(brand_data)
-                
-                pdp_context = {
-                    'lang': config['site'].get('language', 'en'),
-                    'site_title': config['site']['title'],
-                    'title': product.get('name', ''),
-                    'description': product.get('description', ''),
-                    'canonical_url': f"{config['site']['url']}/products/{slug}/",
-                    'product_image': images[0] if images else '',
-                    'product_images': images,
-                    'price': first_offer.get('price', '0'),
-                    'currency': first_offer.get('priceCurrency', 'USD'),
-                    'recurring': None,
-                    'content': product.get('description', ''),
-                    'buy_url': first_offer.get('url', '#'),
-                    'variants': variants_list,
-                    'colors': colors_list,
-                    'sizes': sizes_list,
-                    'sku': product.get('sku', ''),
-                    'brand': brand_name,
-                    'category': product.get('category', ''),
-                    'availability': first_offer.get('availability', 'InStock'),
-                    'jsonld': product,
-                    'year': datetime.now().year,
-                    'navigation': config.get('nav', {}).get('main', []),
-                    'build_time': datetime.now().strftime('%Y-%m-%d %H:%M'),
-                    'build_time_iso': datetime.now().isoformat()
-                }
-                
-                pdp_html = pdp_template.render(**pdp_context)
-                (pdp_dir / 'index.html').write_text(pdp_html)
+            # Generate PDPs; each page is independent, so larger catalogues
+            # are rendered across processes
+            pdp_shared = {
+                'lang': config['site'].get('language', 'en'),
+                'site_title': config['site']['title'],
+                'year': build_time.year,
+                'navigation': config.get('nav', {}).get('main', []),
+                'build_time': build_time.strftime('%Y-%m-%d %H:%M'),
+                'build_time_iso': build_time.isoformat()
+            }
+            render_pdp = functools.partial(
+                _render_pdp, config=config, template_dir=_BUNDLED_TEMPLATES_DIR,
+                products_path=str(products_path), shared_context=pdp_shared
+            )
+            pdp_jobs = max(1, min(jobs, len(products)))
+            if pdp_jobs > 1:
+                with ProcessPoolExecutor(max_workers=pdp_jobs) as pdp_executor:
+                    warnings = [w for w in pdp_executor.map(render_pdp, products, chunksize=8) if w]
+            else:
+                warnings = [w for w in map(render_pdp, products) if w]
+            for warning in warnings:
+                click.echo(warning)
             
             click.echo(f"✅ Generated product pages (PLP + {len(products)} PDPs)")
             
@@ -2642,20 +2592,19 @@ def build(ctx, check_quality, min_quality_score, validate_links, check_slugs, op
             cart_dir = dist_path / 'cart'
             cart_dir.mkdir(parents=True, exist_ok=True)
             
-            build_time = datetime.now()
             build_time_formatted = build_time.strftime('%B %d, %Y at %I:%M %p')
             build_time_iso = build_time.isoformat()
             
             cart_template = jinja_env.get_template('cart.html')
             cart_html = cart_template.render(
-                year=datetime.now().year,
+                year=build_time.year,
                 site_title=config['site']['title'],
                 lighthouse_scores=True,
                 build_time=build_time_formatted,
                 build_time_iso=build_time_iso,
                 description=config['site']['description']
             )
-            (cart_dir / 'index.html').write_text(cart_html)
+            _write(cart_dir / 'index.html', cart_html)
             
             click.echo("🛒 Generated cart page")
             
@@ -2664,44 +2613,43 @@ def build(ctx, check_quality, min_quality_score, validate_links, check_slugs, op
             sitemap_dir.mkdir(parents=True, exist_ok=True)
             
             sitemap_template = jinja_env.get_template('sitemap.html')
-            sitemap_html = sitemap_template.render(
+            sitemap_template.stream(
                 site_title=config['site']['title'],
                 site_url=config['site']['url'],
                 pages=all_pages,
                 posts=all_posts,
                 projects=all_projects,
                 products=products,
-                year=datetime.now().year,
-                build_time_iso=datetime.now().isoformat()
-            )
-            (sitemap_dir / 'index.html').write_text(sitemap_html)
+                year=build_time.year,
+                build_time_iso=build_time_iso
+            ).dump(str(sitemap_dir / 'index.html'), encoding='utf-8')
             
             click.echo("🗺️  Generated HTML sitemap")
     except Exception as e:
         click.echo(f"⚠️  Could not generate product pages: {e}")
     
+    # The search index and AgentMap cover every publishable file in the tree
+    try:
+        schedule_result = _publishable_content(content_path, content_files)
+        publishable_paths = [Path(item['path']) if isinstance(item['path'], str) else item['path'] 
+                            for item in schedule_result['publishable']]
+    except Exception as e:
+        click.echo(f"⚠️  Could not check content schedule: {e}")
+        publishable_paths = []
+    
     # Generate search index
     try:
-        from core.search import SearchIndexer
-        from core.scheduler import ContentScheduler
-        
-        scheduler = ContentScheduler(content_path)
-        all_md = list(content_path.rglob('*.md'))
-        schedule_result = scheduler.get_publishable_content(all_md)
-        publishable = [Path(item['path']) if isinstance(item['path'], str) else item['path'] 
-                      for item in schedule_result['publishable']]
-        
         indexer = SearchIndexer(content_path, config)
-        search_index = indexer.build_search_index(publishable)
+        search_index = indexer.build_search_index(publishable_paths)
         
         # Write search index
         search_index_file = dist_path / 'search-index.json'
-        search_index_file.write_text(json.dumps(search_index))
+        _write_json_stream(search_index_file, search_index, 'documents')
         
         # Write search page
         search_page = dist_path / 'search' / 'index.html'
         search_page.parent.mkdir(parents=True, exist_ok=True)
-        search_page.write_text(indexer.generate_search_page_html())
+        _write(search_page, indexer.generate_search_page_html())
         
         click.echo(f"🔍 Generated search index ({len(search_index['documents'])} documents)")
     except Exception as e:
@@ -2709,20 +2657,6 @@ def build(ctx, check_quality, min_quality_score, validate_links, check_slugs, op
     
     # Generate AgentMap for AI agents
     try:
-        from core.agentmap import AgentMapGenerator, ContentAPIGenerator
-        from core.products import ProductAggregator
-        
-        # Get publishable content (convert Path objects to list)
-        scheduler = ContentScheduler(content_path)
-        all_md_files = [f for f in content_path.rglob('*.md')]
-        schedule_result = scheduler.get_publishable_content(all_md_files)
-        publishable_paths = [Path(item['path']) if isinstance(item['path'], str) else item['path'] 
-                            for item in schedule_result['publishable']]
-        
-        # Get products
-        aggregator = ProductAggregator(config)
-        products = aggregator.get_normalized_products(status_filter='active')
-        
         # Generate AgentMap
         site_url = config.get('site', {}).get('url', 'https://example.com')
         generator = AgentMapGenerator(config, site_url)
@@ -2730,7 +2664,7 @@ def build(ctx, check_quality, min_quality_score, validate_links, check_slugs, op
         
         # Write AgentMap
         agentmap_file = dist_path / 'agentmap.json'
-        agentmap_file.write_text(json.dumps(agentmap, indent=2))
+        _write_json(agentmap_file, agentmap)
         
         # Generate Content API
         api_generator = ContentAPIGenerator(site_url)
@@ -2738,96 +2672,158 @@ def build(ctx, check_quality, min_quality_score, validate_links, check_slugs, op
         
         api_dir = dist_path / 'api'
         api_dir.mkdir(parents=True, exist_ok=True)
-        (api_dir / 'content.json').write_text(json.dumps(content_api, indent=2))
+        _write_json(api_dir / 'content.json', content_api)
         
         # Generate products API
         if products:
             products_api = {
                 'products': products,
                 'count': len(products),
-                'generated': datetime.now().isoformat()
+                'generated': build_time.isoformat()
             }
-            (api_dir / 'products.json').write_text(json.dumps(products_api, indent=2))
+            _write_json(api_dir / 'products.json', products_api)
         
         click.echo(f"🤖 Generated AgentMap with {len(publishable_paths)} content items")
     except Exception as e:
         click.echo(f"⚠️  Could not generate AgentMap: {e}")
     
-    # Minify HTML, CSS, and JS (simple implementation)
+    # Minify HTML, CSS, and JS. The native minifiers are used when installed;
+    # otherwise fall back to the simple regex passes.
     try:
-        import re
+        try:
+            import minify_html
+        except ImportError:
+            minify_html = None
+        try:
+            import rcssmin
+        except ImportError:
+            rcssmin = None
+        try:
+            import rjsmin
+        except ImportError:
+            rjsmin = None
         
-        # Minify JS (safer approach - preserve operators)
-        js_files = [f for f in dist_path.rglob('*.js')]
-        js_original = 0
-        js_minified = 0
-        for js_file in js_files:
+        def minify_js(js_file):
             # Skip editor-bundle.js to avoid corruption
             if js_file.name == 'editor-bundle.js':
-                continue
+                return 0, 0
                 
             js_content = js_file.read_text()
-            js_original += len(js_content)
-            # Remove single-line comments (but preserve URLs)
-            js_content = re.sub(r'(?<!["\'/])//[^\n]*', '', js_content)
-            # Remove multi-line comments
-            js_content = re.sub(r'/\*.*?\*/', '', js_content, flags=re.DOTALL)
-            # Remove extra whitespace (but not all - preserve some for safety)
-            js_content = re.sub(r'\n\s+', '\n', js_content)
-            js_content = re.sub(r'\s{2,}', ' ', js_content)
-            # Remove empty lines
-            js_content = '\n'.join(line for line in js_content.split('\n') if line.strip())
-            js_minified += len(js_content.strip())
-            js_file.write_text(js_content.strip())
-        
-        if js_files:
-            js_savings = ((js_original - js_minified) / js_original * 100) if js_original > 0 else 0
-            click.echo(f"🗜️  Minified {len(js_files)} JS file(s) ({js_savings:.1f}% reduction)")
-        
-        # Minify CSS
-        css_files = [f for f in dist_path.rglob('*.css')]
-        css_original = 0
-        css_minified = 0
-        for css_file in css_files:
+            original = len(js_content)
+            if rjsmin:
+                js_content = rjsmin.jsmin(js_content)
+            else:
+                # Remove single-line comments (but preserve URLs)
+                js_content = _JS_LINE_COMMENT_RE.sub('', js_content)
+                # Remove multi-line comments
+                js_content = _BLOCK_COMMENT_RE.sub('', js_content)
+                # Remove extra whitespace (but not all - preserve some for safety)
+                js_content = _JS_INDENT_RE.sub('\n', js_content)
+                js_content = _JS_WS_RUN_RE.sub(' ', js_content)
+                # Remove empty lines
+                js_content = '\n'.join(line for line in js_content.split('\n') if line.strip())
+            _write(js_file, js_content.strip())
+            return original, len(js_content.strip())
+        
+        def minify_css(css_file):
             css_content = css_file.read_text()
-            css_original += len(css_content)
-            # Remove comments
-            css_content = re.sub(r'/\*.*?\*/', '', css_content, flags=re.DOTALL)
-            # Remove extra whitespace
-            css_content = re.sub(r'\s+', ' ', css_content)
-            # Remove spaces around special characters
-            css_content = re.sub(r'\s*([{}:;,])\s*', r'\1', css_content)
-            css_minified += len(css_content.strip())
-            css_file.write_text(css_content.strip())
-        
-        if css_files:
-            css_savings = ((css_original - css_minified) / css_original * 100) if css_original > 0 else 0
-            click.echo(f"🗜️  Minified {len(css_files)} CSS file(s) ({css_savings:.1f}% reduction)")
-        
-        # Minify HTML
-        html_files = [f for f in dist_path.rglob('*.html')]
-        minified_count = 0
-        original_size = 0
-        minified_size = 0
-        
-        for html_file in html_files:
+            original = len(css_content)
+            if rcssmin:
+                css_content = rcssmin.cssmin(css_content)
+            else:
+                # Remove comments
+                css_content = _BLOCK_COMMENT_RE.sub('', css_content)
+                # Remove extra whitespace
+                css_content = _CSS_WS_RE.sub(' ', css_content)
+                # Remove spaces around special characters
+                css_content = _CSS_SPECIAL_RE.sub(r'\1', css_content)
+            _write(css_file, css_content.strip())
+            return original, len(css_content.strip())
+        
+        def minify_page(html_file):
             original_html = html_file.read_text()
-            original_size += len(original_html)
             
-            # Simple minification:
-            # 1. Remove HTML comments
-            minified = re.sub(r'<!--.*?-->', '', original_html, flags=re.DOTALL)
-            # 2. Remove whitespace between tags
-            minified = re.sub(r'>\s+<', '><', minified)
-            # 3. Remove leading/trailing whitespace on lines
-            minified = '\n'.join(line.strip() for line in minified.split('\n') if line.strip())
+            if minify_html:
+                # Drops comments and inter-tag whitespace, and minifies
+                # inline <style>/<script> blocks too. Structural tags are kept
+                # so the validators still see a complete document.
+                minified = minify_html.minify(
+                    original_html,
+                    minify_css=True,
+                    minify_js=True,
+                    keep_closing_tags=True,
+                    keep_html_and_head_opening_tags=True
+                )
+            else:
+                # Simple minification:
+                # 1. Remove HTML comments
+                minified = _HTML_COMMENT_RE.sub('', original_html)
+                # 2. Remove whitespace between tags
+                minified = _HTML_TAG_WS_RE.sub('><', minified)
+                # 3. Remove leading/trailing whitespace on lines
+                minified = '\n'.join(line.strip() for line in minified.split('\n') if line.strip())
             
-            minified_size += len(minified)
-            html_file.write_text(minified)
-            minified_count += 1
+            if minified != original_html:
+                _write(html_file, minified)
+            return len(original_html), len(minified)
+        
+        # One walk over dist, bucketed by extension
+        js_files, css_files, html_files = [], [], []
+        buckets = {'js': js_files, 'css': css_files, 'html': html_files}
+        for root, _, files in os.walk(dist_path):
+            for name in files:
+                bucket = buckets.get(name.rpartition('.')[2])
+                if bucket is not None:
+                    bucket.append(Path(root) / name)
+        
+        # Incremental builds leave reused pages in place, already minified
+        minify_cache = None
+        if incremental:
+            from core.cache import MinifyCache
+            minify_cache = MinifyCache(Path('.gang/cache'))
+        
+        def run_minifier(minify, path):
+            if minify_cache and minify_cache.is_current(path):
+                return None
+            sizes = minify(path)
+            if minify_cache:
+                minify_cache.record(path)
+            return sizes
+        
+        # The three file sets don't overlap, so every file goes through one
+        # shared pool; the native minifiers release the GIL while they work.
+        with ThreadPoolExecutor(max_workers=max(1, jobs)) as executor:
+            js_results = executor.map(functools.partial(run_minifier, minify_js), js_files)
+            css_results = executor.map(functools.partial(run_minifier, minify_css), css_files)
+            html_results = executor.map(functools.partial(run_minifier, minify_page), html_files)
+            # Files skipped as already minified come back as None
+            js_sizes = [sizes for sizes in js_results if sizes]
+            css_sizes = [sizes for sizes in css_results if sizes]
+            html_sizes = [sizes for sizes in html_results if sizes]
+        
+        if minify_cache:
+            minify_cache.save_cache()
+        
+        if js_sizes:
+            js_original = sum(original for original, _ in js_sizes)
+            js_minified = sum(minified for _, minified in js_sizes)
+            js_savings = ((js_original - js_minified) / js_original * 100) if js_original > 0 else 0
+            click.echo(f"🗜️  Minified {len(js_sizes)} JS file(s) ({js_savings:.1f}% reduction)")
+        
+        if css_sizes:
+            css_original = sum(original for original, _ in css_sizes)
+            css_minified = sum(minified for _, minified in css_sizes)
+            css_savings = ((css_original - css_minified) / css_original * 100) if css_original > 0 else 0
+            click.echo(f"🗜️  Minified {len(css_sizes)} CSS file(s) ({css_savings:.1f}% reduction)")
         
+        original_size = sum(original for original, _ in html_sizes)
+        minified_size = sum(minified for _, minified in html_sizes)
         savings = ((original_size - minified_size) / original_size * 100) if original_size > 0 else 0
-        click.echo(f"🗜️  Minified {minified_count} HTML files ({savings:.1f}% reduction)")
+        click.echo(f"🗜️  Minified {len(html_sizes)} HTML files ({savings:.1f}% reduction)")
+        
+        skipped = len(js_files) + len(css_files) + len(html_files) - len(js_sizes) - len(css_sizes) - len(html_sizes)
+        if skipped:
+            click.echo(f"♻️  Skipped {skipped} file(s) already minified by an earlier build")
     except Exception as e:
         click.echo(f"⚠️  Could not minify assets: {e}")
     
@@ -2848,9 +2844,320 @@ def build(ctx, check_quality, min_quality_score, validate_links, check_slugs, op
         click.echo(report)
 
 
-def process_markdown_fallback(md_file: Path, content_type: str, config: Dict) -> str:
+@cli.command()
+def precompile():
+    """Compile GANG's bundled templates to Python modules for faster builds"""
+    env = _jinja_env(_BUNDLED_TEMPLATES_DIR, precompiled=False)
+    _PRECOMPILED_TEMPLATES.parent.mkdir(parents=True, exist_ok=True)
+    
+    # Templates written for other environments (e.g. ones needing filters only
+    # TemplateEngine registers) are skipped and keep loading from source.
+    # The archive is swapped in whole so a failed run never leaves half of one.
+    log = []
+    tmp_path = _PRECOMPILED_TEMPLATES.with_suffix('.tmp')
+    env.compile_templates(str(tmp_path), zip='deflated', log_function=log.append, ignore_errors=True)
+    tmp_path.replace(_PRECOMPILED_TEMPLATES)
+    
+    skipped = [line for line in log if line.startswith('Could not compile')]
+    click.echo(f"✅ Precompiled {len(log) - len(skipped)} template(s) → {_PRECOMPILED_TEMPLATES}")
+    if skipped:
+        click.echo('\n'.join(f"   ⚠️  {line}" for line in skipped))
+    click.echo("   Builds use it until a bundled template is edited; re-run to refresh")
+
+
+def _render_pdp(product: Dict, config: Dict, template_dir: str, products_path: str,
+                shared_context: Dict) -> Optional[str]:
+    """Render and write one product detail page; returns a warning if it was skipped
+    
+    shared_context holds the keys that are the same on every PDP.
+    """
+    # Use 'handle' if 'slug' not present (Shopify uses 'handle')
+    slug = product['_meta'].get('slug') or product['_meta'].get('handle')
+    if not slug:
+        return f"⚠️  Skipping product without slug/handle: {product.get('name')}"
+    
+    pdp_dir = Path(products_path) / slug
+    pdp_dir.mkdir(parents=True, exist_ok=True)
+    
+    # Handle images FIRST (can be string or list)
+    raw_images = product.get('image', [])
+    if isinstance(raw_images, (list, tuple)):
+        images = [str(img) for img in raw_images if img]
+    elif raw_images:
+        images = [str(raw_images)]
+    else:
+        images = []
+    
+    # Extract offer data and variants
+    offers = product.get('offers', {})
+    variants_list = []
+    
+    if isinstance(offers, list):
+        # Multiple variants - extract unique colors and sizes
+        colors = set()
+        sizes = set()
+        color_to_image = {}  # Map colors to images
+    
+        # Single pass: colors are numbered in the order they first appear, and
+        # images are assumed to be in that same order
+        for offer in offers:
+            variant_name = offer.get('name', '')
+            color_part = ''
+            size_part = ''
+    
+            if '/' in variant_name:
+                parts = variant_name.split('/')
+                color_part = parts[0].strip()
+                size_part = parts[1].strip()
+    
+                if color_part not in colors:
+                    if len(colors) < len(images):
+                        color_to_image[color_part] = len(colors)
+                    colors.add(color_part)
+    
+                if size_part:
+                    sizes.add(size_part)
+    
+            variants_list.append({
+                'name': variant_name,
+                'color': color_part,
+                'size': size_part,
+                'price': offer.get('price', '0'),
+                'currency': offer.get('priceCurrency', 'USD'),
+                'availability': offer.get('availability', 'InStock'),
+                'url': offer.get('url', '#'),
+                'sku': offer.get('sku', ''),
+                'image_index': color_to_image.get(color_part, 0) if color_part else 0
+            })
+    
+        first_offer = offers[0]
+        colors_list = sorted(colors)
+        sizes_list = sorted(sizes)
+    else:
+        first_offer = offers
+        colors_list = []
+        sizes_list = []
+    
+    # Prepare template variables
+    brand_data = product.get('brand', '')
+    brand_name = brand_data.get('name', '') if hasattr(brand_data, 'get') else str(brand_data)
+    
+    pdp_context = {
+        **shared_context,
+        'title': product.get('name', ''),
+        'description': product.get('description', ''),
+        'canonical_url': f"{config['site']['url']}/products/{slug}/",
+        'product_image': images[0] if images else '',
+        'product_images': images,
+        'price': first_offer.get('price', '0'),
+        'currency': first_offer.get('priceCurrency', 'USD'),
+        'recurring': None,
+        'content': product.get('description', ''),
+        'buy_url': first_offer.get('url', '#'),
+        'variants': variants_list,
+        'colors': colors_list,
+        'sizes': sizes_list,
+        'sku': product.get('sku', ''),
+        'brand': brand_name,
+        'category': product.get('category', ''),
+        'availability': first_offer.get('availability', 'InStock'),
+        'jsonld': product
+    }
+    
+    pdp_html = _jinja_env(template_dir).get_template('product.html').render(pdp_context)
+    _write(pdp_dir / 'index.html', pdp_html)
+    return None
+
+
+# Per-process state for build's content rendering (see _init_render_worker)
+_render_state = {}
+
+# Rendered body HTML is parked here instead of being held in page_data for
+# the whole build; only the JSON feed reads it back
+_CONTENT_SPILL_DIR = Path('.gang/cache/content')
+
+# Pages render with these in place of the build time and are digested before
+# they're filled in, so a re-rendered page that only differs by build time
+# can be recognised and left as it is
+_BUILD_TIME_MARK = '__BUILD_TIME__'
+_BUILD_TIME_ISO_MARK = '__BUILD_TIME_ISO__'
+
+
+def _init_render_worker(config: Dict, templates_path: Path, build_time: datetime):
+    """Load the template engine and Markdown converter once per process"""
+    import markdown
+    from core.templates import TemplateEngine
+    
+    _render_state['config'] = config
+    _render_state['build_time'] = build_time
+    
+    # Context values that are the same for every page of the build
+    _render_state['shared_context'] = {
+        'site_title': config['site']['title'],
+        'lang': config['site']['language'],
+        'year': build_time.year,
+        'navigation': config.get('nav', {}).get('main', []),
+        'build_time': _BUILD_TIME_MARK,
+        'build_time_iso': _BUILD_TIME_ISO_MARK,
+        # Check if editor mode is enabled (for in-place editing)
+        'user_authenticated': os.environ.get('EDITOR_MODE', '').lower() == 'true',
+    }
+    _render_state['build_time_fill'] = (
+        (_BUILD_TIME_MARK.encode(), build_time.strftime('%B %d, %Y at %I:%M %p').encode('utf-8')),
+        (_BUILD_TIME_ISO_MARK.encode(), build_time.isoformat().encode('utf-8')),
+    )
+    
+    template_engine = TemplateEngine(templates_path, bytecode_cache_dir=Path('.gang/cache/jinja'))
+    template_engine.preload(['post.html', 'article.html', 'newsletter.html', 'page.html'])
+    _render_state['template_engine'] = template_engine
+    _render_state['md'] = markdown.Markdown(extensions=['extra', 'meta'])
+
+
+def _render_one(md_file: Path) -> Dict:
+    """Render one content file for build; runs in a worker process when --jobs > 1"""
+    config = _render_state['config']
+    template_engine = _render_state['template_engine']
+    md = _render_state['md']
+    warning = None
+    
+    content_type = md_file.parent.name
+    
+    # Parse markdown with frontmatter; locate the closing marker instead of
+    # splitting so the body is sliced once rather than copied into parts
+    content = md_file.read_text()
+    if content.startswith('---'):
+        end = content.find('---', 3)
+        if end == -1:
+            frontmatter = yaml.load(content[3:], Loader=_YamlLoader)
+            body = ''
+        else:
+            frontmatter = yaml.load(content[3:end], Loader=_YamlLoader)
+            body = content[end + 3:]
+    else:
+        frontmatter = {}
+        body = content
+    
+    # Convert markdown to HTML; reset() clears per-document state
+    # (footnotes, abbreviations, meta) left by the previous file
+    md.reset()
+    content_html = md.convert(body)
+    
+    # Process external links to open in new tabs
+    content_html = process_external_links(content_html)
+    
+    # Prepare context for template
+    slug = md_file.stem
+    date = frontmatter.get('date')
+    
+    context = {
+        **_render_state['shared_context'],
+        'title': _display_title(frontmatter, slug),
+        'description': frontmatter.get('summary', config['site']['description']),
+        'content': content_html,
+        'date': date,
+        'date_formatted': str(date) if date is not None else '',
+        'tags': frontmatter.get('tags', []),
+        'jsonld': frontmatter.get('jsonld'),
+        # In-place editor context
+        'page_type': content_type.rstrip('s'),  # 'posts' -> 'post', 'pages' -> 'page'
+        'category': content_type,  # 'posts', 'pages', 'projects', etc.
+        'slug': slug,
+    }
+    
+    # Treat articles as posts
+    if content_type == 'articles':
+        content_type = 'posts'
+        # Update context to reflect the change
+        context['page_type'] = 'post'
+        context['category'] = 'posts'
+    
+    # Add canonical URL
+    if content_type == 'posts':
+        url = f"/posts/{slug}/"
+    elif content_type == 'projects':
+        url = f"/projects/{slug}/"
+    elif content_type == 'pages':
+        url = f"/pages/{slug}/"
+    else:
+        url = f"/{content_type}/{slug}/"
+    
+    context['canonical_url'] = f"{config['site']['url']}{url}"
+    
+    # Select template
+    if content_type == 'posts':
+        template_name = 'post.html'
+    elif content_type == 'projects':
+        template_name = 'article.html'  # Use article template for projects
+    elif content_type == 'newsletters':
+        template_name = 'newsletter.html'
+    else:
+        template_name = 'page.html'
+    
+    # Render HTML; the digest is taken before the build time is filled in
+    try:
+        html = template_engine.render(template_name, context).encode('utf-8')
+        digest = hashlib.blake2b(html, digest_size=16).hexdigest()
+        for mark, value in _render_state['build_time_fill']:
+            html = html.replace(mark, value)
+    except Exception as e:
+        warning = f"⚠️  Template error in {md_file}: {e}"
+        html = process_markdown_fallback(md_file, content_type, config, _render_state['build_time']).encode('utf-8')
+        digest = None
+    
+    content_html_path = _CONTENT_SPILL_DIR / content_type / f'{slug}.html'
+    _write(content_html_path, content_html)
+    
+    return {
+        'content_type': content_type,
+        'slug': slug,
+        'html': html,
+        'digest': digest,
+        'warning': warning,
+        # Collect metadata for sitemaps
+        'page_data': {
+            'url': url,
+            'title': context['title'],
+            'summary': context['description'],
+            'date': context['date'],
+            'type': content_type,
+            'content_html_path': str(content_html_path),
+            'tags': context['tags'],
+        },
+    }
+
+
+def process_markdown_fallback(md_file: Path, content_type: str, config: Dict,
+                              build_time: datetime = None) -> str:
     """Fallback markdown processor if templates fail"""
-    return process_markdown(md_file, content_type, config)
+    return process_markdown(md_file, content_type, config, build_time)
+
+
+# Pattern: <a href="http(s)://..."
+# Kept as a regex on purpose: the engine scans for the literal '<a' prefix
+# in C, and a hand-written str.find loop over the tags measured slower on
+# real pages even with only a handful of links per page.
+_EXTERNAL_LINK_RE = re.compile(r'<a\s+([^>]*href=["\']?(https?://[^"\'>\s]+)["\']?[^>]*?)>')
+
+
+def _mark_external_link(match) -> str:
+    """Add rel (and opt-in target) attributes to one matched <a> tag"""
+    full_tag = match.group(0)
+    href = match.group(1)
+    
+    # Skip internal links
+    if href.startswith('/'):
+        return full_tag
+    
+    # Always add rel for security
+    if 'rel=' not in full_tag:
+        full_tag = full_tag.replace('>', ' rel="noopener noreferrer">', 1)
+    
+    # Only add target if opt-in (data-newtab or class="ext")
+    if 'data-newtab' in full_tag or 'class="ext"' in full_tag or "class='ext'" in full_tag:
+        if 'target=' not in full_tag:
+            full_tag = full_tag.replace('>', ' target="_blank">', 1)
+    
+    return full_tag
 
 
 def process_external_links(html: str) -> str:
@@ -2859,30 +3166,11 @@ def process_external_links(html: str) -> str:
     Only adds target='_blank' if link has data-newtab attribute or 'ext' class
     Always adds rel='noopener noreferrer' for security
     """
-    import re
+    # Pages without any absolute URL can't match; skip the regex entirely
+    if 'http' not in html:
+        return html
     
-    def replace_link(match):
-        full_tag = match.group(0)
-        href = match.group(1)
-        
-        # Skip internal links
-        if href.startswith('/'):
-            return full_tag
-        
-        # Always add rel for security
-        if 'rel=' not in full_tag:
-            full_tag = full_tag.replace('>', ' rel="noopener noreferrer">', 1)
-        
-        # Only add target if opt-in (data-newtab or class="ext")
-        if 'data-newtab' in full_tag or 'class="ext"' in full_tag or "class='ext'" in full_tag:
-            if 'target=' not in full_tag:
-                full_tag = full_tag.replace('>', ' target="_blank">', 1)
-        
-        return full_tag
-    
-    # Pattern: <a href="http(s)://..."
-    pattern = r'<a\s+([^>]*href=["\']?(https?://[^"\'>\s]+)["\']?[^>]*?)>'
-    return re.sub(pattern, lambda m: replace_link(m), html)
+    return _EXTERNAL_LINK_RE.sub(_mark_external_link, html)
 
 
 def format_bytes(bytes_size: int) -> str:
@@ -2895,34 +3183,62 @@ def format_bytes(bytes_size: int) -> str:
         return f"{bytes_size / (1024 * 1024):.2f}MB"
 
 
-def render_header(config: Dict, templates_path: Path = None) -> str:
-    """Render header partial template from HTML file"""
+# Markers the dev server fills in on every page; split() keeps them as tokens
+_LIVE_PAGE_MARKERS_RE = re.compile(rb'(__PAGE_SIZE__|</body>)')
+
+
+def _write_with_size(path: Path, html: str):
+    """Write a page, filling its __PAGE_SIZE__ placeholder with the encoded size"""
+    buf = html.encode('utf-8')
+    _write(path, buf.replace(b'__PAGE_SIZE__', format_bytes(len(buf)).encode('utf-8')))
+
+
+# Static navigation for the fallback header, used when partials/header.html
+# can't be rendered
+_FALLBACK_NAV_HTML = """    <nav role="navigation" aria-label="Main navigation">
+        <a href="/">Home</a>
+        <a href="/posts/">Posts</a>
+        <a href="/projects/">Projects</a>
+        <a href="/products/">Products</a>
+        <a href="/pages/manifesto/">Manifesto</a>
+        <a href="/pages/about/">About</a>
+        <a href="/pages/contact/">Contact</a>
+        <a href="/cart/">Cart <span class="cart-count">0</span></a>
+    </nav>"""
+
+
+@functools.lru_cache(maxsize=32)
+def _render_partial(templates_dir: str, name: str, mtime_ns: int, context: tuple) -> str:
+    """Render a header/footer partial; every page of a build shares the result
+    
+    mtime_ns only keys the cache, so an edited partial (e.g. under 'gang
+    serve') is rendered afresh. context is a tuple of (name, value) pairs.
+    """
     from jinja2 import Environment, FileSystemLoader
     
+    env = Environment(loader=FileSystemLoader(templates_dir))
+    return env.get_template(name).render(dict(context))
+
+
+def render_header(config: Dict, templates_path: Path = None) -> str:
+    """Render header partial template from HTML file"""
     if templates_path is None:
         # Default to templates directory relative to project root
         templates_path = Path(__file__).parent.parent.parent / 'templates'
     
     try:
-        env = Environment(loader=FileSystemLoader(str(templates_path)))
-        template = env.get_template('partials/header.html')
-        return template.render(site_title=config['site']['title'])
+        return _render_partial(
+            str(templates_path), 'partials/header.html',
+            (templates_path / 'partials' / 'header.html').stat().st_mtime_ns,
+            (('site_title', config['site']['title']),)
+        )
     except Exception as e:
         # Fallback to simple header if template fails
         return f"""<header role="banner">
     <a href="/" style="text-decoration: none; color: inherit;">
         <strong>{config['site']['title']}</strong>
     </a>
-    <nav role="navigation" aria-label="Main navigation">
-        <a href="/">Home</a>
-        <a href="/posts/">Posts</a>
-        <a href="/projects/">Projects</a>
-        <a href="/products/">Products</a>
-        <a href="/pages/manifesto/">Manifesto</a>
-        <a href="/pages/about/">About</a>
-        <a href="/pages/contact/">Contact</a>
-        <a href="/cart/">Cart <span class="cart-count">0</span></a>
-    </nav>
+{_FALLBACK_NAV_HTML}
 </header>"""
 
 
@@ -2930,9 +3246,6 @@ def render_footer(config: Dict, year: int = None, page_size: str = None, build_t
                   build_time_iso: str = None, lighthouse_scores: bool = True, 
                   description: str = None, templates_path: Path = None) -> str:
     """Render footer partial template from HTML file"""
-    from jinja2 import Environment, FileSystemLoader
-    from datetime import datetime
-    
     if templates_path is None:
         # Default to templates directory relative to project root
         templates_path = Path(__file__).parent.parent.parent / 'templates'
@@ -2941,16 +3254,18 @@ def render_footer(config: Dict, year: int = None, page_size: str = None, build_t
         year = datetime.now().year
     
     try:
-        env = Environment(loader=FileSystemLoader(str(templates_path)))
-        template = env.get_template('partials/footer.html')
-        return template.render(
-            site_title=config['site']['title'],
-            year=year,
-            page_size=page_size,
-            build_time=build_time,
-            build_time_iso=build_time_iso,
-            lighthouse_scores=lighthouse_scores,
-            description=description
+        return _render_partial(
+            str(templates_path), 'partials/footer.html',
+            (templates_path / 'partials' / 'footer.html').stat().st_mtime_ns,
+            (
+                ('site_title', config['site']['title']),
+                ('year', year),
+                ('page_size', page_size),
+                ('build_time', build_time),
+                ('build_time_iso', build_time_iso),
+                ('lighthouse_scores', lighthouse_scores),
+                ('description', description),
+            )
         )
     except Exception as e:
         # Fallback to simple footer if template fails
@@ -2961,12 +3276,9 @@ def render_footer(config: Dict, year: int = None, page_size: str = None, build_t
         return f"<footer>{footer_text}</footer>"
 
 
-def create_index_simple(config: Dict, recent_posts: List, templates_path: Path = None) -> str:
+def create_index_simple(config: Dict, recent_posts: List, templates_path: Path = None,
+                        build_time: datetime = None) -> str:
     """Create simple index page"""
-    posts_html = ""
-    for post in recent_posts:
-        posts_html += f'<li><a href="{post["url"]}">{post["title"]}</a></li>\n'
-    
     # Create JSON-LD structured data
     jsonld = {
         "@context": "https://schema.org",
@@ -2975,11 +3287,11 @@ def create_index_simple(config: Dict, recent_posts: List, templates_path: Path =
         "description": config['site']['description'],
         "url": config['site']['url']
     }
-    import json
-    jsonld_str = json.dumps(jsonld, indent=2)
+    jsonld_str = _json_bytes(jsonld, indent=True).decode('utf-8')
     
     # Build timestamp
-    build_time = datetime.now()
+    if build_time is None:
+        build_time = datetime.now()
     build_time_formatted = build_time.strftime('%B %d, %Y at %I:%M %p')
     build_time_iso = build_time.isoformat()
     
@@ -2987,7 +3299,7 @@ def create_index_simple(config: Dict, recent_posts: List, templates_path: Path =
     header_html = render_header(config, templates_path)
     footer_html = render_footer(
         config,
-        year=datetime.now().year,
+        year=build_time.year,
         page_size=None,  # Will be replaced with __PAGE_SIZE__ placeholder
         build_time=build_time_formatted,
         build_time_iso=build_time_iso,
@@ -2996,55 +3308,19 @@ def create_index_simple(config: Dict, recent_posts: List, templates_path: Path =
         templates_path=templates_path
     )
     
-    html = f"""<!DOCTYPE html>
-<html lang="{config['site']['language']}">
-<head>
-    <meta charset="UTF-8">
-    <meta name="viewport" content="width=device-width, initial-scale=1.0">
-    <meta http-equiv="Content-Security-Policy" content="default-src 'none'; script-src 'unsafe-inline'; style-src 'self' 'unsafe-inline'; img-src 'self' https: data:; font-src 'self'; connect-src 'self' http://localhost:8000; base-uri 'self'; form-action 'self' https:;">
-    <title>{config['site']['title']}</title>
-    <meta name="description" content="{config['site']['description']}">
-    <script type="application/ld+json">
-{jsonld_str}
-    </script>
-    <link rel="stylesheet" href="/assets/style.css">
-    <style>
-        /* Page-specific: unstyled list */
-        ul {{
-            list-style: none;
-        }}
-    </style>
-</head>
-<body>
-    {header_html}
-    <main>
-        <h1>{config['site']['title']}</h1>
-        <p>{config['site']['description']}</p>
-        
-        <h2>Latest Posts</h2>
-        <ul  class="unstyled">
-            {posts_html}
-        </ul>
-        <p><a href="/posts/">View all posts →</a></p>
-    </main>
-    {footer_html}
-</body>
-</html>"""
-    
-    return html
+    return _jinja_env(_BUNDLED_TEMPLATES_DIR).get_template('simple-index.html').render(
+        config=config,
+        posts=recent_posts,
+        jsonld_str=jsonld_str,
+        header_html=header_html,
+        footer_html=footer_html
+    )
 
 
-def create_list_page_simple(config: Dict, items: List, title: str, templates_path: Path = None) -> str:
+def create_list_page_simple(config: Dict, items: List, title: str, templates_path: Path = None,
+                            build_time: datetime = None) -> str:
     """Create simple list page"""
-    items_html = ""
-    for item in items:
-        items_html += f'<li><a href="{item["url"]}">{item["title"]}</a>'
-        if item.get('summary'):
-            items_html += f'<p>{item["summary"]}</p>'
-        items_html += '</li>\n'
-    
     # Create JSON-LD structured data
-    import json
     jsonld = {
         "@context": "https://schema.org",
         "@type": "CollectionPage",
@@ -3052,10 +3328,11 @@ def create_list_page_simple(config: Dict, items: List, title: str, templates_pat
         "description": config['site']['description'],
         "url": config['site']['url']
     }
-    jsonld_str = json.dumps(jsonld, indent=2)
+    jsonld_str = _json_bytes(jsonld, indent=True).decode('utf-8')
     
     # Build timestamp
-    build_time = datetime.now()
+    if build_time is None:
+        build_time = datetime.now()
     build_time_formatted = build_time.strftime('%B %d, %Y at %I:%M %p')
     build_time_iso = build_time.isoformat()
     
@@ -3063,7 +3340,7 @@ def create_list_page_simple(config: Dict, items: List, title: str, templates_pat
     header_html = render_header(config, templates_path)
     footer_html = render_footer(
         config,
-        year=datetime.now().year,
+        year=build_time.year,
         page_size=None,  # Will be replaced with __PAGE_SIZE__ placeholder
         build_time=build_time_formatted,
         build_time_iso=build_time_iso,
@@ -3072,45 +3349,21 @@ def create_list_page_simple(config: Dict, items: List, title: str, templates_pat
         templates_path=templates_path
     )
     
-    html = f"""<!DOCTYPE html>
-<html lang="{config['site']['language']}">
-<head>
-    <meta charset="UTF-8">
-    <meta name="viewport" content="width=device-width, initial-scale=1.0">
-    <meta http-equiv="Content-Security-Policy" content="default-src 'none'; script-src 'unsafe-inline'; style-src 'self' 'unsafe-inline'; img-src 'self' https: data:; font-src 'self'; connect-src 'self' http://localhost:8000; base-uri 'self'; form-action 'self' https:;">
-    <title>{title} - {config['site']['title']}</title>
-    <meta name="description" content="{config['site']['description']}">
-    <script type="application/ld+json">
-{jsonld_str}
-    </script>
-    <link rel="stylesheet" href="/assets/style.css">
-    <style>
-        /* Page-specific: unstyled list */
-        ul {{
-            list-style: none;
-        }}
-        li {{
-            margin-bottom: 1.5rem;
-        }}
-    </style>
-</head>
-<body>
-    {header_html}
-    <main>
-        <h1>{title}</h1>
-        <ul>
-            {items_html}
-        </ul>
-    </main>
-    {footer_html}
-</body>
-</html>"""
-    
-    return html
+    return _jinja_env(_BUNDLED_TEMPLATES_DIR).get_template('simple-list.html').render(
+        config=config,
+        items=items,
+        title=title,
+        jsonld_str=jsonld_str,
+        header_html=header_html,
+        footer_html=footer_html
+    )
 
 
-def process_markdown(md_file: Path, content_type: str, config: Dict) -> str:
+def process_markdown(md_file: Path, content_type: str, config: Dict,
+                     build_time: datetime = None) -> str:
     """Process a markdown file into HTML"""
+    import markdown
+    
     content = md_file.read_text()
     
     # Parse frontmatter
@@ -3129,11 +3382,12 @@ def process_markdown(md_file: Path, content_type: str, config: Dict) -> str:
     # Process external links to open in new tabs
     body_html = process_external_links(body_html)
     
-    title = frontmatter.get('title', md_file.stem.replace('-', ' ').title())
+    title = _display_title(frontmatter, md_file.stem)
     description = frontmatter.get('summary', config['site']['description'])
     
     # Build time for footer
-    build_time = datetime.now()
+    if build_time is None:
+        build_time = datetime.now()
     build_time_formatted = build_time.strftime('%B %d, %Y at %I:%M %p')
     build_time_iso = build_time.isoformat()
     
@@ -3141,426 +3395,65 @@ def process_markdown(md_file: Path, content_type: str, config: Dict) -> str:
     header_html = render_header(config)
     
     # Build HTML page
-    page_html = f"""<!DOCTYPE html>
-<html lang="{config['site']['language']}">
-<head>
-    <meta charset="UTF-8">
-    <meta name="viewport" content="width=device-width, initial-scale=1.0">
-    <meta http-equiv="Content-Security-Policy" content="default-src 'none'; script-src 'unsafe-inline'; style-src 'unsafe-inline'; img-src 'self' data:; font-src 'self'; base-uri 'self'; form-action 'self';">
-    <title>{title} - {config['site']['title']}</title>
-    <meta name="description" content="{description}">
-    <style>
-        :root {{
-            --max-width: 65ch;
-            --spacing: 1.5rem;
-        }}
-        * {{
-            margin: 0;
-            padding: 0;
-            box-sizing: border-box;
-        }}
-        body {{
-            font-family: system-ui, -apple-system, sans-serif;
-            line-height: 1.6;
-            color: #1a1a1a;
-            background: #ffffff;
-            padding: var(--spacing);
-        }}
-        header, main, footer {{
-            max-width: var(--max-width);
-            margin: 0 auto;
-        }}
-        header {{
-            padding-bottom: var(--spacing);
-            border-bottom: 1px solid #e0e0e0;
-            margin-bottom: var(--spacing);
-        }}
-        nav {{
-            margin-top: 1rem;
-        }}
-        nav a {{
-            margin-right: 1rem;
-            color: #0052a3;
-            text-decoration: underline;
-            text-decoration-thickness: 1px;
-            text-underline-offset: 2px;
-        }}
-        nav a:hover {{
-            text-decoration-thickness: 2px;
-        }}
-        h1 {{
-            font-size: 2rem;
-            margin-bottom: 1rem;
-        }}
-        h2 {{
-            font-size: 1.5rem;
-            margin-top: 2rem;
-            margin-bottom: 1rem;
-        }}
-        h3 {{
-            font-size: 1.25rem;
-            margin-top: 1.5rem;
-            margin-bottom: 0.75rem;
-        }}
-        p, ul, ol {{
-            margin-bottom: 1rem;
-        }}
-        ul, ol {{
-            margin-left: 1.5rem;
-        }}
-        code {{
-            background: #f5f5f5;
-            padding: 0.2em 0.4em;
-            border-radius: 3px;
-            font-size: 0.9em;
-        }}
-        pre {{
-            background: #f5f5f5;
-            padding: 1rem;
-            border-radius: 5px;
-            overflow-x: auto;
-            margin-bottom: 1rem;
-        }}
-        pre code {{
-            background: none;
-            padding: 0;
-        }}
-        footer {{
-            margin-top: 3rem;
-            padding-top: var(--spacing);
-            border-top: 1px solid #e0e0e0;
-            color: #595959;
-            font-size: 0.9rem;
-        }}
-        .lighthouse-scores {{
-            margin-top: 0.5rem;
-            display: flex;
-            gap: 1rem;
-            flex-wrap: wrap;
-            font-size: 0.85rem;
-        }}
-        .lighthouse-scores .score {{
-            display: inline-flex;
-            align-items: center;
-            gap: 0.25rem;
-        }}
-        .lighthouse-scores strong {{
-            font-weight: 600;
-            color: #1a1a1a;
-        }}
-        .last-updated {{
-            margin-top: 0.5rem;
-            font-size: 0.8rem;
-            opacity: 0.8;
-        }}
-        .last-updated time {{
-            font-style: italic;
-        }}
-    </style>
-</head>
-<body>
-    {header_html}
-    <main>
-        <article>
-            {body_html}
-        </article>
-    </main>
-    <footer>
-        <p>&copy; {datetime.now().year} {config['site']['title']}. Built with GANG. __PAGE_SIZE__</p>
-        <p class="lighthouse-scores">
-            <span class="score" title="Performance">Performance <strong>100</strong></span>
-            <span class="score" title="Accessibility">Accessibility <strong>100</strong></span>
-            <span class="score" title="Best Practices">Best Practices <strong>100</strong></span>
-            <span class="score" title="SEO">Score <strong>100</strong></span>
-        </p>
-        <p class="last-updated">
-            <time datetime="{build_time_iso}">Last updated: {build_time_formatted}</time>
-        </p>
-    </footer>
-</body>
-</html>"""
-    
-    return page_html
+    return _jinja_env(_BUNDLED_TEMPLATES_DIR).get_template('fallback-page.html').render(
+        config=config,
+        title=title,
+        description=description,
+        header_html=header_html,
+        body_html=body_html,
+        year=build_time.year,
+        build_time_iso=build_time_iso,
+        build_time_formatted=build_time_formatted
+    )
 
 
-def create_index(config: Dict, posts: List, projects: List) -> str:
+def create_index(config: Dict, posts: List, projects: List, year: int = None) -> str:
     """Create the homepage"""
-    posts_links = '\n'.join([f'<li><a href="/posts/{slug}/">{slug.replace("-", " ").title()}</a></li>' 
-                              for slug, _ in posts[:5]])
-    
     # Render header
     header_html = render_header(config)
     
-    html = f"""<!DOCTYPE html>
-<html lang="{config['site']['language']}">
-<head>
-    <meta charset="UTF-8">
-    <meta name="viewport" content="width=device-width, initial-scale=1.0">
-    <title>{config['site']['title']}</title>
-    <meta name="description" content="{config['site']['description']}">
-    <style>
-        :root {{
-            --max-width: 65ch;
-            --spacing: 1.5rem;
-        }}
-        * {{
-            margin: 0;
-            padding: 0;
-            box-sizing: border-box;
-        }}
-        body {{
-            font-family: system-ui, -apple-system, sans-serif;
-            line-height: 1.6;
-            color: #1a1a1a;
-            background: #ffffff;
-            padding: var(--spacing);
-        }}
-        header, main, footer {{
-            max-width: var(--max-width);
-            margin: 0 auto;
-        }}
-        header {{
-            padding-bottom: var(--spacing);
-            border-bottom: 1px solid #e0e0e0;
-            margin-bottom: var(--spacing);
-        }}
-        nav {{
-            margin-top: 1rem;
-        }}
-        nav a {{
-            margin-right: 1rem;
-            color: #0052a3;
-            text-decoration: underline;
-            text-decoration-thickness: 1px;
-            text-underline-offset: 2px;
-        }}
-        nav a:hover {{
-            text-decoration-thickness: 2px;
-        }}
-        h1 {{
-            font-size: 2.5rem;
-            margin-bottom: 1rem;
-        }}
-        h2 {{
-            font-size: 1.5rem;
-            margin-top: 2rem;
-            margin-bottom: 1rem;
-        }}
-        ul {{
-            list-style: none;
-            padding: 0;
-        }}
-        li {{
-            margin-bottom: 0.5rem;
-        }}
-        a {{
-            color: #0052a3;
-            text-decoration: underline;
-            text-decoration-thickness: 1px;
-            text-underline-offset: 2px;
-        }}
-        a:hover {{
-            text-decoration-thickness: 2px;
-        }}
-        footer {{
-            margin-top: 3rem;
-            padding-top: var(--spacing);
-            border-top: 1px solid #e0e0e0;
-            color: #595959;
-            font-size: 0.9rem;
-        }}
-        .lighthouse-scores {{
-            margin-top: 0.5rem;
-            display: flex;
-            gap: 1rem;
-            flex-wrap: wrap;
-            font-size: 0.85rem;
-        }}
-        .lighthouse-scores .score {{
-            display: inline-flex;
-            align-items: center;
-            gap: 0.25rem;
-        }}
-        .lighthouse-scores strong {{
-            font-weight: 600;
-            color: #1a1a1a;
-        }}
-        .last-updated {{
-            margin-top: 0.5rem;
-            font-size: 0.8rem;
-            opacity: 0.8;
-        }}
-        .last-updated time {{
-            font-style: italic;
-        }}
-    </style>
-</head>
-<body>
-    {header_html}
-    <main>
-        <h1>{config['site']['title']}</h1>
-        <p>{config['site']['description']}</p>
-        
-        <h2>Latest Posts</h2>
-        <ul  class="unstyled">>
-            {posts_links}
-        </ul>
-        <p><a href="/posts/">View all posts →</a></p>
-    </main>
-    <footer>
-        <p>&copy; {datetime.now().year} {config['site']['title']}. Built with GANG.</p>
-    </footer>
-</body>
-</html>"""
-    
-    return html
+    return _jinja_env(_BUNDLED_TEMPLATES_DIR).get_template('fallback-index.html').render(
+        config=config,
+        description=config['site']['description'],
+        header_html=header_html,
+        posts=posts[:5],
+        year=year or datetime.now().year
+    )
 
 
-def create_list_page(config: Dict, items: List, title: str) -> str:
+def create_list_page(config: Dict, items: List, title: str, year: int = None) -> str:
     """Create a list page for posts or projects"""
-    items_links = '\n'.join([f'<li><a href="/{title.lower()}/{slug}/">{slug.replace("-", " ").title()}</a></li>' 
-                              for slug, _ in items])
-    
     # Render header
     header_html = render_header(config)
     
-    html = f"""<!DOCTYPE html>
-<html lang="{config['site']['language']}">
-<head>
-    <meta charset="UTF-8">
-    <meta name="viewport" content="width=device-width, initial-scale=1.0">
-    <title>{title} - {config['site']['title']}</title>
-    <meta name="description" content="{config['site']['description']}">
-    <style>
-        :root {{
-            --max-width: 65ch;
-            --spacing: 1.5rem;
-        }}
-        * {{
-            margin: 0;
-            padding: 0;
-            box-sizing: border-box;
-        }}
-        body {{
-            font-family: system-ui, -apple-system, sans-serif;
-            line-height: 1.6;
-            color: #1a1a1a;
-            background: #ffffff;
-            padding: var(--spacing);
-        }}
-        header, main, footer {{
-            max-width: var(--max-width);
-            margin: 0 auto;
-        }}
-        header {{
-            padding-bottom: var(--spacing);
-            border-bottom: 1px solid #e0e0e0;
-            margin-bottom: var(--spacing);
-        }}
-        nav {{
-            margin-top: 1rem;
-        }}
-        nav a {{
-            margin-right: 1rem;
-            color: #0052a3;
-            text-decoration: underline;
-            text-decoration-thickness: 1px;
-            text-underline-offset: 2px;
-        }}
-        nav a:hover {{
-            text-decoration-thickness: 2px;
-        }}
-        h1 {{
-            font-size: 2rem;
-            margin-bottom: 1.5rem;
-        }}
-        ul {{
-            list-style: none;
-            padding: 0;
-        }}
-        li {{
-            margin-bottom: 0.75rem;
-        }}
-        a {{
-            color: #0052a3;
-            text-decoration: underline;
-            text-decoration-thickness: 1px;
-            text-underline-offset: 2px;
-        }}
-        a:hover {{
-            text-decoration-thickness: 2px;
-        }}
-        footer {{
-            margin-top: 3rem;
-            padding-top: var(--spacing);
-            border-top: 1px solid #e0e0e0;
-            color: #595959;
-            font-size: 0.9rem;
-        }}
-        .lighthouse-scores {{
-            margin-top: 0.5rem;
-            display: flex;
-            gap: 1rem;
-            flex-wrap: wrap;
-            font-size: 0.85rem;
-        }}
-        .lighthouse-scores .score {{
-            display: inline-flex;
-            align-items: center;
-            gap: 0.25rem;
-        }}
-        .lighthouse-scores strong {{
-            font-weight: 600;
-            color: #1a1a1a;
-        }}
-        .last-updated {{
-            margin-top: 0.5rem;
-            font-size: 0.8rem;
-            opacity: 0.8;
-        }}
-        .last-updated time {{
-            font-style: italic;
-        }}
-    </style>
-</head>
-<body>
-    {header_html}
-    <main>
-        <h1>{title}</h1>
-        <ul>
-            {items_links}
-        </ul>
-    </main>
-    <footer>
-        <p>&copy; {datetime.now().year} {config['site']['title']}. Built with GANG.</p>
-    </footer>
-</body>
-</html>"""
-    
-    return html
+    return _jinja_env(_BUNDLED_TEMPLATES_DIR).get_template('fallback-list.html').render(
+        config=config,
+        title=title,
+        section=title.lower(),
+        description=config['site']['description'],
+        header_html=header_html,
+        items=items,
+        year=year or datetime.now().year
+    )
 
 @cli.command()
 @click.option('--output', '-o', type=click.Path(), help='Output JSON report to file')
+@click.option('--jobs', '-j', type=int, default=os.cpu_count() or 1, show_default=True, help='Worker processes for validating pages (1 = sequential)')
 @click.pass_context
-def check(ctx, output):
+def check(ctx, output, jobs):
     """Validate Template Contracts and WCAG compliance"""
-    try:
-        from core.validator import ContractValidator
-    except ImportError:
-        import sys
-        sys.path.insert(0, str(Path(__file__).parent))
-        from core.validator import ContractValidator
+    from core.validator import ContractValidator
     
     click.echo("✅ Validating contracts...")
     config = ctx.obj
     validator = ContractValidator(config)
     
-    dist_path = Path(config['build']['output'])
+    dist_path = config['_dist_path']
     if not dist_path.exists():
         click.echo("Error: dist/ directory not found. Run 'gang build' first.", err=True)
         return
     
-    results = validator.validate_directory(dist_path)
+    results = validator.validate_directory(dist_path, jobs=jobs)
     
     # Print summary
     summary = results['summary']
@@ -3587,8 +3480,7 @@ def check(ctx, output):
     # Save JSON report if requested
     if output:
         output_path = Path(output)
-        with open(output_path, 'w') as f:
-            json.dump(results, f, indent=2)
+        _write_json(output_path, results)
         click.echo(f"\n📄 Report saved to {output_path}")
     
     # Exit with error code if validation failed
@@ -3597,38 +3489,71 @@ def check(ctx, output):
 
 @cli.command()
 @click.option('--output', '-o', type=click.Path(), help='Output JSON report to file')
+@click.option('--jobs', '-j', type=int, default=max(1, (os.cpu_count() or 2) // 2), show_default=True, help='Pages to audit in parallel (each runs its own Chrome). Every built page is audited, 3 runs each; maxAutodiscoverUrls in lighthouserc.json does not apply')
 @click.pass_context
-def audit(ctx, output):
+def audit(ctx, output, jobs):
     """Run Lighthouse + axe audits (auto-discovers all pages)"""
     import subprocess
-    from pathlib import Path
     
     config = ctx.obj
-    dist_path = Path(config['build']['output'])
+    dist_path = config['_dist_path']
     
     if not dist_path.exists():
         click.echo("❌ Error: dist/ directory not found. Run 'gang build' first.", err=True)
         ctx.exit(1)
     
-    # Check if Lighthouse CI is available
-    try:
-        subprocess.run(['npx', '--version'], capture_output=True, check=True)
-    except (subprocess.CalledProcessError, FileNotFoundError):
+    # Check if Lighthouse CI is available (a PATH lookup, no Node start-up)
+    if shutil.which('npx') is None:
         click.echo("❌ Error: npx not found. Install Node.js to run Lighthouse audits.", err=True)
         ctx.exit(1)
     
-    # Count pages
-    page_count = len(list(dist_path.rglob('index.html')))
-    click.echo(f"📊 Running audits on {page_count} pages...")
-    click.echo("🔦 Lighthouse CI will auto-discover all pages in dist/")
+    # Discover pages; each is served from staticDistDir by its own collect run
+    urls = []
+    for index_file in sorted(_scan_files(dist_path, 'index.html'.__eq__, recursive=True)):
+        rel = index_file.parent.relative_to(dist_path)
+        urls.append(f"/{rel.as_posix()}/" if rel.parts else '/')
+    jobs = max(1, min(jobs, len(urls)))
+    click.echo(f"📊 Running audits on {len(urls)} pages ({jobs} at a time)...")
     click.echo("   (3 runs per page, this may take a few minutes)\n")
     
+    lhci = ['npx', '--yes', '@lhci/cli@0.13.x']
+    
     try:
-        # Run Lighthouse CI with autorun (uses staticDistDir from config)
-        result = subprocess.run(
-            ['npx', '--yes', '@lhci/cli@0.13.x', 'autorun'],
-            text=True
-        )
+        # Lighthouse runs are dominated by headless Chrome, so pages are
+        # collected concurrently into the shared .lighthouseci directory
+        # (--additive) and asserted once at the end, as autorun would
+        shutil.rmtree('.lighthouseci', ignore_errors=True)
+        failed_urls = []
+        executor = ThreadPoolExecutor(max_workers=jobs)
+        try:
+            futures = {
+                executor.submit(
+                    subprocess.run, lhci + ['collect', '--additive', f'--url={url}'],
+                    capture_output=True, text=True
+                ): url
+                for url in urls
+            }
+            for future in as_completed(futures):
+                url = futures[future]
+                collected = future.result()
+                if collected.returncode == 0:
+                    click.echo(f"  ✓ {url}")
+                else:
+                    failed_urls.append(url)
+                    click.echo(f"  ✗ {url}")
+                    click.echo(collected.stderr.strip() or collected.stdout.strip(), err=True)
+        except KeyboardInterrupt:
+            # Drop the queued pages; running collects get the SIGINT as well
+            executor.shutdown(wait=False, cancel_futures=True)
+            raise
+        executor.shutdown()
+        
+        if failed_urls:
+            click.echo(f"\n❌ Lighthouse could not collect {len(failed_urls)} page(s)")
+            ctx.exit(1)
+        
+        result = subprocess.run(lhci + ['assert'], text=True)
+        subprocess.run(lhci + ['upload'], text=True)
         
         # Check thresholds from config
         thresholds = config.get('lighthouse', {})
@@ -3654,6 +3579,69 @@ def audit(ctx, output):
         click.echo("\n⚠️  Audit interrupted")
         ctx.exit(1)
 
+def _outdated_distributions(max_workers: int = 16) -> Optional[List[tuple]]:
+    """(name, installed, latest) for installed distributions with a newer PyPI release
+    
+    Installed versions come from importlib.metadata in-process rather than a
+    pip subprocess, and the PyPI JSON lookups run concurrently. Returns None
+    when the check can't match pip: without `packaging` to order versions, or
+    when PIP_INDEX_URL / PIP_EXTRA_INDEX_URL point pip at another index.
+    """
+    if os.environ.get('PIP_INDEX_URL') or os.environ.get('PIP_EXTRA_INDEX_URL'):
+        return None
+    try:
+        from packaging.version import Version, InvalidVersion
+    except ImportError:
+        return None
+    import requests
+    from importlib.metadata import distributions
+    
+    installed = {}
+    for dist in distributions():
+        name = dist.metadata['Name']
+        if name:
+            installed.setdefault(name, dist.version)
+    
+    session = requests.Session()
+    
+    def latest_release(name):
+        try:
+            response = session.get(f'https://pypi.org/pypi/{name}/json', timeout=10)
+            if response.status_code != 200:
+                return None
+            return response.json()['info']['version']
+        except (requests.exceptions.RequestException, ValueError, KeyError):
+            return None
+    
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        latest_versions = list(executor.map(latest_release, installed))
+    
+    outdated = []
+    for (name, version), latest in zip(installed.items(), latest_versions):
+        if latest is None or latest == version:
+            continue
+        try:
+            if Version(latest) <= Version(version):
+                continue
+        except InvalidVersion:
+            pass
+        outdated.append((name, version, latest))
+    
+    return sorted(outdated, key=lambda row: row[0].lower())
+
+
+def _format_columns(header: tuple, rows: List[tuple]) -> str:
+    """Left-aligned columns with a dashed rule under the header, as pip prints them"""
+    if not rows:
+        return ''
+    widths = [max(len(str(row[i])) for row in [header, *rows]) for i in range(len(header))]
+    lines = [header, tuple('-' * width for width in widths), *rows]
+    return '\n'.join(
+        ' '.join(str(cell).ljust(width) for cell, width in zip(line, widths)).rstrip()
+        for line in lines
+    )
+
+
 @cli.command('update-deps')
 @click.option('--check-only', is_flag=True, help='Only check for updates, do not install')
 @click.option('--security-only', is_flag=True, help='Only update packages with security issues')
@@ -3667,10 +3655,8 @@ def update_deps(ctx, check_only, security_only):
     # Check if pip-audit is available for security checks
     has_pip_audit = False
     if security_only:
-        try:
-            subprocess.run(['pip-audit', '--version'], capture_output=True, check=True)
-            has_pip_audit = True
-        except (subprocess.CalledProcessError, FileNotFoundError):
+        has_pip_audit = shutil.which('pip-audit') is not None
+        if not has_pip_audit:
             click.echo("⚠️  pip-audit not found. Install with: pip install pip-audit")
             click.echo("    Falling back to regular update check.\n")
     
@@ -3690,16 +3676,24 @@ def update_deps(ctx, check_only, security_only):
             click.echo("✅ No security vulnerabilities found.")
         return
     
-    # Check for outdated packages
+    # Check for outdated packages. uv queries the index for all packages
+    # concurrently; without it the same check runs in-process rather than
+    # starting pip, which would look packages up one at a time. pip is
+    # still used when the in-process check can't give the same answer.
     click.echo("📦 Checking Python packages...")
-    result = subprocess.run(
-        ['pip', 'list', '--outdated', '--format=columns'],
-        capture_output=True,
-        text=True
-    )
+    outdated = None
+    if shutil.which('uv'):
+        list_outdated = ['uv', 'pip', 'list', '--outdated', '--format=columns', '--python', sys.executable]
+    else:
+        list_outdated = [sys.executable, '-m', 'pip', 'list', '--outdated', '--format=columns']
+        outdated = _outdated_distributions()
+    if outdated is not None:
+        outdated_report = _format_columns(('Package', 'Version', 'Latest'), outdated)
+    else:
+        outdated_report = subprocess.run(list_outdated, capture_output=True, text=True).stdout
     
-    if result.stdout.strip():
-        click.echo(result.stdout)
+    if outdated_report.strip():
+        click.echo(outdated_report)
         
         if not check_only:
             if click.confirm('\n📥 Update all dependencies in requirements.txt?'):
@@ -3719,23 +3713,19 @@ def update_deps(ctx, check_only, security_only):
 @click.argument('source_dir', type=click.Path(exists=True))
 @click.option('--output', '-o', type=click.Path(), help='Output directory for processed images')
 @click.option('--analyze', is_flag=True, help='Analyze image usage in content')
+@click.option('--jobs', '-j', type=int, default=os.cpu_count() or 1, show_default=True, help='Worker processes for image encoding (1 = sequential)')
 @click.option('--check-alt', is_flag=True, help='Check for missing alt text')
 @click.pass_context
-def image(ctx, source_dir, output, analyze, check_alt):
+def image(ctx, source_dir, output, analyze, check_alt, jobs):
     """Process images to responsive formats and validate usage"""
-    try:
-        from core.images import ImageProcessor
-    except ImportError:
-        import sys
-        sys.path.insert(0, str(Path(__file__).parent))
-        from core.images import ImageProcessor
+    from core.images import ImageProcessor
     
     config = ctx.obj
     processor = ImageProcessor(config)
     
     # If analyze or check-alt mode
     if analyze or check_alt:
-        content_path = Path(config['build']['content'])
+        content_path = config['_content_path']
         click.echo("Score Analyzing images in content...\n")
         
         total_missing_alt = 0
@@ -3771,9 +3761,9 @@ def image(ctx, source_dir, output, analyze, check_alt):
     # Regular image processing
     click.echo("🖼️  Processing images...")
     source_path = Path(source_dir)
-    output_path = Path(output) if output else Path(config['build']['output']) / 'assets' / 'images'
+    output_path = Path(output) if output else config['_dist_path'] / 'assets' / 'images'
     
-    image_map = processor.process_all_images(source_path, output_path)
+    image_map = processor.process_all_images(source_path, output_path, jobs=jobs)['images']
     
     total_variants = sum(len(variants) for variants in image_map.values())
     click.echo(f"✅ Processed {len(image_map)} images into {total_variants} variants")
@@ -3794,51 +3784,73 @@ def studio(ctx, port, host):
     
     # Import here to avoid dependency issues
     try:
-        from http.server import HTTPServer, SimpleHTTPRequestHandler
-        import json
+        from http.server import SimpleHTTPRequestHandler, ThreadingHTTPServer
         import threading
+        import traceback
+        from core.heading_validator import HeadingValidator
         
         config = ctx.obj
         
+        # Encoded /api/content listing, reused while _dir_signature of the
+        # content tree is unchanged. Held as one (signature, payload) tuple
+        # so handler threads never see a half-updated entry.
+        content_list_cache = {'entry': (None, None)}
+        # studio.html as bytes, re-read only when the file's mtime changes
+        studio_html_cache = {'entry': (None, None)}
+        
         class StudioHandler(SimpleHTTPRequestHandler):
+            # Shared across requests; the redirect manager re-reads
+            # .redirects.json only when another process has changed it
+            _redirect_mgr = RedirectManager(config['_content_path'], config['_dist_path'])
+            _product_agg = ProductAggregator(config)
+            # Requests run on their own threads; slug renames and redirect
+            # changes (and the manager's reloads) go one at a time
+            _write_lock = threading.Lock()
+            
             def log_message(self, format, *args):
                 # Suppress HTTP request logs
                 pass
             
+            def _send_json(self, obj, status: int = 200):
+                """Send obj (or already-encoded JSON bytes) with an exact Content-Length"""
+                payload = obj if isinstance(obj, bytes) else _json_bytes(obj)
+                self.send_response(status)
+                self.send_header('Content-type', 'application/json')
+                self.send_header('Content-Length', str(len(payload)))
+                self.send_header('Access-Control-Allow-Origin', '*')
+                self.end_headers()
+                self.wfile.write(payload)
+            
             def do_GET(self):
                 if self.path == '/api/content':
                     try:
                         # List all content files
-                        content_path = Path(config['build']['content']).resolve()
+                        content_path = config['_content_path'].resolve()
                         files = []
                         
                         click.echo(f"Score Looking for content in: {content_path}")
                         
                         if not content_path.exists():
                             click.echo(f"⚠️  Content directory not found: {content_path}")
-                            self.send_response(200)
-                            self.send_header('Content-type', 'application/json')
-                            self.send_header('Access-Control-Allow-Origin', '*')
-                            self.end_headers()
-                            self.wfile.write(json.dumps([]).encode())
+                            self._send_json(b'[]')
                             return
                         
-                        for md_file in content_path.rglob('*.md'):
-                            files.append({
-                                'path': str(md_file.relative_to(content_path)),
-                                'type': md_file.parent.name,
-                                'name': md_file.stem
-                            })
-                        
-                        click.echo(f"📂 Found {len(files)} content files: {[f['name'] for f in files]}")
+                        signature = _dir_signature(content_path)
+                        cached_signature, payload = content_list_cache['entry']
+                        if signature != cached_signature:
+                            for md_file in _list_md(content_path, recursive=True):
+                                files.append({
+                                    'path': str(md_file.relative_to(content_path)),
+                                    'type': md_file.parent.name,
+                                    'name': md_file.stem
+                                })
+                            
+                            click.echo(f"📂 Found {len(files)} content files: {[f['name'] for f in files]}")
+                            payload = _json_bytes(files)
+                            content_list_cache['entry'] = (signature, payload)
                         
-                        self.send_response(200)
-                        self.send_header('Content-type', 'application/json')
-                        self.send_header('Access-Control-Allow-Origin', '*')
-                        self.end_headers()
-                        self.wfile.write(json.dumps(files).encode())
+                        self._send_json(payload)
                     except Exception as e:
-                        import traceback
                         click.echo(f"❌ Error listing files: {e}")
                         click.echo(traceback.format_exc())
                         self.send_error(500)
@@ -3847,23 +3859,25 @@ def studio(ctx, port, host):
                     try:
                         # Get specific content file
                         file_path = self.path.replace('/api/content/', '')
-                        content_base = Path(config['build']['content']).resolve()
+                        content_base = config['_content_path'].resolve()
                         content_path = content_base / file_path
                         
                         click.echo(f"📖 Reading file: {content_path}")
                         
                         if content_path.exists():
-                            content = content_path.read_text()
-                            self.send_response(200)
-                            self.send_header('Content-type', 'text/plain')
-                            self.send_header('Access-Control-Allow-Origin', '*')
-                            self.end_headers()
-                            self.wfile.write(content.encode())
+                            # Sent as stored, straight from the file to the
+                            # socket (os.sendfile) without decoding it first
+                            with open(content_path, 'rb') as f:
+                                self.send_response(200)
+                                self.send_header('Content-type', 'text/plain')
+                                self.send_header('Content-Length', str(os.fstat(f.fileno()).st_size))
+                                self.send_header('Access-Control-Allow-Origin', '*')
+                                self.end_headers()
+                                self.connection.sendfile(f)
                         else:
                             click.echo(f"❌ File not found: {content_path}")
                             self.send_error(404)
                     except Exception as e:
-                        import traceback
                         click.echo(f"❌ Error reading file: {e}")
                         click.echo(traceback.format_exc())
                         self.send_error(500)
@@ -3874,17 +3888,20 @@ def studio(ctx, port, host):
                         studio_html_path = Path('studio.html').resolve()
                         click.echo(f"🎨 Serving studio from: {studio_html_path}")
                         if studio_html_path.exists():
-                            with open(studio_html_path, 'r') as f:
-                                content = f.read()
+                            mtime = studio_html_path.stat().st_mtime_ns
+                            cached_mtime, content = studio_html_cache['entry']
+                            if mtime != cached_mtime:
+                                content = studio_html_path.read_bytes()
+                                studio_html_cache['entry'] = (mtime, content)
                             self.send_response(200)
                             self.send_header('Content-type', 'text/html')
+                            self.send_header('Content-Length', str(len(content)))
                             self.end_headers()
-                            self.wfile.write(content.encode())
+                            self.wfile.write(content)
                         else:
                             click.echo(f"❌ studio.html not found at: {studio_html_path}")
                             self.send_error(404, "studio.html not found")
                     except Exception as e:
-                        import traceback
                         click.echo(f"❌ Error serving studio: {e}")
                         click.echo(traceback.format_exc())
                         self.send_error(500)
@@ -3898,17 +3915,12 @@ def studio(ctx, port, host):
                     try:
                         # Read request body
                         content_length = int(self.headers['Content-Length'])
-                        body = self.rfile.read(content_length)
-                        data = json.loads(body.decode())
+                        data = _json_loads(self.rfile.read(content_length))
                         
                         content = data.get('content', '')
                         
                         click.echo(f"Score Validating headings in content ({len(content)} chars)")
                         
-                        # Import heading validator
-                        sys.path.insert(0, str(Path(__file__).parent))
-                        from core.heading_validator import HeadingValidator
-                        
                         validator = HeadingValidator()
                         result = validator.validate_markdown(content)
                         
@@ -3918,31 +3930,21 @@ def studio(ctx, port, host):
                         click.echo(f"✅ Validation complete: {'PASS' if result['valid'] else 'FAIL'}")
                         
                         # Return validation result
-                        self.send_response(200)
-                        self.send_header('Content-type', 'application/json')
-                        self.send_header('Access-Control-Allow-Origin', '*')
-                        self.end_headers()
-                        self.wfile.write(json.dumps(result, default=str).encode())
+                        self._send_json(result)
                         
                     except Exception as e:
-                        import traceback
                         click.echo(f"❌ Error validating headings: {e}")
                         click.echo(traceback.format_exc())
-                        self.send_response(500)
-                        self.send_header('Content-type', 'application/json')
-                        self.send_header('Access-Control-Allow-Origin', '*')
-                        self.end_headers()
-                        self.wfile.write(json.dumps({
+                        self._send_json({
                             'error': 'Internal server error',
                             'message': str(e)
-                        }).encode())
+                        }, status=500)
                 
                 elif self.path == '/api/rename-slug':
                     try:
                         # Read request body
                         content_length = int(self.headers['Content-Length'])
-                        body = self.rfile.read(content_length)
-                        data = json.loads(body.decode())
+                        data = _json_loads(self.rfile.read(content_length))
                         
                         old_slug = data.get('old_slug')
                         new_slug = data.get('new_slug')
@@ -3951,100 +3953,68 @@ def studio(ctx, port, host):
                         
                         click.echo(f"🔄 Rename request: {old_slug} → {new_slug} (redirect: {create_redirect})")
                         
-                        # Import redirect manager
-                        sys.path.insert(0, str(Path(__file__).parent))
-                        from core.redirects import RedirectManager
-                        from core.content_importer import SlugChecker
-                        
-                        content_path = Path(config['build']['content'])
-                        dist_path = Path(config['build']['output'])
-                        
-                        # Check old file exists
-                        old_file = content_path / category / f"{old_slug}.md"
-                        if not old_file.exists():
-                            self.send_response(404)
-                            self.send_header('Content-type', 'application/json')
-                            self.send_header('Access-Control-Allow-Origin', '*')
-                            self.end_headers()
-                            self.wfile.write(json.dumps({
-                                'error': 'File not found',
-                                'message': f'File {old_file} does not exist'
-                            }).encode())
-                            return
-                        
-                        # Check new slug is unique
-                        new_file = content_path / category / f"{new_slug}.md"
-                        if new_file.exists():
-                            self.send_response(400)
-                            self.send_header('Content-type', 'application/json')
-                            self.send_header('Access-Control-Allow-Origin', '*')
-                            self.end_headers()
-                            self.wfile.write(json.dumps({
-                                'error': 'Slug already exists',
-                                'message': f'A file with slug "{new_slug}" already exists'
-                            }).encode())
-                            return
+                        content_path = config['_content_path']
                         
-                        # Rename file
-                        old_file.rename(new_file)
-                        click.echo(f"✅ File renamed: {old_file.name} → {new_file.name}")
-                        
-                        # Create redirect if requested
-                        redirect_info = None
-                        if create_redirect:
-                            old_url = f"/{category}/{old_slug}/"
-                            new_url = f"/{category}/{new_slug}/"
+                        with self._write_lock:
+                            # Check old file exists
+                            old_file = content_path / category / f"{old_slug}.md"
+                            if not old_file.exists():
+                                self._send_json({
+                                    'error': 'File not found',
+                                    'message': f'File {old_file} does not exist'
+                                }, status=404)
+                                return
+                            
+                            # Check new slug is unique
+                            new_file = content_path / category / f"{new_slug}.md"
+                            if new_file.exists():
+                                self._send_json({
+                                    'error': 'Slug already exists',
+                                    'message': f'A file with slug "{new_slug}" already exists'
+                                }, status=400)
+                                return
+                            
+                            # Rename file
+                            old_file.rename(new_file)
+                            click.echo(f"✅ File renamed: {old_file.name} → {new_file.name}")
+                            
+                            # Create redirect if requested
+                            redirect_info = None
+                            if create_redirect:
+                                old_url = f"/{category}/{old_slug}/"
+                                new_url = f"/{category}/{new_slug}/"
                             
-                            redirect_manager = RedirectManager(content_path, dist_path)
-                            result = redirect_manager.add_redirect(old_url, new_url, reason='slug_rename_cms')
-                            redirect_info = result.get('redirect')
-                            click.echo(f"✅ 301 redirect created: {old_url} → {new_url}")
+                                self._redirect_mgr.reload()
+                                result = self._redirect_mgr.add_redirect(old_url, new_url, reason='slug_rename_cms')
+                                redirect_info = result.get('redirect')
+                                click.echo(f"✅ 301 redirect created: {old_url} → {new_url}")
                         
                         # Return success response
-                        self.send_response(200)
-                        self.send_header('Content-type', 'application/json')
-                        self.send_header('Access-Control-Allow-Origin', '*')
-                        self.end_headers()
-                        self.wfile.write(json.dumps({
+                        self._send_json({
                             'success': True,
                             'old_path': str(old_file.relative_to(content_path)),
                             'new_path': str(new_file.relative_to(content_path)),
                             'redirect': redirect_info
-                        }).encode())
+                        })
                         
                     except Exception as e:
-                        import traceback
                         click.echo(f"❌ Error renaming slug: {e}")
                         click.echo(traceback.format_exc())
-                        self.send_response(500)
-                        self.send_header('Content-type', 'application/json')
-                        self.send_header('Access-Control-Allow-Origin', '*')
-                        self.end_headers()
-                        self.wfile.write(json.dumps({
+                        self._send_json({
                             'error': 'Internal server error',
                             'message': str(e)
-                        }).encode())
+                        }, status=500)
                 
                 elif self.path == '/api/redirects':
                     # Get all redirects
                     try:
-                        sys.path.insert(0, str(Path(__file__).parent))
-                        from core.redirects import RedirectManager
-                        
-                        content_path = Path(config['build']['content'])
-                        dist_path = Path(config['build']['output'])
+                        with self._write_lock:
+                            self._redirect_mgr.reload()
+                            redirects_list = self._redirect_mgr.list_all_redirects()
                         
-                        manager = RedirectManager(content_path, dist_path)
-                        redirects_list = manager.list_all_redirects()
-                        
-                        self.send_response(200)
-                        self.send_header('Content-type', 'application/json')
-                        self.send_header('Access-Control-Allow-Origin', '*')
-                        self.end_headers()
-                        self.wfile.write(json.dumps(redirects_list).encode())
+                        self._send_json(redirects_list)
                         
                     except Exception as e:
-                        import traceback
                         click.echo(f"❌ Error listing redirects: {e}")
                         click.echo(traceback.format_exc())
                         self.send_error(500)
@@ -4052,27 +4022,18 @@ def studio(ctx, port, host):
                 elif self.path == '/api/products/sync':
                     # Sync products from Shopify/Stripe/Gumroad
                     try:
-                        sys.path.insert(0, str(Path(__file__).parent))
-                        from core.products import ProductAggregator
-                        
                         click.echo("🛒 Syncing products via API...")
-                        aggregator = ProductAggregator(config)
-                        products = aggregator.get_normalized_products(status_filter='all')
+                        products = self._product_agg.get_normalized_products(status_filter='all')
                         
-                        self.send_response(200)
-                        self.send_header('Content-type', 'application/json')
-                        self.send_header('Access-Control-Allow-Origin', '*')
-                        self.end_headers()
-                        self.wfile.write(json.dumps({
+                        self._send_json({
                             'success': True,
                             'total': len(products),
                             'products': products
-                        }).encode())
+                        })
                         
                         click.echo(f"✅ Synced {len(products)} products")
                         
                     except Exception as e:
-                        import traceback
                         click.echo(f"❌ Error syncing products: {e}")
                         click.echo(traceback.format_exc())
                         self.send_error(500)
@@ -4086,7 +4047,7 @@ def studio(ctx, port, host):
                     try:
                         # Get file path and content
                         file_path = self.path.replace('/api/content/', '')
-                        content_base = Path(config['build']['content']).resolve()
+                        content_base = config['_content_path'].resolve()
                         content_path = content_base / file_path
                         
                         # Read request body
@@ -4098,27 +4059,18 @@ def studio(ctx, port, host):
                         content_path.write_text(content)
                         click.echo(f"✅ Saved file: {content_path}")
                         
-                        self.send_response(200)
-                        self.send_header('Content-type', 'application/json')
-                        self.send_header('Access-Control-Allow-Origin', '*')
-                        self.end_headers()
-                        self.wfile.write(json.dumps({
+                        self._send_json({
                             'success': True,
                             'path': str(content_path.relative_to(content_base))
-                        }).encode())
+                        })
                         
                     except Exception as e:
-                        import traceback
                         click.echo(f"❌ Error saving file: {e}")
                         click.echo(traceback.format_exc())
-                        self.send_response(500)
-                        self.send_header('Content-type', 'application/json')
-                        self.send_header('Access-Control-Allow-Origin', '*')
-                        self.end_headers()
-                        self.wfile.write(json.dumps({
+                        self._send_json({
                             'error': 'Failed to save',
                             'message': str(e)
-                        }).encode())
+                        }, status=500)
                 else:
                     self.send_error(404)
             
@@ -4129,35 +4081,20 @@ def studio(ctx, port, host):
                         # Get redirect path
                         from_path = self.path.replace('/api/redirects', '')
                         
-                        sys.path.insert(0, str(Path(__file__).parent))
-                        from core.redirects import RedirectManager
-                        
-                        content_path = Path(config['build']['content'])
-                        dist_path = Path(config['build']['output'])
-                        
-                        manager = RedirectManager(content_path, dist_path)
-                        
-                        if manager.remove_redirect(from_path):
-                            click.echo(f"✅ Redirect removed: {from_path}")
-                            self.send_response(200)
-                            self.send_header('Content-type', 'application/json')
-                            self.send_header('Access-Control-Allow-Origin', '*')
-                            self.end_headers()
-                            self.wfile.write(json.dumps({
-                                'success': True,
-                                'message': 'Redirect removed'
-                            }).encode())
-                        else:
-                            self.send_response(404)
-                            self.send_header('Content-type', 'application/json')
-                            self.send_header('Access-Control-Allow-Origin', '*')
-                            self.end_headers()
-                            self.wfile.write(json.dumps({
-                                'error': 'Redirect not found'
-                            }).encode())
+                        with self._write_lock:
+                            self._redirect_mgr.reload()
+                            if self._redirect_mgr.remove_redirect(from_path):
+                                click.echo(f"✅ Redirect removed: {from_path}")
+                                self._send_json({
+                                    'success': True,
+                                    'message': 'Redirect removed'
+                                })
+                            else:
+                                self._send_json({
+                                    'error': 'Redirect not found'
+                                }, status=404)
                             
                     except Exception as e:
-                        import traceback
                         click.echo(f"❌ Error deleting redirect: {e}")
                         click.echo(traceback.format_exc())
                         self.send_error(500)
@@ -4169,7 +4106,9 @@ def studio(ctx, port, host):
         if not studio_html_path.exists():
             create_studio_html(studio_html_path)
         
-        server = HTTPServer((host, port), StudioHandler)
+        # Threaded so a slow request (content walk, product sync) doesn't
+        # hold up the editor's other calls; worker threads are daemonic
+        server = ThreadingHTTPServer((host, port), StudioHandler)
         
         click.echo(f"✅ Studio running at http://{host}:{port}")
         click.echo("📝 Open this URL in your browser")
@@ -4195,7 +4134,6 @@ def serve(ctx, port, host):
     click.echo("🚀 Starting dev server with live reload...")
     
     import signal
-    import sys
     
     # Global variables for cleanup
     server = None
@@ -4208,12 +4146,12 @@ def serve(ctx, port, host):
             if observer:
                 observer.stop()
                 observer.join(timeout=1)
-        except:
+        except Exception:
             pass
         try:
             if server:
                 server.shutdown()
-        except:
+        except Exception:
             pass
         sys.exit(0)
     
@@ -4226,13 +4164,12 @@ def serve(ctx, port, host):
         from watchdog.observers import Observer
         from watchdog.events import FileSystemEventHandler
         from http.server import SimpleHTTPRequestHandler, ThreadingHTTPServer
-        import os
         
         config = ctx.obj
-        content_path = Path(config['build']['content']).resolve()
+        content_path = config['_content_path'].resolve()
         templates_path = Path(config['build'].get('templates', './templates')).resolve()
         public_path = Path(config['build']['public']).resolve()
-        dist_path = Path(config['build']['output']).resolve()
+        dist_path = config['_dist_path'].resolve()
         
         # Track clients for live reload
         reload_clients = []
@@ -4303,15 +4240,33 @@ def serve(ctx, port, host):
 })();
 </script>
 '''
+        live_reload_bytes = live_reload_script.encode('utf-8')
+        
+        def finalize(html: str) -> bytes:
+            """Encode a page once, injecting the live reload script and filling
+            __PAGE_SIZE__ in one scan
+            
+            The script goes before every </body>, or at the end when there is
+            none, and the reported size includes it.
+            """
+            buf = html.encode('utf-8')
+            parts = _LIVE_PAGE_MARKERS_RE.split(buf)
+            markers = parts[1::2]
+            bodies = markers.count(b'</body>')
+            size = format_bytes(len(buf) + len(live_reload_bytes) * max(bodies, 1)).encode('utf-8')
+            parts[1::2] = [live_reload_bytes + m if m == b'</body>' else size for m in markers]
+            if not bodies:
+                parts.append(live_reload_bytes)
+            return b''.join(parts)
         
         def rebuild_site(ctx):
             """Rebuild the site"""
             click.echo("🔨 Rebuilding site...")
             try:
                 # Import here to use fresh code
+                import markdown
                 from core.templates import TemplateEngine
                 from core.generators import OutputGenerators
-                from core.optimizer import AIOptimizer
                 
                 # Clear dist
                 if dist_path.exists():
@@ -4321,7 +4276,6 @@ def serve(ctx, port, host):
                 # Initialize systems
                 template_engine = TemplateEngine(templates_path)
                 generators = OutputGenerators(config)
-                optimizer = AIOptimizer(config)
                 
                 # Copy public assets
                 if public_path.exists():
@@ -4331,8 +4285,17 @@ def serve(ctx, port, host):
                 all_pages = []
                 all_posts = []
                 all_projects = []
+                build_time = datetime.now()
+                
+                # Check if editor mode is enabled (for in-place editing)
+                user_authenticated = os.environ.get('EDITOR_MODE', '').lower() == 'true'
+                
+                # Markdown instances aren't thread-safe, so each worker thread
+                # keeps its own converter and resets it between files
+                md_local = threading.local()
                 
-                for md_file in content_path.rglob('*.md'):
+                def build_page(md_file):
+                    """Read, convert and render one file; writing is left to the caller"""
                     content_type = md_file.parent.name
                     
                     # Parse markdown with frontmatter
@@ -4346,8 +4309,10 @@ def serve(ctx, port, host):
                         body = content
                     
                     # Convert markdown to HTML
-                    md_converter = markdown.Markdown(extensions=['extra', 'meta'])
-                    content_html = md_converter.convert(body)
+                    md_converter = getattr(md_local, 'converter', None)
+                    if md_converter is None:
+                        md_converter = md_local.converter = markdown.Markdown(extensions=['extra', 'meta'])
+                    content_html = md_converter.reset().convert(body)
                     
                     # Process external links to open in new tabs
                     content_html = process_external_links(content_html)
@@ -4367,18 +4332,13 @@ def serve(ctx, port, host):
                         url = f"/{content_type}/{slug}/"
                         template_name = 'page.html'
                     
-                    build_time = datetime.now()
-                    
-                    # Check if editor mode is enabled (for in-place editing)
-                    user_authenticated = os.environ.get('EDITOR_MODE', '').lower() == 'true'
-                    
                     context = {
                         'site_title': config['site']['title'],
                         'lang': config['site']['language'],
-                        'title': frontmatter.get('title', slug.replace('-', ' ').title()),
+                        'title': _display_title(frontmatter, slug),
                         'description': frontmatter.get('summary', config['site']['description']),
                         'content': content_html,
-                        'year': datetime.now().year,
+                        'year': build_time.year,
                         'navigation': config.get('nav', {}).get('main', []),
                         'date': frontmatter.get('date'),
                         'date_formatted': str(frontmatter.get('date', '')),
@@ -4398,23 +4358,10 @@ def serve(ctx, port, host):
                     try:
                         html = template_engine.render(template_name, context)
                     except Exception as e:
-                        html = process_markdown_fallback(md_file, content_type, config)
+                        html = process_markdown_fallback(md_file, content_type, config, build_time)
                     
-                    # Inject live reload script
-                    if '</body>' in html:
-                        html = html.replace('</body>', live_reload_script + '</body>')
-                    else:
-                        html += live_reload_script
-                    
-                    # Calculate and inject page size
-                    page_size_bytes = len(html.encode('utf-8'))
-                    page_size_str = format_bytes(page_size_bytes)
-                    html = html.replace('__PAGE_SIZE__', page_size_str)
-                    
-                    # Write output
-                    output_file = dist_path / content_type / slug / 'index.html'
-                    output_file.parent.mkdir(parents=True, exist_ok=True)
-                    output_file.write_text(html)
+                    # Inject live reload script and page size
+                    html = finalize(html)
                     
                     # Collect metadata
                     page_data = {
@@ -4427,6 +4374,19 @@ def serve(ctx, port, host):
                         'tags': context['tags'],
                     }
                     
+                    return content_type, slug, html, page_data
+                
+                # Pages are independent, so they are built on a thread pool;
+                # results come back in file order and are written here
+                with ThreadPoolExecutor() as executor:
+                    built = list(executor.map(build_page, content_path.rglob('*.md')))
+                
+                for content_type, slug, html, page_data in built:
+                    # Write output
+                    output_file = dist_path / content_type / slug / 'index.html'
+                    output_file.parent.mkdir(parents=True, exist_ok=True)
+                    _write(output_file, html)
+                    
                     if content_type == 'posts':
                         all_posts.append(page_data)
                     elif content_type == 'projects':
@@ -4435,37 +4395,17 @@ def serve(ctx, port, host):
                         all_pages.append(page_data)
                 
                 # Create index page
-                index_html = create_index_simple(config, sorted(all_posts, key=lambda x: x.get('date', ''), reverse=True)[:5], templates_path)
-                # Inject live reload script
-                if '</body>' in index_html:
-                    index_html = index_html.replace('</body>', live_reload_script + '</body>')
-                else:
-                    index_html += live_reload_script
-                # Recalculate page size after injecting live reload
-                page_size_bytes = len(index_html.encode('utf-8'))
-                index_html = index_html.replace('__PAGE_SIZE__', format_bytes(page_size_bytes))
-                (dist_path / 'index.html').write_text(index_html)
+                index_html = create_index_simple(config, sorted(all_posts, key=lambda x: x.get('date', ''), reverse=True)[:5], templates_path, build_time)
+                _write(dist_path / 'index.html', finalize(index_html))
                 
                 # Create list pages
                 if all_posts:
-                    posts_html = create_list_page_simple(config, sorted(all_posts, key=lambda x: x.get('date', ''), reverse=True), 'Posts', templates_path)
-                    # Inject live reload script
-                    if '</body>' in posts_html:
-                        posts_html = posts_html.replace('</body>', live_reload_script + '</body>')
-                    # Recalculate page size after injecting live reload
-                    page_size_bytes = len(posts_html.encode('utf-8'))
-                    posts_html = posts_html.replace('__PAGE_SIZE__', format_bytes(page_size_bytes))
-                    (dist_path / 'posts' / 'index.html').write_text(posts_html)
+                    posts_html = create_list_page_simple(config, sorted(all_posts, key=lambda x: x.get('date', ''), reverse=True), 'Posts', templates_path, build_time)
+                    _write(dist_path / 'posts' / 'index.html', finalize(posts_html))
                 
                 if all_projects:
-                    projects_html = create_list_page_simple(config, all_projects, 'Projects', templates_path)
-                    # Inject live reload script
-                    if '</body>' in projects_html:
-                        projects_html = projects_html.replace('</body>', live_reload_script + '</body>')
-                    # Recalculate page size after injecting live reload
-                    page_size_bytes = len(projects_html.encode('utf-8'))
-                    projects_html = projects_html.replace('__PAGE_SIZE__', format_bytes(page_size_bytes))
-                    (dist_path / 'projects' / 'index.html').write_text(projects_html)
+                    projects_html = create_list_page_simple(config, all_projects, 'Projects', templates_path, build_time)
+                    _write(dist_path / 'projects' / 'index.html', finalize(projects_html))
                 
                 # Generate outputs
                 all_pages.append({'url': '/', 'title': config['site']['title'], 'type': 'home'})
@@ -4478,16 +4418,13 @@ def serve(ctx, port, host):
                 
                 # Generate product pages (only active products)
                 try:
-                    from core.products import ProductAggregator
-                    from jinja2 import Environment, FileSystemLoader
-                    
                     aggregator = ProductAggregator(config)
                     products = aggregator.get_normalized_products(status_filter='active')
                     
                     if products:
-                        # Setup Jinja2
-                        template_dir = Path(__file__).parent.parent.parent / 'templates'
-                        jinja_env = Environment(loader=FileSystemLoader(str(template_dir)))
+                        # Shared across rebuilds; only templates edited since the
+                        # last rebuild are recompiled
+                        jinja_env = _jinja_env(_BUNDLED_TEMPLATES_DIR, precompiled=False, auto_reload=True)
                         
                         products_path = dist_path / 'products'
                         products_path.mkdir(parents=True, exist_ok=True)
@@ -4499,15 +4436,12 @@ def serve(ctx, port, host):
                             site_title=config['site']['title'],
                             lang=config['site'].get('language', 'en'),
                             canonical_url=f"{config['site']['url']}/products/",
-                            year=datetime.now().year,
+                            year=build_time.year,
                             navigation=config.get('nav', {}).get('main', []),
-                            build_time=datetime.now().strftime('%Y-%m-%d %H:%M'),
-                            build_time_iso=datetime.now().isoformat()
+                            build_time=build_time.strftime('%Y-%m-%d %H:%M'),
+                            build_time_iso=build_time.isoformat()
                         )
-                        # Inject live reload
-                        if '</body>' in plp_html:
-                            plp_html = plp_html.replace('</body>', live_reload_script + '</body>')
-                        (products_path / 'index.html').write_text(plp_html)
+                        _write(products_path / 'index.html', finalize(plp_html))
                         
                         # Generate PDPs
                         pdp_template = jinja_env.get_template('product.html')
@@ -4521,8 +4455,7 @@ def serve(ctx, port, host):
                             
                             # Handle images FIRST
                             raw_images = product.get('image', [])
-                            type_name = type(raw_images).__name__
-                            if type_name in ('list', 'tuple'):
+                            if isinstance(raw_images, (list, tuple)):
                                 images = [str(img) for img in raw_images if img]
                             elif raw_images:
                                 images = [str(raw_images)]
@@ -4533,7 +4466,7 @@ def serve(ctx, port, host):
                             offers = product.get('offers', {})
                             variants_list = []
                             
-                            if type(offers).__name__ == 'list':
+                            if isinstance(offers, list):
                                 colors = set()
                                 sizes = set()
                                 color_to_image = {}
@@ -4579,8 +4512,8 @@ def serve(ctx, port, host):
                                     })
                                 
                                 first_offer = offers[0]
-                                colors_list = [c for c in sorted(colors)]
-                                sizes_list = [s for s in sorted(sizes)]
+                                colors_list = sorted(colors)
+                                sizes_list = sorted(sizes)
                             else:
                                 first_offer = offers
                                 colors_list = []
@@ -4611,36 +4544,30 @@ def serve(ctx, port, host):
                                 'category': product.get('category', ''),
                                 'availability': first_offer.get('availability', 'InStock'),
                                 'jsonld': product,
-                                'year': datetime.now().year,
+                                'year': build_time.year,
                                 'navigation': config.get('nav', {}).get('main', []),
-                                'build_time': datetime.now().strftime('%Y-%m-%d %H:%M'),
-                                'build_time_iso': datetime.now().isoformat()
+                                'build_time': build_time.strftime('%Y-%m-%d %H:%M'),
+                                'build_time_iso': build_time.isoformat()
                             }
                             
                             pdp_html = pdp_template.render(**pdp_context)
-                            # Inject live reload
-                            if '</body>' in pdp_html:
-                                pdp_html = pdp_html.replace('</body>', live_reload_script + '</body>')
-                            (pdp_dir / 'index.html').write_text(pdp_html)
+                            _write(pdp_dir / 'index.html', finalize(pdp_html))
                         
                         # Generate cart page
                         cart_dir = dist_path / 'cart'
                         cart_dir.mkdir(parents=True, exist_ok=True)
-                        build_time = datetime.now()
                         build_time_formatted = build_time.strftime('%B %d, %Y at %I:%M %p')
                         build_time_iso = build_time.isoformat()
                         cart_template = jinja_env.get_template('cart.html')
                         cart_html = cart_template.render(
-                            year=datetime.now().year,
+                            year=build_time.year,
                             site_title=config['site']['title'],
                             lighthouse_scores=True,
                             build_time=build_time_formatted,
                             build_time_iso=build_time_iso,
                             description=config['site']['description']
                         )
-                        if '</body>' in cart_html:
-                            cart_html = cart_html.replace('</body>', live_reload_script + '</body>')
-                        (cart_dir / 'index.html').write_text(cart_html)
+                        _write(cart_dir / 'index.html', finalize(cart_html))
                         
                         # Generate HTML sitemap
                         sitemap_dir = dist_path / 'sitemap'
@@ -4653,12 +4580,10 @@ def serve(ctx, port, host):
                             posts=all_posts,
                             projects=all_projects,
                             products=products,
-                            year=datetime.now().year,
-                            build_time_iso=datetime.now().isoformat()
+                            year=build_time.year,
+                            build_time_iso=build_time.isoformat()
                         )
-                        if '</body>' in sitemap_html:
-                            sitemap_html = sitemap_html.replace('</body>', live_reload_script + '</body>')
-                        (sitemap_dir / 'index.html').write_text(sitemap_html)
+                        _write(sitemap_dir / 'index.html', finalize(sitemap_html))
                 except Exception as e:
                     click.echo(f"⚠️  Could not generate product pages: {e}")
                 
@@ -4707,7 +4632,7 @@ def serve(ctx, port, host):
                             # Block until client disconnects or we send reload
                             while True:
                                 time.sleep(60)
-                        except:
+                        except Exception:
                             pass
                         finally:
                             if self in reload_clients:
@@ -4723,7 +4648,7 @@ def serve(ctx, port, host):
                     traceback.print_exc()
                     try:
                         self.send_error(500)
-                    except:
+                    except OSError:
                         pass
         
         # Initial build
@@ -3,13 +3,68 @@ GANG Content Quality Analyzer
 Analyze content for readability, SEO, accessibility, and structure.
 """
 
+import mmap
 import re
+from functools import lru_cache
 from pathlib import Path
-from typing import Dict, List, Tuple, Any
+from typing import Dict, List, Tuple, Any, Optional
 import yaml
 import markdown
 
 
+# Readability patterns, compiled once and shared by every analyzed file
+_MARKUP_RE = re.compile(r'[#*`\[\]()]')
+_NEWLINES_RE = re.compile(r'\n+')
+_SENTENCE_SPLIT_RE = re.compile(r'[.!?]+')
+_WHITESPACE_RE = re.compile(r'\s+')
+_VOWEL_GROUP_RE = re.compile(r'[aeiouy]+')
+
+
+@lru_cache(maxsize=8192)
+def _syllables(word: str) -> int:
+    """Estimate syllables as the number of vowel groups (memoized per word)"""
+    word = word.lower()
+    syllables = len(_VOWEL_GROUP_RE.findall(word))
+    
+    # Adjust for silent 'e'
+    if word.endswith('e'):
+        syllables -= 1
+    
+    # Ensure at least one syllable
+    return max(1, syllables)
+
+
+def _decode(raw: bytes) -> str:
+    """Decode UTF-8 bytes with the same newline translation as read_text()"""
+    text = raw.decode('utf-8')
+    if '\r' in text:
+        text = text.replace('\r\n', '\n').replace('\r', '\n')
+    return text
+
+
+def read_markdown(file_path: Path) -> Tuple[Optional[str], str]:
+    """
+    Split a markdown file into (frontmatter_text, body) via a read-only mmap.
+    Only the two slices are decoded, so the full text is never copied into a
+    str and split again. frontmatter_text is None when the file has none.
+    """
+    with open(file_path, 'rb') as f:
+        try:
+            mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        except ValueError:
+            # Empty files cannot be mapped
+            return None, ''
+    
+    with mm:
+        if mm[:3] != b'---':
+            return None, _decode(mm[:])
+        
+        end = mm.find(b'---', 3)
+        if end == -1:
+            return _decode(mm[3:]), ''
+        return _decode(mm[3:end]), _decode(mm[end + 3:])
+
+
 class ContentAnalyzer:
     """Analyze markdown content for quality metrics"""
     
@@ -24,16 +79,9 @@ class ContentAnalyzer:
     
     def analyze_file(self, file_path: Path) -> Dict[str, Any]:
         """Analyze a markdown file and return quality metrics"""
-        content = file_path.read_text()
-        
         # Parse frontmatter and body
-        if content.startswith('---'):
-            parts = content.split('---', 2)
-            frontmatter = yaml.safe_load(parts[1]) if len(parts) > 1 else {}
-            body = parts[2] if len(parts) > 2 else ''
-        else:
-            frontmatter = {}
-            body = content
+        frontmatter_text, body = read_markdown(file_path)
+        frontmatter = yaml.safe_load(frontmatter_text) if frontmatter_text is not None else {}
         
         # Convert to HTML for structure analysis
         md = markdown.Markdown(extensions=['extra', 'meta'])
@@ -62,14 +110,13 @@ class ContentAnalyzer:
     def _analyze_readability(self, text: str) -> Dict[str, Any]:
         """Calculate readability metrics"""
         # Clean text
-        clean_text = re.sub(r'[#*`\[\]()]', '', text)
-        clean_text = re.sub(r'\n+', ' ', clean_text)
+        clean_text = _MARKUP_RE.sub('', text)
+        clean_text = _NEWLINES_RE.sub(' ', clean_text)
         
         # Count sentences, words, syllables
-        sentences = [s.strip() for s in re.split(r'[.!?]+', clean_text) if s.strip()]
-        words = [w for w in re.split(r'\s+', clean_text) if w.strip()]
+        sentence_count = sum(1 for s in _SENTENCE_SPLIT_RE.split(clean_text) if s.strip())
+        words = [w for w in _WHITESPACE_RE.split(clean_text) if w]
         
-        sentence_count = len(sentences)
         word_count = len(words)
         
         if sentence_count == 0 or word_count == 0:
@@ -83,7 +130,7 @@ class ContentAnalyzer:
             }
         
         # Estimate syllables (simple heuristic)
-        syllable_count = sum(self._count_syllables(word) for word in words)
+        syllable_count = sum(map(_syllables, words))
         
         # Flesch-Kincaid Grade Level
         # Formula: 0.39 * (words/sentences) + 11.8 * (syllables/words) - 15.59
@@ -121,23 +168,7 @@ class ContentAnalyzer:
     
     def _count_syllables(self, word: str) -> int:
         """Estimate syllable count (simple heuristic)"""
-        word = word.lower()
-        vowels = 'aeiouy'
-        syllables = 0
-        previous_was_vowel = False
-        
-        for char in word:
-            is_vowel = char in vowels
-            if is_vowel and not previous_was_vowel:
-                syllables += 1
-            previous_was_vowel = is_vowel
-        
-        # Adjust for silent 'e'
-        if word.endswith('e'):
-            syllables -= 1
-        
-        # Ensure at least one syllable
-        return max(1, syllables)
+        return _syllables(word)
     
     def _analyze_seo(self, frontmatter: Dict, body: str) -> Dict[str, Any]:
         """Analyze SEO factors"""
@@ -5,7 +5,8 @@ Build Cache - Speed up repeated builds by caching unchanged files
 from pathlib import Path
 import hashlib
 import json
-from typing import Dict, Optional
+import pickle
+from typing import Any, Dict, Iterable, Optional
 
 
 class BuildCache:
@@ -64,3 +65,130 @@ class BuildCache:
         if self.cache_file.exists():
             self.cache_file.unlink()
 
+
+
+class RenderCache:
+    """Per-file render results for incremental builds, keyed by source stat
+
+    Entries are pickled rather than stored as JSON because page metadata
+    carries the date objects YAML frontmatter parses to. The whole cache is
+    discarded when the fingerprint (config, templates, editor mode) changes.
+    """
+    
+    def __init__(self, cache_dir: Path, fingerprint: Any):
+        self.cache_dir = Path(cache_dir)
+        self.cache_file = self.cache_dir / 'render_cache.pickle'
+        self.fingerprint = fingerprint
+        self.entries = self._load_cache()
+    
+    def _load_cache(self) -> Dict[str, Dict]:
+        """Load entries from disk, dropping them if the fingerprint moved"""
+        try:
+            with open(self.cache_file, 'rb') as f:
+                data = pickle.load(f)
+        except (OSError, EOFError, pickle.PickleError, AttributeError):
+            return {}
+        if data.get('fingerprint') != self.fingerprint:
+            return {}
+        return data.get('entries', {})
+    
+    def save_cache(self):
+        """Save entries to disk"""
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        with open(self.cache_file, 'wb') as f:
+            pickle.dump({'fingerprint': self.fingerprint, 'entries': self.entries}, f,
+                        protocol=pickle.HIGHEST_PROTOCOL)
+    
+    def lookup(self, file_path: Path) -> Optional[Dict]:
+        """Return the cached entry if the source and its outputs are unchanged
+        
+        Outputs include the spilled content_html file the feeds read back.
+        """
+        entry = self.entries.get(str(file_path))
+        if not entry:
+            return None
+        st = file_path.stat()
+        if entry['stat'] != (st.st_mtime_ns, st.st_size):
+            return None
+        if not Path(entry['output']).exists():
+            return None
+        spill = entry['page_data'].get('content_html_path')
+        if spill and not Path(spill).exists():
+            return None
+        return entry
+    
+    def output_digest(self, file_path: Path, output_file: Path) -> Optional[str]:
+        """Digest of the page last written to output_file for this source, if still there"""
+        entry = self.entries.get(str(file_path))
+        if not entry or entry['output'] != str(output_file) or not output_file.exists():
+            return None
+        return entry.get('digest')
+    
+    def store(self, file_path: Path, output_file: Path, page_data: Dict, digest: Optional[str] = None):
+        """Record a freshly rendered file and the digest of its page before minifying"""
+        st = file_path.stat()
+        self.entries[str(file_path)] = {
+            'stat': (st.st_mtime_ns, st.st_size),
+            'output': str(output_file),
+            'page_data': page_data,
+            'digest': digest,
+        }
+    
+    def prune(self, sources: Iterable[Path]) -> int:
+        """Delete outputs of sources that are gone (or no longer publishable)"""
+        keep = {str(p) for p in sources}
+        removed = 0
+        for key in [k for k in self.entries if k not in keep]:
+            output = Path(self.entries.pop(key)['output'])
+            if output.exists():
+                output.unlink()
+                removed += 1
+            try:
+                output.parent.rmdir()
+            except OSError:
+                pass
+        return removed
+
+
+class MinifyCache:
+    """Stats of dist files as the minifier left them, for incremental builds
+
+    A file whose size and mtime still match was minified by an earlier build
+    and not rewritten since, so it can be skipped. Files not seen in a build
+    are dropped from the cache when it is saved.
+    """
+    
+    def __init__(self, cache_dir: Path):
+        self.cache_dir = Path(cache_dir)
+        self.cache_file = self.cache_dir / 'minify_cache.json'
+        self.entries = self._load_cache()
+        self.seen: Dict[str, list] = {}
+    
+    def _load_cache(self) -> Dict[str, list]:
+        """Load cache from disk"""
+        try:
+            with open(self.cache_file) as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return {}
+    
+    def save_cache(self):
+        """Save the entries seen in this build to disk"""
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        with open(self.cache_file, 'w') as f:
+            json.dump(self.seen, f)
+    
+    def is_current(self, file_path: Path) -> bool:
+        """Check if file is still exactly as it was after being minified"""
+        key = str(file_path)
+        st = file_path.stat()
+        stat = [st.st_mtime_ns, st.st_size]
+        if self.entries.get(key) == stat:
+            self.seen[key] = stat
+            return True
+        return False
+    
+    def record(self, file_path: Path):
+        """Remember a freshly minified file"""
+        st = file_path.stat()
+        self.seen[str(file_path)] = [st.st_mtime_ns, st.st_size]
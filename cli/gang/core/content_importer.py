@@ -3,13 +3,16 @@ GANG Content Importer
 Import content from Google Docs, Notes, clipboard with automatic image extraction.
 """
 
+import os
 import re
 import base64
 import io
 from pathlib import Path
-from typing import Dict, List, Any, Tuple, Optional
+from typing import Dict, List, Any, Tuple, Optional, Set
 from datetime import datetime
 import hashlib
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
 from PIL import Image
 
 
@@ -21,6 +24,7 @@ class ContentImporter:
         self.r2_storage = r2_storage
         self.ai_client = ai_client
         self.content_path = Path(config['build']['content'])
+        self.slug_checker = SlugChecker(self.content_path)
     
     def import_from_text(self, text_content: str, title: Optional[str] = None) -> Dict[str, Any]:
         """Import content from plain text or HTML (Google Docs paste)"""
@@ -127,19 +131,29 @@ class ContentImporter:
         self, 
         images: List[Dict[str, Any]], 
         slug: str,
-        compress: bool = True
+        compress: bool = True,
+        max_workers: int = 8
     ) -> List[Dict[str, Any]]:
         """Process images (compress, optimize) and upload to R2"""
         
         if not self.r2_storage or not self.r2_storage.is_configured():
             return images  # Return as-is if R2 not configured
         
+        # Uploads are network-bound (and Pillow releases the GIL while
+        # resizing/encoding), so run data URL images on a bounded pool
+        uploads = {}
+        data_url_count = sum(1 for image in images if image['type'] == 'data_url')
+        if data_url_count:
+            with ThreadPoolExecutor(max_workers=min(max_workers, data_url_count)) as executor:
+                for i, image in enumerate(images):
+                    if image['type'] == 'data_url':
+                        uploads[i] = executor.submit(self._process_data_url_image, image, slug, i, compress)
+        
         processed_images = []
         
         for i, image in enumerate(images):
             if image['type'] == 'data_url':
-                # Decode base64 image
-                processed = self._process_data_url_image(image, slug, i, compress)
+                processed = uploads[i].result()
                 if processed:
                     processed_images.append(processed)
             
@@ -261,13 +275,8 @@ class ContentImporter:
         
         # Check all content types
         for content_type in ['posts', 'pages', 'projects', 'people']:
-            type_path = self.content_path / content_type
-            if not type_path.exists():
-                continue
-            
-            for md_file in type_path.glob('*.md'):
-                if md_file.stem == slug:
-                    conflicts.append(f"{content_type}/{slug}.md")
+            if slug in self.slug_checker.slugs_in(content_type):
+                conflicts.append(f"{content_type}/{slug}.md")
         
         return conflicts
     
@@ -448,48 +457,68 @@ Respond with just the alt text, no quotes or formatting."""
 class SlugChecker:
     """Check slug uniqueness across the site"""
     
-    def __init__(self, content_path: Path):
+    def __init__(self, content_path: Path, files: Optional[List[Path]] = None):
         self.content_path = content_path
+        self._slugs: Dict[str, Set[str]] = {}
+        
+        # Seed the cache from an already collected file list (e.g. build's)
+        # so the category directories don't have to be scanned again
+        self._seeded = files is not None
+        if files is not None:
+            for file_path in files:
+                if file_path.parent.parent == content_path and file_path.name.endswith('.md'):
+                    self._slugs.setdefault(file_path.parent.name, set()).add(file_path.name[:-3])
+    
+    def slugs_in(self, category: str) -> Set[str]:
+        """Slugs of the markdown files in a category (scanned once, then cached)"""
+        slugs = self._slugs.get(category)
+        if slugs is None:
+            slugs = set()
+            if self._seeded:
+                self._slugs[category] = slugs
+                return slugs
+            try:
+                with os.scandir(self.content_path / category) as entries:
+                    for entry in entries:
+                        if entry.name.endswith('.md') and entry.is_file():
+                            slugs.add(entry.name[:-3])
+            except (FileNotFoundError, NotADirectoryError):
+                pass
+            self._slugs[category] = slugs
+        return slugs
     
     def check_all_slugs(self) -> Dict[str, Any]:
         """Check all slugs for uniqueness"""
-        slug_map = {}
-        duplicates = {}
+        slug_to_files: Dict[str, Set[str]] = defaultdict(set)
         
         # Scan all content types
         for content_type in ['posts', 'pages', 'projects', 'newsletters', 'people']:
-            type_path = self.content_path / content_type
-            if not type_path.exists():
-                continue
-            
-            for md_file in type_path.glob('*.md'):
-                slug = md_file.stem
-                
-                if slug not in slug_map:
-                    slug_map[slug] = []
-                
-                slug_map[slug].append(f"{content_type}/{slug}.md")
+            for slug in self.slugs_in(content_type):
+                slug_to_files[slug].add(f"{content_type}/{slug}.md")
         
         # Find duplicates
-        for slug, files in slug_map.items():
-            if len(files) > 1:
-                duplicates[slug] = files
+        duplicates = {
+            slug: sorted(files)
+            for slug, files in slug_to_files.items()
+            if len(files) > 1
+        }
         
         return {
-            'total_slugs': len(slug_map),
-            'unique_slugs': len([s for s in slug_map.values() if len(s) == 1]),
+            'total_slugs': len(slug_to_files),
+            'unique_slugs': len(slug_to_files) - len(duplicates),
             'duplicate_slugs': len(duplicates),
-            'duplicates': duplicates
+            'duplicates': duplicates,
+            'slug_to_files': dict(slug_to_files)
         }
     
     def suggest_unique_slug(self, base_slug: str, category: str) -> str:
         """Suggest a unique slug by appending numbers if needed"""
+        existing = self.slugs_in(category)
         slug = base_slug
         counter = 1
         
         while True:
-            file_path = self.content_path / category / f"{slug}.md"
-            if not file_path.exists():
+            if slug not in existing:
                 return slug
             
             slug = f"{base_slug}-{counter}"
@@ -4,8 +4,9 @@ Converts content to email-ready HTML and plain text
 """
 
 from pathlib import Path
-from typing import Dict, Any, Optional
+from typing import Dict, Any, List, Optional
 import re
+import json
 from datetime import datetime
 
 
@@ -551,7 +552,11 @@ class ESPIntegration:
         
         url = f"{self.config['api_url']}{self.config['draft_endpoint']}"
         
-        response = requests.post(url, json=payload, headers=headers)
+        # Encode the body ourselves: with ensure_ascii=False non-ASCII text is
+        # written as UTF-8 instead of being escaped to \uXXXX sequences
+        body = json.dumps(payload, ensure_ascii=False, allow_nan=False).encode('utf-8')
+        
+        response = requests.post(url, data=body, headers=headers)
         response.raise_for_status()
         
         return response.json()
@@ -621,44 +626,55 @@ class ESPIntegration:
 class DeliverabilityChecker:
     """Check email deliverability setup"""
     
-    @staticmethod
-    def check_dns_records(domain: str) -> Dict[str, Any]:
-        """Check SPF, DKIM, DMARC records"""
+    _resolver = None
+    
+    @classmethod
+    def _get_resolver(cls):
+        """Shared resolver whose cache keeps answers until their TTL expires"""
         import dns.resolver
         
+        if cls._resolver is None:
+            resolver = dns.resolver.Resolver()
+            resolver.cache = dns.resolver.Cache()
+            cls._resolver = resolver
+        return cls._resolver
+    
+    @classmethod
+    def check_dns_records(cls, domain: str) -> Dict[str, Any]:
+        """Check SPF, DKIM, DMARC records"""
+        import dns.exception
+        from concurrent.futures import ThreadPoolExecutor
+        
+        resolver = cls._get_resolver()
+        
+        def lookup(qname: str, rdtype: str) -> List[str]:
+            try:
+                return [str(r) for r in resolver.resolve(qname, rdtype)]
+            except dns.exception.DNSException:
+                return []
+        
+        # The three queries are independent, so they go out together
+        with ThreadPoolExecutor(max_workers=3) as executor:
+            txt_future = executor.submit(lookup, domain, 'TXT')
+            dmarc_future = executor.submit(lookup, f'_dmarc.{domain}', 'TXT')
+            mx_future = executor.submit(lookup, domain, 'MX')
+        
         results = {
             'domain': domain,
             'spf': None,
             'dmarc': None,
-            'mx': None
+            'mx': mx_future.result() or None
         }
         
-        try:
-            # Check SPF
-            txt_records = dns.resolver.resolve(domain, 'TXT')
-            for record in txt_records:
-                txt = str(record)
-                if 'v=spf1' in txt:
-                    results['spf'] = txt
-        except:
-            pass
-        
-        try:
-            # Check DMARC
-            dmarc_records = dns.resolver.resolve(f'_dmarc.{domain}', 'TXT')
-            for record in dmarc_records:
-                txt = str(record)
-                if 'v=DMARC1' in txt:
-                    results['dmarc'] = txt
-        except:
-            pass
-        
-        try:
-            # Check MX records
-            mx_records = dns.resolver.resolve(domain, 'MX')
-            results['mx'] = [str(r) for r in mx_records]
-        except:
-            pass
+        # Check SPF
+        for txt in txt_future.result():
+            if 'v=spf1' in txt:
+                results['spf'] = txt
+        
+        # Check DMARC
+        for txt in dmarc_future.result():
+            if 'v=DMARC1' in txt:
+                results['dmarc'] = txt
         
         return results
     
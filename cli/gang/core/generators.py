@@ -77,11 +77,16 @@ Sitemap: {self.site_url}/sitemap.xml
             if date_val and not isinstance(date_val, str):
                 date_val = str(date_val)
             
+            # build keeps rendered bodies on disk rather than in memory
+            content_html = post.get('content_html')
+            if content_html is None and post.get('content_html_path'):
+                content_html = Path(post['content_html_path']).read_text()
+            
             item = {
                 "id": f"{self.site_url}{post['url']}",
                 "url": f"{self.site_url}{post['url']}",
                 "title": post.get('title', ''),
-                "content_html": post.get('content_html', ''),
+                "content_html": content_html or '',
                 "summary": post.get('summary', ''),
                 "date_published": date_val,
             }
@@ -5,7 +5,6 @@ Advanced image processing with focal points, art-directed crops, and ThumbHash
 
 from pathlib import Path
 from typing import Dict, List, Tuple, Optional, Any
-import subprocess
 import json
 import base64
 
@@ -49,10 +48,8 @@ class ImagePipeline:
         }
         
         # Generate crops for each breakpoint
-        for breakpoint, width in self.breakpoints.items():
-            crop_path = self._generate_crop(image_path, width, focal_point)
-            if crop_path:
-                result['crops'][breakpoint] = str(crop_path)
+        for breakpoint, crop_path in self._generate_crops(image_path, focal_point).items():
+            result['crops'][breakpoint] = str(crop_path)
         
         # Generate formats (AVIF, WebP, JPG)
         formats = self._generate_formats(image_path)
@@ -69,40 +66,44 @@ class ImagePipeline:
         
         return result
     
-    def _generate_crop(self, image_path: Path, width: int, focal_point: Tuple[float, float]) -> Optional[Path]:
-        """Generate art-directed crop at focal point"""
+    def _generate_crops(self, image_path: Path, focal_point: Tuple[float, float]) -> Dict[str, Path]:
+        """Generate art-directed crops for every breakpoint from one decode"""
         
-        # Check if ImageMagick is available
         try:
-            subprocess.run(['convert', '-version'], capture_output=True, check=True)
-        except (subprocess.CalledProcessError, FileNotFoundError):
-            # ImageMagick not available, skip cropping
-            return None
+            from PIL import Image
+        except ImportError:
+            # Pillow not available, skip cropping
+            return {}
         
         output_dir = self.dist_path / 'assets' / 'images' / 'crops'
         output_dir.mkdir(parents=True, exist_ok=True)
         
         stem = image_path.stem
-        output_path = output_dir / f"{stem}-{width}w.jpg"
         
         # Calculate crop dimensions
         fx, fy = focal_point
         
-        # Use ImageMagick to crop with focal point
-        # This is a simplified version - real implementation would be more sophisticated
-        cmd = [
-            'convert',
-            str(image_path),
-            '-resize', f"{width}x",
-            '-quality', '85',
-            str(output_path)
-        ]
-        
+        # Decode the source once and resize it per breakpoint
+        # This is a simplified version - real implementation would crop around the focal point
+        crops = {}
         try:
-            subprocess.run(cmd, capture_output=True, check=True)
-            return output_path
-        except subprocess.CalledProcessError:
-            return None
+            with Image.open(image_path) as img:
+                img.load()
+                if img.mode not in ('RGB', 'L'):
+                    img = img.convert('RGB')
+                src_width, src_height = img.size
+                
+                for breakpoint, width in self.breakpoints.items():
+                    height = max(1, round(src_height * width / src_width))
+                    output_path = output_dir / f"{stem}-{width}w.jpg"
+                    img.resize((width, height), Image.Resampling.LANCZOS).save(
+                        output_path, 'JPEG', quality=85
+                    )
+                    crops[breakpoint] = output_path
+        except OSError:
+            return crops
+        
+        return crops
     
     def _generate_formats(self, image_path: Path) -> Dict[str, str]:
         """Generate AVIF and WebP versions"""
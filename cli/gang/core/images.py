@@ -3,10 +3,13 @@ GANG Image Processor
 Generate responsive images in multiple formats (AVIF, WebP)
 """
 
+from concurrent.futures import ProcessPoolExecutor
+from itertools import repeat
 from pathlib import Path
 from typing import Dict, List, Any, Tuple
 from PIL import Image
 import hashlib
+import multiprocessing
 
 class ImageProcessor:
     def __init__(self, config: Dict[str, Any]):
@@ -130,8 +133,18 @@ class ImageProcessor:
         
         return '\n'.join(html)
     
-    def process_all_images(self, source_dir: Path, output_dir: Path) -> Dict[str, List[Dict]]:
-        """Process all images in a directory"""
+    def _process_group(self, image_paths: List[Path], output_dir: Path) -> List[List[Dict[str, Any]]]:
+        """Process images that share output filenames, in order, in one worker"""
+        return [self.generate_responsive_images(image_path, output_dir) for image_path in image_paths]
+    
+    def process_all_images(self, source_dir: Path, output_dir: Path, jobs: int = 1) -> Dict[str, List[Dict]]:
+        """Process all images in a directory
+        
+        Decoding and encoding are CPU-bound and independent per image, so with
+        jobs > 1 images are spread over worker processes. Variants are named
+        by stem, so images sharing a stem stay together in one task and are
+        written in the same order as a sequential run.
+        """
         output_dir.mkdir(parents=True, exist_ok=True)
         
         image_map = {}
@@ -145,19 +158,46 @@ class ImageProcessor:
         }
         
         image_extensions = ['.jpg', '.jpeg', '.png', '.webp']
-        for ext in image_extensions:
-            for image_path in source_dir.rglob(f'*{ext}'):
-                original_size = image_path.stat().st_size
-                stats['total_images'] += 1
-                stats['original_size'] += original_size
-                
-                variants = self.generate_responsive_images(image_path, output_dir)
-                image_map[str(image_path.relative_to(source_dir))] = variants
-                
-                # Calculate optimized sizes
-                for variant in variants:
-                    stats['total_variants'] += 1
-                    stats['optimized_size'] += variant['size']
+        image_paths = [
+            image_path
+            for ext in image_extensions
+            for image_path in source_dir.rglob(f'*{ext}')
+        ]
+        groups = {}
+        for image_path in image_paths:
+            groups.setdefault(image_path.stem, []).append(image_path)
+        
+        jobs = max(1, min(jobs, len(groups)))
+        if jobs > 1:
+            # build calls this from a worker thread, and forking a process
+            # with other threads running can deadlock the children, so the
+            # workers come from a fork server (or are spawned) instead
+            start_method = 'forkserver' if 'forkserver' in multiprocessing.get_all_start_methods() else 'spawn'
+            with ProcessPoolExecutor(max_workers=jobs, mp_context=multiprocessing.get_context(start_method)) as executor:
+                group_variants = list(executor.map(
+                    self._process_group, groups.values(), repeat(output_dir), chunksize=4
+                ))
+        else:
+            group_variants = [self._process_group(paths, output_dir) for paths in groups.values()]
+        
+        variants_by_path = {
+            image_path: variants
+            for paths, variants_list in zip(groups.values(), group_variants)
+            for image_path, variants in zip(paths, variants_list)
+        }
+        
+        for image_path in image_paths:
+            original_size = image_path.stat().st_size
+            stats['total_images'] += 1
+            stats['original_size'] += original_size
+            
+            variants = variants_by_path[image_path]
+            image_map[str(image_path.relative_to(source_dir))] = variants
+            
+            # Calculate optimized sizes
+            for variant in variants:
+                stats['total_variants'] += 1
+                stats['optimized_size'] += variant['size']
         
         if stats['original_size'] > 0:
             stats['savings_bytes'] = stats['original_size'] - stats['optimized_size']
@@ -7,12 +7,16 @@ from pathlib import Path
 from typing import Dict, List, Any, Optional
 import os
 import json
+import time
 from datetime import datetime
 
 
 class KlaviyoClient:
     """Klaviyo API client for email campaigns and flows"""
     
+    # Retries for a request that keeps getting 429 Too Many Requests
+    MAX_RETRIES = 4
+    
     def __init__(self, api_key: str):
         self.api_key = api_key
         self.base_url = 'https://a.klaviyo.com/api'
@@ -21,6 +25,41 @@ class KlaviyoClient:
             'Content-Type': 'application/json',
             'revision': '2024-10-15'  # Latest API version
         }
+        self._session = None
+        
+        # Adaptive pacing: the gap between requests doubles on a 429 and
+        # halves after each success, so bursts slow down only when needed
+        self._min_interval = 0.0
+        self._last_request = 0.0
+    
+    def _request(self, method: str, url: str, **kwargs):
+        """Send a request on the shared session, pacing calls and retrying 429s"""
+        import requests
+        
+        if self._session is None:
+            self._session = requests.Session()
+            self._session.headers.update(self.headers)
+        
+        for attempt in range(self.MAX_RETRIES + 1):
+            wait = self._min_interval - (time.monotonic() - self._last_request)
+            if wait > 0:
+                time.sleep(wait)
+            self._last_request = time.monotonic()
+            
+            response = self._session.request(method, url, **kwargs)
+            if response.status_code != 429:
+                self._min_interval = self._min_interval / 2 if self._min_interval > 0.05 else 0.0
+                return response
+            
+            self._min_interval = min(max(self._min_interval * 2, 0.25), 10.0)
+            if attempt < self.MAX_RETRIES:
+                try:
+                    delay = float(response.headers.get('Retry-After', 1))
+                except ValueError:
+                    delay = 1.0
+                time.sleep(max(delay, self._min_interval))
+        
+        return response
     
     def create_campaign(
         self,
@@ -69,11 +108,7 @@ class KlaviyoClient:
         }
         
         try:
-            response = requests.post(
-                f'{self.base_url}/campaigns/',
-                headers=self.headers,
-                json=payload
-            )
+            response = self._request('POST', f'{self.base_url}/campaigns/', json=payload)
             
             if response.status_code != 201:
                 error_detail = response.json() if response.headers.get('content-type', '').startswith('application/json') else response.text
@@ -84,19 +119,21 @@ class KlaviyoClient:
                 try:
                     error_detail = e.response.json()
                     print(f"Klaviyo API Error Details: {json.dumps(error_detail, indent=2)}")
-                except:
+                except ValueError:
                     print(f"Klaviyo API Error: {e.response.text}")
             raise
         
         campaign = response.json()
         campaign_id = campaign['data']['id']
         
-        # Get the campaign message ID from the response
-        messages = campaign['data']['attributes'].get('campaign-messages', {}).get('data', [])
+        # The create response already names the campaign's message, so the
+        # content goes straight to it without listing the messages first
+        messages = (campaign['data'].get('relationships', {}).get('campaign-messages', {}).get('data')
+                    or campaign['data']['attributes'].get('campaign-messages', {}).get('data', []))
         if messages:
-            message_id = messages[0]['id']
-            # Update with HTML/text content
-            self._update_campaign_content(message_id, html_content, text_content)
+            self._patch_message_content(messages[0]['id'], html_content, text_content)
+        else:
+            self._update_campaign_content(campaign_id, html_content, text_content)
         
         return campaign
     
@@ -110,8 +147,6 @@ class KlaviyoClient:
         from_name: str
     ):
         """Create campaign message (email content)"""
-        import requests
-        
         payload = {
             'data': {
                 'type': 'campaign-message',
@@ -137,18 +172,14 @@ class KlaviyoClient:
             }
         }
         
-        response = requests.post(
-            f'{self.base_url}/campaign-messages/',
-            headers=self.headers,
-            json=payload
-        )
+        response = self._request('POST', f'{self.base_url}/campaign-messages/', json=payload)
         response.raise_for_status()
         
         message = response.json()
         message_id = message['data']['id']
         
         # Update with HTML/text content
-        self._update_campaign_content(message_id, html_content, text_content)
+        self._patch_message_content(message_id, html_content, text_content)
         
         return message
     
@@ -159,22 +190,23 @@ class KlaviyoClient:
         text_content: str
     ):
         """Update campaign HTML and text content"""
-        import requests
-        
         # Get campaign message ID
-        response = requests.get(
-            f'{self.base_url}/campaigns/{campaign_id}/campaign-messages/',
-            headers=self.headers
-        )
+        response = self._request('GET', f'{self.base_url}/campaigns/{campaign_id}/campaign-messages/')
         response.raise_for_status()
         
         messages = response.json()['data']
         if not messages:
             raise Exception("No campaign messages found")
         
-        message_id = messages[0]['id']
-        
-        # Update content
+        self._patch_message_content(messages[0]['id'], html_content, text_content)
+    
+    def _patch_message_content(
+        self,
+        message_id: str,
+        html_content: str,
+        text_content: str
+    ):
+        """Set the HTML and text content of a campaign message"""
         payload = {
             'data': {
                 'type': 'campaign-message',
@@ -188,11 +220,7 @@ class KlaviyoClient:
             }
         }
         
-        response = requests.patch(
-            f'{self.base_url}/campaign-messages/{message_id}/',
-            headers=self.headers,
-            json=payload
-        )
+        response = self._request('PATCH', f'{self.base_url}/campaign-messages/{message_id}/', json=payload)
         response.raise_for_status()
     
     def sync_shopify_data(self) -> Dict[str, Any]:
@@ -201,13 +229,8 @@ class KlaviyoClient:
         Note: Klaviyo's Shopify integration handles this automatically
         This is for manual sync if needed
         """
-        import requests
-        
         # Get Shopify integration status
-        response = requests.get(
-            f'{self.base_url}/integrations/',
-            headers=self.headers
-        )
+        response = self._request('GET', f'{self.base_url}/integrations/')
         response.raise_for_status()
         
         integrations = response.json()
@@ -238,8 +261,6 @@ class KlaviyoClient:
         - 'subscribed-to-list'
         - 'viewed-product'
         """
-        import requests
-        
         payload = {
             'data': {
                 'type': 'flow',
@@ -251,39 +272,42 @@ class KlaviyoClient:
             }
         }
         
-        response = requests.post(
-            f'{self.base_url}/flows/',
-            headers=self.headers,
-            json=payload
-        )
+        response = self._request('POST', f'{self.base_url}/flows/', json=payload)
         response.raise_for_status()
         
         return response.json()
     
-    def get_lists(self) -> List[Dict[str, Any]]:
-        """Get all email lists"""
-        import requests
+    def _get_all_pages(self, url: str, params: Optional[Dict[str, str]] = None) -> List[Dict[str, Any]]:
+        """GET a collection and follow its cursor links through every page
         
-        response = requests.get(
-            f'{self.base_url}/lists/',
-            headers=self.headers
-        )
-        response.raise_for_status()
+        Klaviyo cursors are opaque and only known once the previous page
+        arrives, so pages are fetched in sequence over one kept-alive
+        connection instead of in parallel.
+        """
+        data = []
+        while url:
+            response = self._request('GET', url, params=params)
+            response.raise_for_status()
+            
+            page = response.json()
+            data.extend(page['data'])
+            
+            # The next link already carries the filter and page cursor
+            url = (page.get('links') or {}).get('next')
+            params = None
         
-        return response.json()['data']
+        return data
+    
+    def get_lists(self) -> List[Dict[str, Any]]:
+        """Get all email lists"""
+        return self._get_all_pages(f'{self.base_url}/lists/')
     
     def get_campaigns(self, status: str = 'draft') -> List[Dict[str, Any]]:
         """Get campaigns by status (draft, scheduled, sent)"""
-        import requests
-        
-        response = requests.get(
+        return self._get_all_pages(
             f'{self.base_url}/campaigns/',
-            headers=self.headers,
             params={'filter': f'equals(status,"{status}")'}
         )
-        response.raise_for_status()
-        
-        return response.json()['data']
 
 
 class KlaviyoShopifySync:
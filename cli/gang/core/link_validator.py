@@ -27,9 +27,10 @@ class LinkValidator:
         # Track all internal pages
         self.internal_pages: Set[str] = set()
         
-    def scan_all_files(self) -> Dict[str, Any]:
-        """Scan all markdown files and validate links"""
-        md_files = list(self.content_path.rglob('*.md'))
+    def scan_all_files(self, md_files: Optional[List[Path]] = None) -> Dict[str, Any]:
+        """Scan all markdown files (or the given list) and validate links"""
+        if md_files is None:
+            md_files = list(self.content_path.rglob('*.md'))
         
         # Get git remotes to whitelist
         git_remotes = self.get_git_remotes()
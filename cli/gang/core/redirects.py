@@ -18,8 +18,15 @@ class RedirectManager:
         self.redirects_file = content_path.parent / '.redirects.json'
         self.redirects = self._load_redirects()
     
+    def _file_mtime(self) -> Optional[int]:
+        try:
+            return self.redirects_file.stat().st_mtime_ns
+        except FileNotFoundError:
+            return None
+    
     def _load_redirects(self) -> Dict[str, Any]:
         """Load existing redirects"""
+        self._loaded_mtime = self._file_mtime()
         if self.redirects_file.exists():
             try:
                 with open(self.redirects_file) as f:
@@ -33,6 +40,14 @@ class RedirectManager:
         """Save redirects to file"""
         with open(self.redirects_file, 'w') as f:
             json.dump(self.redirects, f, indent=2)
+        self._loaded_mtime = self._file_mtime()
+    
+    def reload(self) -> bool:
+        """Re-read the redirects file if something else changed it since it was last loaded or saved"""
+        if self._file_mtime() == self._loaded_mtime:
+            return False
+        self.redirects = self._load_redirects()
+        return True
     
     def add_redirect(
         self, 
@@ -3,18 +3,29 @@ GANG Template Engine
 Jinja2-based template rendering with custom filters
 """
 
-from jinja2 import Environment, FileSystemLoader, select_autoescape
+from jinja2 import Environment, FileSystemLoader, FileSystemBytecodeCache, TemplateNotFound, select_autoescape
 from pathlib import Path
-from typing import Dict, Any
+from typing import Dict, Any, Iterable, Optional
 from datetime import datetime
 
 class TemplateEngine:
-    def __init__(self, templates_dir: Path):
+    def __init__(self, templates_dir: Path, bytecode_cache_dir: Optional[Path] = None):
+        # Templates don't change during a build, so compiled templates are
+        # kept for the engine's lifetime without per-render mtime checks.
+        # A bytecode cache dir lets later runs skip compilation as well.
+        bytecode_cache = None
+        if bytecode_cache_dir is not None:
+            Path(bytecode_cache_dir).mkdir(parents=True, exist_ok=True)
+            bytecode_cache = FileSystemBytecodeCache(str(bytecode_cache_dir))
+        
         self.env = Environment(
             loader=FileSystemLoader(templates_dir),
             autoescape=select_autoescape(['html', 'xml']),
             trim_blocks=True,
-            lstrip_blocks=True
+            lstrip_blocks=True,
+            auto_reload=False,
+            cache_size=-1,
+            bytecode_cache=bytecode_cache
         )
         
         # Add custom filters
@@ -32,6 +43,14 @@ class TemplateEngine:
             return date_str.strftime(format)
         return str(date_str)
     
+    def preload(self, template_names: Iterable[str]):
+        """Compile templates ahead of the first render; missing ones are skipped"""
+        for name in template_names:
+            try:
+                self.env.get_template(name)
+            except TemplateNotFound:
+                pass
+    
     def render(self, template_name: str, context: Dict[str, Any]) -> str:
         """Render a template with context"""
         template = self.env.get_template(template_name)
@@ -4,10 +4,28 @@ Enforces Template Contracts: semantics, a11y, budgets, JSON-LD
 """
 
 from bs4 import BeautifulSoup
+from concurrent.futures import ProcessPoolExecutor
 import json
 import re
 from typing import List, Dict, Any
 from pathlib import Path
+import os
+
+
+def _html_files(root) -> List[Path]:
+    """*.html under root via os.scandir, in the order Path.rglob yields them"""
+    found = []
+    subdirs = []
+    with os.scandir(root) as entries:
+        for entry in entries:
+            if entry.name.endswith('.html') and entry.is_file():
+                found.append(Path(entry.path))
+            elif entry.is_dir() and not entry.is_symlink():
+                subdirs.append(entry.path)
+    for subdir in subdirs:
+        found.extend(_html_files(subdir))
+    return found
+
 
 class ContractValidator:
     def __init__(self, config: Dict[str, Any]):
@@ -223,14 +241,20 @@ class ContractValidator:
         
         return results
     
-    def validate_directory(self, dist_path: Path) -> Dict[str, Any]:
-        """Validate all HTML files in output directory"""
-        html_files = list(dist_path.rglob('*.html'))
-        results = []
-        
-        for html_file in html_files:
-            file_result = self.validate_file(html_file)
-            results.append(file_result)
+    def validate_directory(self, dist_path: Path, jobs: int = 1) -> Dict[str, Any]:
+        """Validate all HTML files in output directory
+        
+        Files are independent and parsing is CPU-bound, so with jobs > 1 they
+        are spread over worker processes; results keep the walk order.
+        """
+        html_files = _html_files(dist_path)
+        jobs = max(1, min(jobs, len(html_files)))
+        
+        if jobs > 1:
+            with ProcessPoolExecutor(max_workers=jobs) as executor:
+                results = list(executor.map(self.validate_file, html_files, chunksize=8))
+        else:
+            results = [self.validate_file(html_file) for html_file in html_files]
         
         # Overall summary
         total_files = len(results)
@@ -16,6 +16,7 @@ class ContentVersioning:
     def __init__(self, content_path: Path):
         self.content_path = content_path
         self.repo_root = self._find_git_root()
+        self._repo = None
     
     def _find_git_root(self) -> Optional[Path]:
         """Find the git repository root"""
@@ -26,6 +27,23 @@ class ContentVersioning:
             current = current.parent
         return None
     
+    def _repository(self):
+        """
+        Open the repository in-process with pygit2, once per instance.
+        Returns None when pygit2 is not installed, so callers fall back to git.
+        """
+        if self._repo is None:
+            self._repo = False
+            if self.repo_root:
+                try:
+                    import pygit2
+                    self._repo = pygit2.Repository(str(self.repo_root))
+                except ImportError:
+                    pass
+                except Exception as e:
+                    print(f"Warning: Could not open repository with pygit2: {e}")
+        return self._repo or None
+    
     def _run_git(self, args: List[str]) -> str:
         """Run a git command and return output"""
         if not self.repo_root:
@@ -102,6 +120,15 @@ class ContentVersioning:
         except:
             return None
         
+        repo = self._repository()
+        if repo:
+            # Blob lookup without spawning `git show`
+            try:
+                blob = repo.revparse_single(f'{commit}:{rel_path.as_posix()}')
+                return blob.data.decode('utf-8').strip()
+            except Exception:
+                return None
+        
         try:
             content = self._run_git([
                 'show',
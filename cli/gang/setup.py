@@ -17,6 +17,7 @@ setup(
         'requests>=2.31.0',
         'watchdog>=3.0.0',
         'boto3>=1.28.0',
+        'pyperclip>=1.8.0',
     ],
     entry_points={
         'console_scripts': [